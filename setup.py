@@ -32,6 +32,8 @@ with open("requirements.txt", "r") as f:
 
 tests_require = ["pytest"]
 
+extras_require = {"async": ["aiohttp"], "orjson": ["orjson"]}
+
 setup(
     name=about["__title__"],
     version=about["__version__"],
@@ -45,6 +47,7 @@ setup(
     packages=find_packages(exclude=["tests*"]),
     test_suite="tests",
     install_requires=requires,
+    extras_require=extras_require,
     setup_requires=["pytest-runner"],
     tests_require=tests_require,
     license="Apache License 2.0",
@@ -17,4 +17,5 @@
 from icon.exception import *
 from icon.wallet import *
 
+from .async_client import AsyncClient, create_async_client
 from .client import Client, create_client
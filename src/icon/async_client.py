@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import base64
+import time
+from typing import Dict, Union, List, Optional, Any
+from urllib.parse import urlparse
+
+from multimethod import multimethod
+
+from . import builder
+from .base_client import BaseClient
+from .builder.method import Method
+from .confirmation import BlockCadence, is_pending
+from .data.address import Address
+from .data.block import Block
+from .data.block_header import BlockHeader
+from .data.rpc_request import RpcRequest
+from .data.rpc_response import RpcResponse
+from .data.transaction import Transaction, BaseTransaction
+from .data.transaction_result import TransactionResult
+from .data.validators import Validators
+from .data.vote import Votes
+from .exception import (
+    JSONRPCException,
+    TimeoutException,
+)
+from .provider.async_http_provider import AsyncHTTPProvider
+from .provider.async_provider import AsyncProvider
+from .utils import (
+    bytes_to_hex,
+    hex_to_bytes,
+    str_to_int,
+)
+from .utils.deadline import with_deadline
+
+
+class AsyncClient(BaseClient):
+    """Client on asyncio
+
+    It has the same methods as Client but all of them are coroutines.
+    """
+
+    def __init__(self, provider: AsyncProvider, cadence: Optional[BlockCadence] = None):
+        super().__init__(cadence)
+        self._provider = provider
+        self._ex = AsyncClientEx(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        await self._provider.close()
+        self._hooks.close()
+
+    @property
+    def ex(self) -> AsyncClientEx:
+        return self._ex
+
+    async def get_block_by_hash(self, block_hash: bytes, **kwargs) -> Union[Block, Dict[str, Any]]:
+        params = {"hash": bytes_to_hex(block_hash)}
+        request = RpcRequest(Method.GET_BLOCK_BY_HASH, params)
+        response = await self.send_request(request, **kwargs)
+        return self._convert(response, self._get_block_converter(kwargs))
+
+    async def get_block_by_height(self, block_height: int, **kwargs) -> Union[Block, Dict[str, Any]]:
+        request = self._create_block_by_height_request(block_height)
+        response = await self.send_request(request, **kwargs)
+        return self._convert(response, self._get_block_converter(kwargs))
+
+    async def get_last_block(self, **kwargs) -> Union[Block, Dict[str, Any]]:
+        request = RpcRequest(Method.GET_LAST_BLOCK)
+        response = await self.send_request(request, **kwargs)
+        return self._convert(response, self._get_block_converter(kwargs))
+
+    async def get_transaction(
+            self, tx_hash: bytes, **kwargs
+    ) -> Union[Transaction, BaseTransaction, Dict[str, Any]]:
+        params = {"txHash": bytes_to_hex(tx_hash)}
+        request = RpcRequest(Method.GET_TRANSACTION_BY_HASH, params)
+        response = await self.send_request(request, **kwargs)
+        return self._convert(response, self._get_transaction_converter(kwargs))
+
+    async def get_transaction_result(self, tx_hash: bytes, **kwargs) -> Union[TransactionResult, Dict[str, Any]]:
+        params = {"txHash": bytes_to_hex(tx_hash)}
+        request = RpcRequest(Method.GET_TRANSACTION_RESULT, params)
+        response = await self.send_request(request, **kwargs)
+        return self._convert(response, self._get_transaction_result_converter(kwargs))
+
+    async def get_transaction_result_with_timeout(
+            self, tx_hash: bytes, **kwargs
+    ) -> Union[TransactionResult, Dict[str, Any]]:
+        """Polls the result of a transaction until timeout_ms in kwargs elapses
+
+        The first poll is sent at once and the next ones just after each block
+        expected by the cadence. Errors other than pending are raised at once.
+        The time spent on requests counts toward timeout_ms.
+        Each request is bound by "deadline" or "timeout" in kwargs.
+        """
+        kwargs = with_deadline(kwargs)
+        deadline: float = self._get_result_deadline(kwargs)
+
+        while True:
+            try:
+                return await self.get_transaction_result(tx_hash, **kwargs)
+            except JSONRPCException as e:
+                if not is_pending(e):
+                    raise
+                error = e
+
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"Transaction result not available: {error}", error)
+
+            if self._cadence.is_stale():
+                await self._observe_last_block(**kwargs)
+            await asyncio.sleep(max(min(self._cadence.get_delay(), deadline - time.monotonic()), 0))
+
+    async def _observe_last_block(self, **kwargs):
+        # Only to keep track of the cadence, so any failure is ignored
+        try:
+            self._cadence.observe_block(await self.get_last_block(**kwargs))
+        except TimeoutException:
+            raise
+        except Exception:
+            pass
+
+    async def get_total_supply(self, **kwargs) -> int:
+        request = RpcRequest(Method.GET_TOTAL_SUPPLY)
+        response = await self.send_request(request, **kwargs)
+        return str_to_int(response.result)
+
+    async def get_balance(self, address: Address, **kwargs) -> int:
+        params = {"address": str(address)}
+        request = RpcRequest(Method.GET_BALANCE, params)
+        response = await self.send_request(request, **kwargs)
+        return str_to_int(response.result)
+
+    async def get_score_api(self, address: Address, **kwargs) -> Dict[str, str]:
+        params = {"address": str(address)}
+        request = RpcRequest(Method.GET_SCORE_API, params)
+        response = await self.send_request(request, **kwargs)
+        return response.result
+
+    async def get_block(
+            self, value: Union[bytes, int, None] = None, **kwargs
+    ) -> Dict[str, str]:
+        request = self._create_block_request(value)
+        response = await self.send_request(request, **kwargs)
+        return response.result
+
+    async def send_transaction_and_wait(
+            self, tx: Union[builder.Transaction, Dict[str, Any]], **kwargs
+    ) -> Union[TransactionResult, Dict[str, Any]]:
+        kwargs = with_deadline(kwargs)
+        tx_hash: bytes = await self.send_transaction(tx, **kwargs)
+        return await self.get_transaction_result_with_timeout(tx_hash, **kwargs)
+
+    async def send_transaction(self, tx: Union[builder.Transaction, Dict[str, Any]], **kwargs) -> bytes:
+        tx = self._sign_transaction(tx, kwargs.get("private_key"))
+        request = RpcRequest(Method.SEND_TRANSACTION, tx)
+        response = await self.send_request(request, **kwargs)
+        return hex_to_bytes(response.result)
+
+    async def call(self, params: Dict[str, Any], **kwargs) -> Union[str, Dict[str, str]]:
+        request = RpcRequest(Method.CALL, params)
+        response = await self.send_request(request, **kwargs)
+        return response.result
+
+    async def estimate_step(self, tx: Union[builder.Transaction, Dict[str, Any]], **kwargs) -> int:
+        request = self._create_estimate_step_request(tx)
+        response = await self.send_request(request, **kwargs)
+        return str_to_int(response.result)
+
+    async def get_status(self, **kwargs) -> Dict[str, str]:
+        params = {"filter": ["lastBlock"]}
+        request = RpcRequest(Method.GET_STATUS, params)
+        response = await self.send_request(request, **kwargs)
+        return response.result
+
+    async def get_account(self, address: Address, _filter: int, **kwargs) -> Dict[str, str]:
+        params = {"address": str(address), "filter": hex(_filter)}
+        request = RpcRequest(Method.GET_ACCOUNT, params)
+        response = await self.send_request(request, **kwargs)
+        return response.result
+
+    @multimethod
+    async def send_request(self, request: RpcRequest, **kwargs) -> RpcResponse:
+        self._before_send(request, kwargs)
+        response = await self._provider.send(
+            request, **self._get_provider_kwargs(kwargs)
+        )
+        self._after_send(response, kwargs)
+        self._check_response(response)
+        return response
+
+    @multimethod
+    async def send_request(
+            self, method: str, params: Dict[str, str], **kwargs
+    ) -> RpcResponse:
+        request = RpcRequest(method, params)
+        return await self.send_request(request, **kwargs)
+
+    async def send_batch(self, rpc_requests: List[RpcRequest], **kwargs) -> List[RpcResponse]:
+        """Sends requests with one JSON-RPC 2.0 batch request
+
+        Unlike send_request(), error responses are returned as they are
+        so that each request can be handled separately.
+        """
+        for request in rpc_requests:
+            self._before_send(request, kwargs)
+
+        responses = await self._provider.send_batch(
+            rpc_requests, **self._get_provider_kwargs(kwargs)
+        )
+
+        for response in responses:
+            self._after_send(response, kwargs)
+
+        return responses
+
+    async def get_data_by_hash(self, data_hash: bytes, **kwargs) -> bytes:
+        params = {"hash": bytes_to_hex(data_hash)}
+        request = RpcRequest(Method.GET_DATA_BY_HASH, params)
+        response = await self.send_request(request, **kwargs)
+        return base64.standard_b64decode(response.result)
+
+    async def get_block_header_by_height(self, height: int, **kwargs) -> bytes:
+        params = {"height": hex(height)}
+        request = RpcRequest(Method.GET_BLOCK_HEADER_BY_HEIGHT, params)
+        response = await self.send_request(request, **kwargs)
+        return base64.standard_b64decode(response.result)
+
+    async def get_votes_by_height(self, height: int, **kwargs) -> bytes:
+        params = {"height": hex(height)}
+        request = RpcRequest(Method.GET_VOTES_BY_HEIGHT, params)
+        response = await self.send_request(request, **kwargs)
+        return base64.standard_b64decode(response.result)
+
+
+class AsyncClientEx:
+    """Do not use this outside this module
+    """
+    def __init__(self, client: AsyncClient):
+        self._client = client
+
+    async def get_block_header_by_height(self, height: int, **kwargs) -> BlockHeader:
+        bs: bytes = await self._client.get_block_header_by_height(height, **kwargs)
+        return BlockHeader.from_bytes(bs)
+
+    async def get_validators_by_height(self, height: int, **kwargs) -> Validators:
+        kwargs = with_deadline(kwargs)
+        block_header: BlockHeader = await self.get_block_header_by_height(height - 1, **kwargs)
+        bs = await self._client.get_data_by_hash(block_header.next_validators_hash, **kwargs)
+        return Validators.from_bytes(bs)
+
+    async def get_votes_by_height(self, height: int, **kwargs) -> Votes:
+        kwargs = with_deadline(kwargs)
+        block_header: BlockHeader = await self.get_block_header_by_height(height + 1, **kwargs)
+        bs: bytes = await self._client.get_data_by_hash(block_header.votes_hash, **kwargs)
+        return Votes.from_bytes(bs)
+
+
+def create_async_client(url: str, version: int = 3) -> AsyncClient:
+    o = urlparse(url)
+    return AsyncClient(AsyncHTTPProvider(f"{o.scheme}://{o.netloc}", version))
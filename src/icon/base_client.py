@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import time
+from typing import Dict, Union, Callable, Optional, Any
+
+from . import builder
+from .builder.key import Key
+from .builder.method import Method
+from .confirmation import BlockCadence
+from .data.block import Block, LazyBlock
+from .data.rpc_request import RpcRequest
+from .data.rpc_response import RawRpcResponse, RpcResponse
+from .data.transaction import get_lazy_transaction, get_transaction
+from .data.transaction_result import LazyTransactionResult, TransactionResult
+from .exception import (
+    ArgumentException,
+    HookException,
+    JSONRPCException,
+)
+from .hooks import Hooks
+from .utils import (
+    bytes_to_hex,
+    to_str_dict,
+)
+from .utils.deadline import get_deadline
+from .utils.utils import generate_signature
+
+
+class BaseClient(object):
+    """Builds requests and handles responses for Client and AsyncClient
+
+    Subclasses only send requests, in the calling thread or on asyncio.
+    """
+
+    _BLOCK_GENERATION_INTERVAL_MS = 2000
+
+    def __init__(self, cadence: Optional[BlockCadence] = None):
+        self._hooks = Hooks()
+        if cadence is None:
+            cadence = BlockCadence(self._BLOCK_GENERATION_INTERVAL_MS / 1000)
+        self._cadence = cadence
+
+    @property
+    def hooks(self) -> Hooks:
+        """Hooks called on every request before the ones in "hooks" of kwargs
+        """
+        return self._hooks
+
+    @property
+    def cadence(self) -> BlockCadence:
+        return self._cadence
+
+    @staticmethod
+    def _create_block_by_height_request(block_height: int) -> RpcRequest:
+        if not (isinstance(block_height, int) and block_height >= 0):
+            raise ValueError(f"Invalid params: {block_height}")
+
+        return RpcRequest(Method.GET_BLOCK_BY_HEIGHT, {"height": hex(block_height)})
+
+    @staticmethod
+    def _create_block_request(value: Union[bytes, int, None]) -> RpcRequest:
+        if isinstance(value, bytes):
+            params = {"hash": bytes_to_hex(value)}
+        elif isinstance(value, int):
+            params = {"hash": hex(value)}
+        elif value is None:
+            params = None
+        else:
+            raise ArgumentException(f"Invalid argument: {value}")
+
+        return RpcRequest(Method.GET_BLOCK, params)
+
+    @staticmethod
+    def _create_estimate_step_request(tx: Union[builder.Transaction, Dict[str, Any]]) -> RpcRequest:
+        if isinstance(tx, builder.Transaction):
+            tx = tx.to_dict()
+
+        if Key.STEP_LIMIT in tx:
+            del tx[Key.STEP_LIMIT]
+        if Key.SIGNATURE in tx:
+            del tx[Key.SIGNATURE]
+
+        return RpcRequest(Method.ESTIMATE_STEP, tx)
+
+    @staticmethod
+    def _sign_transaction(
+            tx: Union[builder.Transaction, Dict[str, Any]], private_key: Optional[bytes]
+    ) -> Dict[str, Any]:
+        if isinstance(tx, builder.Transaction):
+            tx = tx.to_dict()
+
+        if isinstance(private_key, bytes):
+            tx: Dict[str, str] = to_str_dict(tx)
+            tx[Key.SIGNATURE] = generate_signature(tx, private_key)
+
+        if Key.SIGNATURE not in tx:
+            raise ArgumentException(f"Signature not found")
+
+        return tx
+
+    @staticmethod
+    def _get_block_converter(kwargs: Dict[str, Any]) -> Callable[[Dict[str, Any]], Any]:
+        return LazyBlock.from_dict if kwargs.get("lazy") else Block.from_dict
+
+    @staticmethod
+    def _get_transaction_converter(kwargs: Dict[str, Any]) -> Callable[[Dict[str, Any]], Any]:
+        return get_lazy_transaction if kwargs.get("lazy") else get_transaction
+
+    @staticmethod
+    def _get_transaction_result_converter(kwargs: Dict[str, Any]) -> Callable[[Dict[str, Any]], Any]:
+        return LazyTransactionResult.from_dict if kwargs.get("lazy") else TransactionResult.from_dict
+
+    def _get_result_deadline(self, kwargs: Dict[str, Any]) -> float:
+        # How long get_transaction_result_with_timeout() polls
+        timeout_ms: int = max(kwargs.get("timeout_ms", 0), self._BLOCK_GENERATION_INTERVAL_MS)
+        return time.monotonic() + timeout_ms / 1000
+
+    @staticmethod
+    def _convert(response: RpcResponse, func: Callable[[Any], Any]) -> Any:
+        """Converts the result of a response, or returns the result as it is on failure
+
+        The converted object is shared by all callers of a coalesced response.
+        A raw response is returned as it is.
+        """
+        if isinstance(response, RawRpcResponse):
+            return response
+
+        try:
+            return response.convert(func)
+        except:
+            return response.result
+
+    @staticmethod
+    def _get_provider_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        ret = {}
+        deadline: Optional[float] = get_deadline(kwargs)
+        if deadline is not None:
+            ret["deadline"] = deadline
+        if kwargs.get("raw"):
+            ret["raw"] = True
+
+        return ret
+
+    def _before_send(self, request: RpcRequest, kwargs: Dict[str, Any]):
+        # Sets "height" in kwargs to params and calls hooks for request
+        if "height" in kwargs:
+            height: int = kwargs["height"]
+            if height > -1 and request.params is not None:
+                request.params["height"] = kwargs["height"]
+
+        ret: bool = self._dispatch_hooks("request", self._hooks, kwargs.get("hooks"), request)
+        if not ret:
+            raise HookException(f"request hooks stopped", request)
+
+    def _after_send(self, response: RpcResponse, kwargs: Dict[str, Any]):
+        # Calls hooks for response
+        ret: bool = self._dispatch_hooks("response", self._hooks, kwargs.get("hooks"), response)
+        if not ret:
+            raise HookException(f"response hooks stopped", response)
+
+    @staticmethod
+    def _check_response(response: RpcResponse):
+        if response.error:
+            raise JSONRPCException(f"{response.error}", response)
+
+    @classmethod
+    def _dispatch_hooks(
+            cls, key: str, registered: Hooks, hooks, hook_data: Union[RpcRequest, RpcResponse]
+    ) -> bool:
+        # Registered hooks are compiled, so nothing is done without any
+        if registered and not registered.dispatch(key, hook_data):
+            return False
+
+        return cls._dispatch_hook(key, hooks, hook_data)
+
+    @classmethod
+    def _dispatch_hook(cls, key: str, hooks, hook_data: Union[RpcRequest, RpcResponse]):
+        if not hooks:
+            return True
+
+        hooks = hooks.get(key)
+
+        if hooks:
+            if hasattr(hooks, "__call__"):
+                hooks = [hooks]
+
+            for hook in hooks:
+                ret: Optional[bool] = hook(hook_data)
+                if ret is False:
+                    return False
+
+        return True
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import base64
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+
+from .base_client import BaseClient
+from .builder.method import Method
+from .data.address import Address
+from .data.rpc_request import RpcRequest
+from .data.rpc_response import RpcResponse
+from .exception import (
+    ArgumentException,
+    DataTypeException,
+    JSONRPCException,
+    SDKException,
+)
+from .utils import bytes_to_hex, str_to_int
+from .utils.deadline import with_deadline
+
+if TYPE_CHECKING:
+    from .client import Client
+
+
+def _or_result(converter: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    # A result which is not converted to a model is returned as it is, like Client does
+    def convert(result: Any) -> Any:
+        try:
+            return converter(result)
+        except:
+            return result
+
+    return convert
+
+
+def _to_bytes(result: str) -> bytes:
+    return base64.standard_b64decode(result)
+
+
+class BatchItem(object):
+    """Result of a request queued in a Batch
+
+    The result is available after the batch has been executed.
+    """
+
+    def __init__(self, request: RpcRequest, converter: Optional[Callable[[Any], Any]]):
+        self._request = request
+        self._converter = converter
+        self._response: Optional[RpcResponse] = None
+        self._result: Any = None
+        self._exception: Optional[SDKException] = None
+
+    @property
+    def request(self) -> RpcRequest:
+        return self._request
+
+    @property
+    def response(self) -> Optional[RpcResponse]:
+        return self._response
+
+    @property
+    def done(self) -> bool:
+        return self._response is not None or self._exception is not None
+
+    @property
+    def exception(self) -> Optional[SDKException]:
+        return self._exception
+
+    @property
+    def result(self) -> Any:
+        """Returns the converted result of the request
+
+        Raises the error of this item if the request failed.
+        """
+        if not self.done:
+            raise ArgumentException("Batch not executed yet")
+        if self._exception:
+            raise self._exception
+
+        return self._result
+
+    def set_response(self, response: RpcResponse):
+        self._response = response
+
+        if response.error:
+            self._exception = JSONRPCException(f"{response.error}", response)
+            return
+
+        result = response.result
+        try:
+            self._result = self._converter(result) if self._converter else result
+        except Exception as e:
+            # Only this item fails, and the others in the batch are resolved
+            self._exception = DataTypeException(f"Invalid result: {e}", response)
+
+    def set_exception(self, e: SDKException):
+        self._exception = e
+
+
+class Batch(object):
+    """Queues requests and sends them with one JSON-RPC 2.0 batch request
+
+    with client.batch() as batch:
+        balance = batch.get_balance(address)
+        tx_result = batch.get_transaction_result(tx_hash)
+
+    print(balance.result, tx_result.result)
+    """
+
+    def __init__(self, client: Client, max_size: Optional[int] = 0, **kwargs):
+        """
+
+        :param client: client which sends the batch
+        :param max_size: the maximum number of requests in one batch request
+            (0: no limit, None: the batch size of client.controller or no limit)
+        :param kwargs: arguments passed to Client.send_batch()
+        """
+        self._client = client
+        self._max_size = max_size
+        self._kwargs = kwargs
+        self._items: List[BatchItem] = []
+
+    def __enter__(self) -> Batch:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.execute()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def items(self) -> List[BatchItem]:
+        return self._items
+
+    def add(
+        self, request: RpcRequest, converter: Optional[Callable[[Any], Any]] = None
+    ) -> BatchItem:
+        item = BatchItem(request, converter)
+        self._items.append(item)
+        return item
+
+    def execute(self) -> List[BatchItem]:
+        items = [item for item in self._items if not item.done]
+        # All chunks share one deadline
+        kwargs = with_deadline(self._kwargs)
+
+        i = 0
+        while i < len(items):
+            # The batch size of a controller may change after each chunk
+            size = self._get_max_size() or len(items)
+            chunk = items[i : i + size]
+            i += size
+            try:
+                responses = self._client.send_batch(
+                    [item.request for item in chunk], **kwargs
+                )
+            except SDKException as e:
+                for item in chunk:
+                    item.set_exception(e)
+                continue
+
+            for item, response in zip(chunk, responses):
+                item.set_response(response)
+
+        return self._items
+
+    def _get_max_size(self) -> int:
+        if self._max_size is not None:
+            return self._max_size
+
+        controller = self._client.controller
+        return 0 if controller is None else controller.batch_size
+
+    def _get_converter(
+        self, get_converter: Callable[[Dict[str, Any]], Callable[[Any], Any]]
+    ) -> Callable[[Any], Any]:
+        return _or_result(get_converter(self._kwargs))
+
+    def get_block_by_hash(self, block_hash: bytes) -> BatchItem:
+        params = {"hash": bytes_to_hex(block_hash)}
+        request = RpcRequest(Method.GET_BLOCK_BY_HASH, params)
+        return self.add(request, self._get_converter(BaseClient._get_block_converter))
+
+    def get_block_by_height(self, block_height: int) -> BatchItem:
+        request = BaseClient._create_block_by_height_request(block_height)
+        return self.add(request, self._get_converter(BaseClient._get_block_converter))
+
+    def get_last_block(self) -> BatchItem:
+        request = RpcRequest(Method.GET_LAST_BLOCK)
+        return self.add(request, self._get_converter(BaseClient._get_block_converter))
+
+    def get_transaction(self, tx_hash: bytes) -> BatchItem:
+        params = {"txHash": bytes_to_hex(tx_hash)}
+        request = RpcRequest(Method.GET_TRANSACTION_BY_HASH, params)
+        return self.add(
+            request, self._get_converter(BaseClient._get_transaction_converter)
+        )
+
+    def get_transaction_result(self, tx_hash: bytes) -> BatchItem:
+        params = {"txHash": bytes_to_hex(tx_hash)}
+        request = RpcRequest(Method.GET_TRANSACTION_RESULT, params)
+        return self.add(
+            request, self._get_converter(BaseClient._get_transaction_result_converter)
+        )
+
+    def get_total_supply(self) -> BatchItem:
+        return self.add(RpcRequest(Method.GET_TOTAL_SUPPLY), str_to_int)
+
+    def get_balance(self, address: Address) -> BatchItem:
+        params = {"address": str(address)}
+        return self.add(RpcRequest(Method.GET_BALANCE, params), str_to_int)
+
+    def get_score_api(self, address: Address) -> BatchItem:
+        params = {"address": str(address)}
+        return self.add(RpcRequest(Method.GET_SCORE_API, params))
+
+    def get_block(self, value: Union[bytes, int, None] = None) -> BatchItem:
+        return self.add(BaseClient._create_block_request(value))
+
+    def call(self, params: Dict[str, Any]) -> BatchItem:
+        return self.add(RpcRequest(Method.CALL, params))
+
+    def get_status(self) -> BatchItem:
+        params = {"filter": ["lastBlock"]}
+        return self.add(RpcRequest(Method.GET_STATUS, params))
+
+    def get_account(self, address: Address, _filter: int) -> BatchItem:
+        params = {"address": str(address), "filter": hex(_filter)}
+        return self.add(RpcRequest(Method.GET_ACCOUNT, params))
+
+    def get_data_by_hash(self, data_hash: bytes) -> BatchItem:
+        params = {"hash": bytes_to_hex(data_hash)}
+        return self.add(RpcRequest(Method.GET_DATA_BY_HASH, params), _to_bytes)
+
+    def get_block_header_by_height(self, height: int) -> BatchItem:
+        params = {"height": hex(height)}
+        request = RpcRequest(Method.GET_BLOCK_HEADER_BY_HEIGHT, params)
+        return self.add(request, _to_bytes)
+
+    def get_votes_by_height(self, height: int) -> BatchItem:
+        params = {"height": hex(height)}
+        return self.add(RpcRequest(Method.GET_VOTES_BY_HEIGHT, params), _to_bytes)
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Iterators over blocks
+"""
+
+from __future__ import annotations
+
+__all__ = ("follow_blocks", "iter_blocks")
+
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterator, Optional, Tuple, Union
+
+from .confirmation import is_pending, normalize_hash
+from .data.block import Block
+from .exception import (
+    ArgumentException,
+    JSONRPCException,
+    SDKException,
+    TimeoutException,
+    TransportException,
+)
+from .utils.executor import Priority
+
+if TYPE_CHECKING:
+    from .client import Client
+
+# The maximum window to follow the concurrency of a controller
+_MAX_WINDOW = 64
+
+# JSON-RPC errors caused by a request itself, which fail again on retry
+_PERMANENT_ERROR_CODES = frozenset((-32600, -32601, -32602))
+
+# Seconds to wait before the first retry, doubled on each retry up to _MAX_BACKOFF
+_BACKOFF = 0.05
+_MAX_BACKOFF = 2.0
+
+
+def iter_blocks(
+    client: Client,
+    start: int,
+    end: int,
+    window: Optional[int] = None,
+    retries: int = 3,
+    **kwargs,
+) -> Iterator[Union[Block, Dict[str, Any]]]:
+    """Yields blocks from start to end - 1 in height order
+
+    Up to window blocks are requested ahead on client.executor with low priority,
+    so at most window blocks are kept in memory
+    and a backfill does not delay transactions submitted meanwhile.
+    A height failed with a transient error is requested again after a short backoff
+    while the others are in flight.
+
+    :param client: client which sends requests
+    :param start: the first block height
+    :param end: the block height after the last one
+    :param window: the maximum number of requests in flight
+        (default: the concurrency of client.controller, which may change, or 16)
+    :param retries: the number of retries per height before the error is raised
+    :param kwargs: arguments passed to Client.get_block_by_height()
+        "timeout" applies to each request
+    """
+    if not (isinstance(start, int) and 0 <= start <= end):
+        raise ArgumentException(f"Invalid range: {start}, {end}")
+    if window is not None and window < 1:
+        raise ArgumentException(f"Invalid window: {window}")
+
+    controller = None
+    if window is None:
+        controller = client.controller
+        window = 16 if controller is None else _MAX_WINDOW
+
+    def fetch(height: int) -> Union[Block, Dict[str, Any]]:
+        # Retried in the worker so that the other heights go on meanwhile
+        for attempt in range(retries + 1):
+            try:
+                return client.get_block_by_height(height, **kwargs)
+            except SDKException as e:
+                # An error caused by the request itself fails again on retry
+                if (
+                    not _is_transient(e)
+                    or attempt >= retries
+                    or _is_deadline_passed(kwargs)
+                ):
+                    raise
+
+            time.sleep(_get_backoff(attempt))
+
+    executor = client.executor
+    in_flight: Deque[Future] = deque()
+    next_height = start
+    try:
+        while next_height < end or in_flight:
+            limit = (
+                window if controller is None else min(controller.concurrency, window)
+            )
+            while next_height < end and len(in_flight) < limit:
+                in_flight.append(
+                    executor.submit_with_priority(Priority.LOW, fetch, next_height)
+                )
+                next_height += 1
+
+            yield in_flight.popleft().result()
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+
+def _get_backoff(attempt: int) -> float:
+    return min(_BACKOFF * 2 ** attempt, _MAX_BACKOFF)
+
+
+def _is_deadline_passed(kwargs: Dict[str, Any]) -> bool:
+    deadline: Optional[float] = kwargs.get("deadline")
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def _is_not_produced(e: SDKException) -> bool:
+    if is_pending(e):
+        return True
+
+    # loopchain replies to a height not produced yet with -32602
+    error = getattr(e.user_data, "error", None)
+    return isinstance(error, dict) and "height" in str(error.get("message", ""))
+
+
+def _is_transient(e: SDKException) -> bool:
+    if isinstance(e, (TimeoutException, TransportException)):
+        return True
+    if isinstance(e, JSONRPCException):
+        error = getattr(e.user_data, "error", None)
+        code = error.get("code") if isinstance(error, dict) else None
+        return code not in _PERMANENT_ERROR_CODES
+
+    return False
+
+
+def _get_hashes(block: Union[Block, Dict[str, Any]]) -> Tuple[str, str]:
+    # Returns the hash and the previous hash of a block in the same format
+    if isinstance(block, Block):
+        return block.block_hash.hex(), block.prev_block_hash.hex()
+
+    prev_block_hash: str = block.get("prev_block_hash") or ""
+    return normalize_hash(block["block_hash"]), normalize_hash(prev_block_hash)
+
+
+def follow_blocks(
+    client: Client, from_height: int, depth: int = 16, **kwargs
+) -> Iterator[Union[Block, Dict[str, Any]]]:
+    """Yields blocks from from_height on as soon as they are produced
+
+    A block is requested just after the time expected by client.cadence.
+    Blocks which are already produced are requested one after another.
+    Transient failures like timeouts and transport errors are retried
+    with a backoff and other errors are raised.
+
+    Before a block is yielded, its prev_block_hash is checked against the block
+    yielded before it. On a mismatch, the follower walks back up to depth blocks
+    to the common ancestor. Blocks which replace yielded ones are yielded again
+    with the same heights.
+
+    :param client: client which sends requests
+    :param from_height: the first block height
+    :param depth: the number of yielded blocks kept to walk back
+    :param kwargs: arguments passed to Client.get_block_by_height()
+        "timeout" applies to each request
+    """
+    if not (isinstance(from_height, int) and from_height >= 0):
+        raise ArgumentException(f"Invalid height: {from_height}")
+
+    cadence = client.cadence
+    # (height, hash) of blocks yielded recently
+    history: Deque[Tuple[int, str]] = deque(maxlen=depth)
+    # Hashes of yielded blocks which are requested again to walk back
+    walked_back: Dict[int, str] = {}
+    height = from_height
+    # Consecutive failures other than blocks not produced yet
+    failures = 0
+
+    while True:
+        block: Optional[Union[Block, Dict[str, Any]]] = None
+        try:
+            block = client.get_block_by_height(height, **kwargs)
+        except SDKException as e:
+            if _is_not_produced(e):
+                time.sleep(cadence.get_delay())
+            elif _is_transient(e):
+                time.sleep(max(cadence.get_delay(), _get_backoff(failures)))
+                failures += 1
+            else:
+                raise
+            continue
+
+        failures = 0
+
+        cadence.observe_block(block)
+        block_hash, prev_block_hash = _get_hashes(block)
+
+        if history and history[-1][1] != prev_block_hash:
+            prev_height, prev_hash = history.pop()
+            walked_back[prev_height] = prev_hash
+            height = prev_height
+            continue
+
+        if walked_back.pop(height, None) == block_hash:
+            # The yielded block is still on the chain.
+            # The block after it came from a node which is out of sync.
+            time.sleep(cadence.interval / 10)
+        else:
+            yield block
+
+        history.append((height, block_hash))
+        height += 1
+        # Not to request the block after the head before it is produced
+        time.sleep(cadence.get_wait(height))
@@ -32,3 +32,31 @@ class Method(object):
     GET_VOTES_BY_HEIGHT = "icx_getVotesByHeight"
     GET_PROOF_FOR_RESULT = "icx_getProofForResult"
     GET_PROOF_FOR_EVENT = "icx_getProofForEvent"
+
+    # Methods which do not change any state and can be sent more than once
+    READ_ONLY_METHODS = frozenset(
+        (
+            CALL,
+            GET_BLOCK,
+            GET_BLOCK_BY_HASH,
+            GET_BLOCK_BY_HEIGHT,
+            GET_LAST_BLOCK,
+            GET_TRANSACTION_BY_HASH,
+            GET_TRANSACTION_RESULT,
+            GET_BALANCE,
+            GET_SCORE_API,
+            GET_TOTAL_SUPPLY,
+            ESTIMATE_STEP,
+            GET_ACCOUNT,
+            GET_STATUS,
+            GET_DATA_BY_HASH,
+            GET_BLOCK_HEADER_BY_HEIGHT,
+            GET_VOTES_BY_HEIGHT,
+            GET_PROOF_FOR_RESULT,
+            GET_PROOF_FOR_EVENT,
+        )
+    )
+
+    @classmethod
+    def is_read_only(cls, method: str) -> bool:
+        return method in cls.READ_ONLY_METHODS
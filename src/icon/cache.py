@@ -0,0 +1,591 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Caches for responses to requests for data which never changes
+"""
+
+__all__ = ("DataStore", "DiskCache", "ResultCache")
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from .builder.method import Method
+from .data.rpc_request import RpcRequest
+from .data.rpc_response import RpcResponse
+from .exception import DataTypeException
+from .utils import str_to_int
+
+# Requests for data addressed by its hash
+_HASH_METHODS = frozenset((Method.GET_BLOCK_BY_HASH, Method.GET_DATA_BY_HASH))
+
+# Requests for data at a block height, which never changes once the block is final
+_HEIGHT_METHODS = frozenset(
+    (
+        Method.GET_BLOCK_BY_HEIGHT,
+        Method.GET_BLOCK_HEADER_BY_HEIGHT,
+        Method.GET_VOTES_BY_HEIGHT,
+    )
+)
+
+# Requests for data about a transaction, which never changes once its block is final
+_TX_METHODS = frozenset((Method.GET_TRANSACTION_BY_HASH, Method.GET_TRANSACTION_RESULT))
+
+# Queries on the state, which never changes at a final height given in params
+_QUERY_METHODS = frozenset(
+    (Method.CALL, Method.GET_BALANCE, Method.GET_SCORE_API, Method.GET_TOTAL_SUPPLY)
+)
+
+# Requests whose responses can be cached
+_METHODS = _HASH_METHODS | _HEIGHT_METHODS | _TX_METHODS | _QUERY_METHODS
+
+T = TypeVar("T")
+
+
+def _get_key(request: RpcRequest) -> str:
+    params = request.to_dict().get("params")
+    return json.dumps([request.method, params], sort_keys=True, separators=(",", ":"))
+
+
+def _get_height(value: Any) -> Optional[int]:
+    try:
+        return str_to_int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _get_height_param(request: RpcRequest) -> Optional[int]:
+    return _get_height((request.params or {}).get("height"))
+
+
+def _is_pinned(request: RpcRequest) -> bool:
+    # A query pinned to a height or a request for data at a height
+    return request.method in _HEIGHT_METHODS or (
+        request.method in _QUERY_METHODS and _get_height_param(request) is not None
+    )
+
+
+def _get_size(response: RpcResponse) -> int:
+    # The body of RawRpcResponse or of requests.Response which carried it
+    for content in (
+        getattr(response, "content", None),
+        getattr(response.user_data, "content", None),
+    ):
+        if isinstance(content, bytes):
+            return len(content)
+
+    return len(json.dumps(response.result, separators=(",", ":")))
+
+
+def _is_stored_on_disk(request: RpcRequest) -> bool:
+    # Queries without height are never final, so they are kept only in memory
+    return request.method in _METHODS and (
+        request.method not in _QUERY_METHODS or _is_pinned(request)
+    )
+
+
+class DiskCache(object):
+    """Persistent cache of raw results in a SQLite database
+
+    The database runs in WAL mode, so several processes can share it:
+    readers do not block a writer and writers wait for each other up to timeout.
+    Each thread uses its own connection.
+    Entries are never evicted until compact() is called.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        """
+
+        :param path: the path of the database file
+        :param timeout: seconds to wait for a lock held by another connection
+        """
+        self._path = path
+        self._timeout = timeout
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+        conn = self._get_connection()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "size INTEGER NOT NULL, stored_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS results_stored_at ON results (stored_at)"
+            )
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def __len__(self) -> int:
+        row = self._get_connection().execute("SELECT COUNT(*) FROM results").fetchone()
+        return row[0]
+
+    @property
+    def size(self) -> int:
+        """The total size of stored results in bytes
+        """
+        row = (
+            self._get_connection()
+            .execute("SELECT COALESCE(SUM(size), 0) FROM results")
+            .fetchone()
+        )
+        return row[0]
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the result stored with key in JSON or None
+        """
+        row = (
+            self._get_connection()
+            .execute("SELECT value FROM results WHERE key = ?", (key,))
+            .fetchone()
+        )
+        return None if row is None else row[0]
+
+    def put(self, key: str, value: str):
+        conn = self._get_connection()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (key, value, len(value), time.time()),
+            )
+
+    def compact(self, max_bytes: Optional[int] = None):
+        """Removes the oldest entries until their total size is max_bytes or less
+        and returns the freed pages to the file system
+
+        :param max_bytes: the maximum total size of stored results in bytes
+            (default: None, no entry is removed)
+        """
+        conn = self._get_connection()
+        if max_bytes is not None:
+            with conn:
+                rows = conn.execute(
+                    "SELECT key, size FROM results ORDER BY stored_at DESC"
+                )
+                total = 0
+                keys = []
+                for key, size in rows:
+                    total += size
+                    if total > max_bytes:
+                        keys.append((key,))
+
+                conn.executemany("DELETE FROM results WHERE key = ?", keys)
+
+        conn.execute("VACUUM")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def clear(self):
+        conn = self._get_connection()
+        with conn:
+            conn.execute("DELETE FROM results")
+
+    def close(self):
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        # A connection must not be used in a child process after fork
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        conn = sqlite3.connect(
+            self._path, timeout=self._timeout, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        with self._lock:
+            self._connections.append(conn)
+
+        return conn
+
+
+class ResultCache(object):
+    """LRU cache for responses of requests for immutable chain data
+
+    Blocks by hash, data by hash, blocks, headers and votes by height
+    and transactions and their results are cached only when they are final,
+    which means finality_depth blocks or more are on top of them.
+    The head height is the highest one seen in responses.
+    Entries are evicted in LRU order when their total size exceeds max_bytes.
+
+    Queries pinned to a final height by the "height" param are cached
+    in the same way. Queries without it are cached for query_ttl seconds at most
+    and only until the head height changes.
+
+    With disk, final results are stored in it as well
+    and results missing in memory are looked up there.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        finality_depth: int = 1,
+        disk: Optional[DiskCache] = None,
+        query_ttl: float = 1.0,
+    ):
+        """
+
+        :param max_bytes: the maximum total size of cached results in bytes
+        :param finality_depth: the number of blocks on top of a block to regard it as final
+        :param disk: the persistent tier under memory (default: None)
+        :param query_ttl: seconds to cache queries without height (0: not cached)
+        """
+        self._max_bytes = max_bytes
+        self._finality_depth = finality_depth
+        self._disk = disk
+        self._query_ttl = query_ttl
+
+        # key: (response, size, (head height, expiry) or None for final results)
+        self._entries: Dict[
+            str, Tuple[RpcResponse, int, Optional[Tuple[Optional[int], float]]]
+        ] = OrderedDict()
+        self._size = 0
+        self._head_height: Optional[int] = None
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """The total size of cached results in bytes
+        """
+        return self._size
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def head_height(self) -> Optional[int]:
+        return self._head_height
+
+    @property
+    def disk(self) -> Optional[DiskCache]:
+        return self._disk
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size": self._size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "headHeight": self._head_height,
+            }
+
+    def observe_height(self, height: int):
+        """Raises the head height to height if it is higher
+        """
+        with self._lock:
+            if self._head_height is None or height > self._head_height:
+                self._head_height = height
+
+    def is_final(self, height: int) -> bool:
+        head_height: Optional[int] = self._head_height
+        return head_height is not None and height <= head_height - self._finality_depth
+
+    def get(self, request: RpcRequest) -> Optional[RpcResponse]:
+        """Returns the cached response to request or None
+
+        Only requests which can be cached count as hits or misses.
+        """
+        if not self._is_cacheable_request(request):
+            return None
+
+        key: str = _get_key(request)
+        response: Optional[RpcResponse] = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry[2]):
+                del self._entries[key]
+                self._size -= entry[1]
+                entry = None
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                response = entry[0]
+
+        if response is not None:
+            # The cached response has the id of the request which filled it
+            return response.with_id(request.id)
+
+        value: Optional[str] = None
+        if self._disk is not None and _is_stored_on_disk(request):
+            value = self._disk.get(key)
+        if value is None:
+            with self._lock:
+                self._misses += 1
+            return None
+
+        response = RpcResponse(
+            {"jsonrpc": "2.0", "id": request.id, "result": json.loads(value)}
+        )
+        self._put(key, response, len(value))
+        with self._lock:
+            self._hits += 1
+        return response
+
+    def put(self, request: RpcRequest, response: RpcResponse):
+        """Caches response if it is a final result of a request for immutable data
+        """
+        if response.error or response.result is None:
+            return
+
+        self._observe_response(request.method, response.result)
+        if request.method not in _METHODS:
+            return
+
+        if request.method in _QUERY_METHODS and not _is_pinned(request):
+            if self._query_ttl > 0:
+                expiry = self._head_height, time.monotonic() + self._query_ttl
+                self._put(_get_key(request), response, _get_size(response), expiry)
+            return
+
+        if not self._is_final_response(request, response):
+            return
+
+        key: str = _get_key(request)
+        if self._disk is None:
+            self._put(key, response, _get_size(response))
+            return
+
+        value: str = json.dumps(response.result, separators=(",", ":"))
+        self._put(key, response, len(value))
+        self._disk.put(key, value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _put(
+        self,
+        key: str,
+        response: RpcResponse,
+        size: int,
+        expiry: Optional[Tuple[Optional[int], float]] = None,
+    ):
+        if size > self._max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+
+            self._entries[key] = response, size, expiry
+            self._size += size
+
+            while self._size > self._max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+    def _is_expired(self, expiry: Optional[Tuple[Optional[int], float]]) -> bool:
+        if expiry is None:
+            return False
+
+        head_height, expires_at = expiry
+        return head_height != self._head_height or time.monotonic() > expires_at
+
+    def _is_cacheable_request(self, request: RpcRequest) -> bool:
+        # Only requests for immutable data, in memory or on disk
+        if request.method not in _METHODS:
+            return False
+
+        if _is_pinned(request):
+            if self._disk is not None and _is_stored_on_disk(request):
+                # A result on disk was final when it was stored
+                return True
+
+            height = _get_height_param(request)
+            return height is not None and self.is_final(height)
+        if request.method in _QUERY_METHODS:
+            return self._query_ttl > 0
+
+        return True
+
+    def _is_final_response(self, request: RpcRequest, response: RpcResponse) -> bool:
+        method: str = request.method
+        result = response.result
+        if _is_pinned(request):
+            height = _get_height_param(request)
+            return height is not None and self.is_final(height)
+        if method in _TX_METHODS:
+            if not isinstance(result, dict):
+                return False
+
+            # A pending transaction has no block height yet
+            height = _get_height(result.get("blockHeight"))
+            return height is not None and self.is_final(height)
+
+        return True
+
+    def _observe_response(self, method: str, result: Any):
+        if not isinstance(result, dict):
+            return
+
+        if method in _TX_METHODS:
+            height = _get_height(result.get("blockHeight"))
+        elif method in (
+            Method.GET_LAST_BLOCK,
+            Method.GET_BLOCK_BY_HEIGHT,
+            Method.GET_BLOCK_BY_HASH,
+        ):
+            height = _get_height(result.get("height"))
+        else:
+            return
+
+        if height is not None:
+            self.observe_height(height)
+
+
+class DataStore(object):
+    """Content-addressed store of blobs from icx_getDataByHash
+
+    A blob is verified against its SHA3-256 hash when it is put,
+    so a blob in the store is always the one addressed by its hash.
+    Objects decoded from a blob like Validators and Votes are kept with it
+    and shared by all callers, so they must not be modified.
+    Blobs are evicted in LRU order when their total size exceeds max_bytes.
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        """
+
+        :param max_bytes: the maximum total size of stored blobs in bytes
+        """
+        self._max_bytes = max_bytes
+
+        # hash: (blob, {decoder: decoded object})
+        self._entries: Dict[
+            bytes, Tuple[bytes, Dict[Callable[[bytes], Any], Any]]
+        ] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, data_hash: bytes) -> bool:
+        return data_hash in self._entries
+
+    @property
+    def size(self) -> int:
+        """The total size of stored blobs in bytes
+        """
+        return self._size
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size": self._size,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    def get(self, data_hash: bytes) -> Optional[bytes]:
+        """Returns the blob addressed by data_hash or None
+        """
+        with self._lock:
+            entry = self._entries.get(data_hash)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(data_hash)
+            self._hits += 1
+            return entry[0]
+
+    @staticmethod
+    def verify(data_hash: bytes, data: bytes):
+        """
+        :raise DataTypeException: the hash of data is not data_hash
+        """
+        if hashlib.sha3_256(data).digest() != data_hash:
+            raise DataTypeException(f"Data mismatch: hash=0x{data_hash.hex()}", data)
+
+    def put(self, data_hash: bytes, data: bytes):
+        """Stores data after verifying it against data_hash
+
+        :raise DataTypeException: the hash of data is not data_hash
+        """
+        self.verify(data_hash, data)
+        if len(data) > self._max_bytes:
+            return
+
+        with self._lock:
+            if data_hash in self._entries:
+                return
+
+            self._entries[data_hash] = data, {}
+            self._size += len(data)
+            while self._size > self._max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def get_object(
+        self, data_hash: bytes, decoder: Callable[[bytes], T]
+    ) -> Optional[T]:
+        """Returns the object decoded from the blob with decoder or None
+
+        A blob is decoded only once per decoder.
+        """
+        with self._lock:
+            entry = self._entries.get(data_hash)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(data_hash)
+            self._hits += 1
+            data, objects = entry
+            if decoder in objects:
+                return objects[decoder]
+
+        # Decoded out of the lock. Racing callers may decode it twice, but one wins.
+        obj = decoder(data)
+        with self._lock:
+            return objects.setdefault(decoder, obj)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
@@ -2,80 +2,165 @@
 from __future__ import annotations
 
 import base64
+import functools
+import threading
 import time
-from typing import Dict, Union, List, Callable, Optional, Any
+from concurrent.futures import Future
+from typing import Dict, Union, List, Callable, Optional, Any, Iterable, Iterator
 from urllib.parse import urlparse
 
 from multimethod import multimethod
 
 from . import builder
-from .builder.key import Key
+from .base_client import BaseClient
+from .batch import Batch, BatchItem, _or_result
+from .blocks import follow_blocks, iter_blocks
+from .cache import DataStore, ResultCache
 from .builder.method import Method
+from .confirmation import (
+    BlockCadence,
+    get_transaction_hashes,
+    is_pending,
+    normalize_hash,
+)
 from .data.address import Address
 from .data.block import Block
 from .data.block_header import BlockHeader
 from .data.rpc_request import RpcRequest
 from .data.rpc_response import RpcResponse
-from .data.transaction import Transaction, BaseTransaction, get_transaction
+from .data.transaction import Transaction, BaseTransaction
 from .data.transaction_result import TransactionResult
 from .data.validators import Validators
 from .data.vote import Votes
 from .exception import (
     ArgumentException,
-    HookException,
     JSONRPCException,
-    SDKException,
+    TimeoutException,
 )
+from .head import HeadTracker
+from .provider.aimd import AIMDController
 from .provider.http_provider import HTTPProvider
+from .provider.multi_endpoint_provider import MultiEndpointProvider
 from .provider.provider import Provider
 from .utils import (
     bytes_to_hex,
     hex_to_bytes,
     str_to_int,
-    to_str_dict,
 )
-from .utils.utils import generate_signature
+from .utils.deadline import with_deadline
+from .utils.executor import BoundedExecutor, Priority
+
+
+class Client(BaseClient):
+    # Methods submitted with high priority by default
+    _HIGH_PRIORITY_METHODS = frozenset(
+        ("send_transaction", "send_transaction_and_wait", "send_transactions_and_wait")
+    )
+
+    def __init__(
+            self,
+            provider: Provider,
+            cadence: Optional[BlockCadence] = None,
+            cache: Optional[ResultCache] = None,
+            *,
+            max_workers: int = 10,
+            max_pending: int = 100,
+            reserved: int = 1,
+            data_store: Optional[DataStore] = None,
+    ):
+        """
+
+        :param provider: provider which sends requests
+        :param cadence: cadence of block production (default: one of its own)
+        :param cache: cache for immutable chain data (default: None, no cache)
+        :param max_workers: the number of threads for submit() and map()
+        :param max_pending: the maximum number of calls queued or running in them per priority
+        :param reserved: the number of threads which do not run low priority calls
+        :param data_store: store of blobs by hash (default: None, no store)
+        """
+        super().__init__(cadence)
+        self._provider = provider
+        self._cache = cache
+        self._data_store = data_store
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._reserved = min(reserved, max_workers - 1)
+        self._executor: Optional[BoundedExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._head: Optional[HeadTracker] = None
+        self._ex = ClientEx(self)
 
+    def __enter__(self):
+        return self
 
-class Client(object):
-    _BLOCK_GENERATION_INTERVAL_MS = 2000
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
-    def __init__(self, provider: Provider):
-        self._provider = provider
-        self._ex = ClientEx(self)
+    def close(self):
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+        if self._head is not None:
+            self._head.stop()
+
+        self._provider.close()
+        self._hooks.close()
 
     @property
     def ex(self) -> ClientEx:
         return self._ex
 
+    @property
+    def head(self) -> HeadTracker:
+        """The tracker of the last block shared by all users of this client
+
+        It polls only after start() or wait_for_height() is called.
+        """
+        with self._executor_lock:
+            if self._head is None:
+                self._head = HeadTracker(self)
+
+            return self._head
+
+    @property
+    def controller(self) -> Optional[AIMDController]:
+        """The controller of the provider which tunes concurrency and batch size
+        """
+        return getattr(self._provider, "controller", None)
+
+    @property
+    def cache(self) -> Optional[ResultCache]:
+        return self._cache
+
+    @property
+    def data_store(self) -> Optional[DataStore]:
+        """Blobs from get_data_by_hash() and objects decoded from them
+        """
+        return self._data_store
+
     def get_block_by_hash(self, block_hash: bytes, **kwargs) -> Union[Block, Dict[str, Any]]:
         params = {"hash": bytes_to_hex(block_hash)}
         request = RpcRequest(Method.GET_BLOCK_BY_HASH, params)
         response = self.send_request(request, **kwargs)
-        try:
-            return Block.from_dict(response.result)
-        except:
-            return response.result
+        return self._convert(response, self._get_block_converter(kwargs))
 
     def get_block_by_height(self, block_height: int, **kwargs) -> Union[Block, Dict[str, Any]]:
-        if not (isinstance(block_height, int) and block_height >= 0):
-            raise ValueError(f"Invalid params: {block_height}")
-
-        params = {"height": hex(block_height)}
-        request = RpcRequest(Method.GET_BLOCK_BY_HEIGHT, params)
+        request = self._create_block_by_height_request(block_height)
         response = self.send_request(request, **kwargs)
-        try:
-            return Block.from_dict(response.result)
-        except:
-            return response.result
+        return self._convert(response, self._get_block_converter(kwargs))
 
     def get_last_block(self, **kwargs) -> Union[Block, Dict[str, Any]]:
+        """Returns the last block, from the head tracker while it is running
+        """
+        block: Optional[Dict[str, Any]] = self._get_head_block(kwargs)
+        if block is not None:
+            response = RpcResponse({"jsonrpc": "2.0", "result": block})
+            return self._convert(response, self._get_block_converter(kwargs))
+
         request = RpcRequest(Method.GET_LAST_BLOCK)
         response = self.send_request(request, **kwargs)
-        try:
-            return Block.from_dict(response.result)
-        except:
-            return response.result
+        return self._convert(response, self._get_block_converter(kwargs))
 
     def get_transaction(
             self, tx_hash: bytes, **kwargs
@@ -83,33 +168,73 @@ class Client(object):
         params = {"txHash": bytes_to_hex(tx_hash)}
         request = RpcRequest(Method.GET_TRANSACTION_BY_HASH, params)
         response = self.send_request(request, **kwargs)
-        try:
-            return get_transaction(response.result)
-        except:
-            return response.result
+        return self._convert(response, self._get_transaction_converter(kwargs))
 
     def get_transaction_result(self, tx_hash: bytes, **kwargs) -> Union[TransactionResult, Dict[str, Any]]:
         params = {"txHash": bytes_to_hex(tx_hash)}
         request = RpcRequest(Method.GET_TRANSACTION_RESULT, params)
         response = self.send_request(request, **kwargs)
-        try:
-            return TransactionResult.from_dict(response.result)
-        except:
-            return response.result
+        return self._convert(response, self._get_transaction_result_converter(kwargs))
 
     def get_transaction_result_with_timeout(self, tx_hash: bytes, **kwargs) -> Union[TransactionResult, Dict[str, Any]]:
-        timeout_ms: int = kwargs.get("timeout_ms", 0)
+        """Polls the result of a transaction until timeout_ms in kwargs elapses
 
-        try_count = max(timeout_ms // self._BLOCK_GENERATION_INTERVAL_MS, 1)
-        for i in range(try_count):
-            time.sleep(self._BLOCK_GENERATION_INTERVAL_MS // 1000)
+        The first poll is sent at once and the next ones just after each block
+        expected by the cadence. Errors other than pending are raised at once.
+        The time spent on requests counts toward timeout_ms.
+        Each request is bound by "deadline" or "timeout" in kwargs.
+        """
+        kwargs = with_deadline(kwargs)
+        deadline: float = self._get_result_deadline(kwargs)
 
+        while True:
             try:
                 return self.get_transaction_result(tx_hash, **kwargs)
-            except SDKException as e:
-                # If this is the last try
-                if i == try_count - 1:
-                    raise e
+            except JSONRPCException as e:
+                if not is_pending(e):
+                    raise
+                error = e
+
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"Transaction result not available: {error}", error)
+
+            if self._cadence.is_stale():
+                self._observe_last_block(**kwargs)
+            time.sleep(max(min(self._cadence.get_delay(), deadline - time.monotonic()), 0))
+
+    def _get_head_height(self, **kwargs) -> int:
+        # A running head tracker saves a request
+        head: Optional[HeadTracker] = self._head
+        if head is not None and head.running and head.height is not None:
+            return head.height
+
+        last_block: Dict[str, Any] = self.send_request(
+            RpcRequest(Method.GET_LAST_BLOCK), **kwargs
+        ).result
+        self._cadence.observe_block(last_block)
+        return str_to_int(last_block["height"])
+
+    def _get_head_block(self, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        # The last block polled by a running head tracker unless it is stale
+        # or the caller asks for the response as it is
+        head: Optional[HeadTracker] = self._head
+        if head is None or not head.running or kwargs.get("raw") or self._cadence.is_stale():
+            return None
+
+        return head.block
+
+    def _observe_last_block(self, **kwargs):
+        # Only to keep track of the cadence, so any failure is ignored
+        if self._head is not None and self._head.running:
+            # The head tracker keeps the cadence up to date
+            return
+
+        try:
+            self._cadence.observe_block(self.get_last_block(**kwargs))
+        except TimeoutException:
+            raise
+        except Exception:
+            pass
 
     def get_total_supply(self, **kwargs) -> int:
         request = RpcRequest(Method.GET_TOTAL_SUPPLY)
@@ -131,37 +256,119 @@ class Client(object):
     def get_block(
             self, value: Union[bytes, int, None] = None, **kwargs
     ) -> Dict[str, str]:
-        if isinstance(value, bytes):
-            params = {"hash": bytes_to_hex(value)}
-        elif isinstance(value, int):
-            params = {"hash": hex(value)}
-        elif value is None:
-            params = None
-        else:
-            raise ArgumentException(f"Invalid argument: {value}")
-
-        request = RpcRequest(Method.GET_BLOCK, params)
+        request = self._create_block_request(value)
         response = self.send_request(request, **kwargs)
         return response.result
 
     def send_transaction_and_wait(
             self, tx: Union[builder.Transaction, Dict[str, Any]], **kwargs
     ) -> Union[TransactionResult, Dict[str, Any]]:
+        kwargs = with_deadline(kwargs)
         tx_hash: bytes = self.send_transaction(tx, **kwargs)
         return self.get_transaction_result_with_timeout(tx_hash, **kwargs)
 
-    def send_transaction(self, tx: Union[builder.Transaction, Dict[str, Any]], **kwargs) -> bytes:
-        if isinstance(tx, builder.Transaction):
-            tx = tx.to_dict()
-
-        private_key: Optional[bytes] = kwargs.get("private_key")
-        if isinstance(private_key, bytes):
-            tx: Dict[str, str] = to_str_dict(tx)
-            tx[Key.SIGNATURE] = generate_signature(tx, private_key)
-
-        if Key.SIGNATURE not in tx:
-            raise ArgumentException(f"Signature not found")
+    def send_transactions_and_wait(
+            self, txs: List[Union[builder.Transaction, Dict[str, Any]]], **kwargs
+    ) -> List[BatchItem]:
+        """Sends transactions and waits for their results until timeout_ms in kwargs elapses
+
+        Transactions are sent with batch requests of batch_size in kwargs
+        (default: the batch size of the controller or 100).
+        Each new block is fetched once and scanned for all pending transactions,
+        and only the results of transactions found in blocks are requested in bulk.
+
+        :return: items holding results in the same order as txs.
+            The result of an item raises the error in sending
+            or TimeoutException if the transaction is not confirmed in time.
+        """
+        kwargs = with_deadline(kwargs)
+        batch_size: Optional[int] = self._get_batch_size(kwargs)
+        deadline: float = self._get_result_deadline(kwargs)
+        if kwargs.get("deadline") is not None:
+            deadline = min(deadline, kwargs["deadline"])
+
+        # Blocks from the next one on can include the transactions
+        height: int = self._get_head_height(**kwargs) + 1
+
+        batch = Batch(self, batch_size, **kwargs)
+        for tx in txs:
+            tx = self._sign_transaction(tx, kwargs.get("private_key"))
+            batch.add(RpcRequest(Method.SEND_TRANSACTION, tx), hex_to_bytes)
+        batch.execute()
+
+        items: List[BatchItem] = []
+        pending: Dict[str, BatchItem] = {}
+        converter = _or_result(self._get_transaction_result_converter(kwargs))
+        for sent in batch.items:
+            params = {"txHash": sent.response.result} if sent.exception is None else None
+            item = BatchItem(RpcRequest(Method.GET_TRANSACTION_RESULT, params), converter)
+            if sent.exception is None:
+                pending[normalize_hash(sent.response.result)] = item
+            else:
+                item.set_exception(sent.exception)
+            items.append(item)
+
+        # Transactions found in blocks whose results are not received yet
+        found: List[BatchItem] = []
+        try:
+            while pending or found:
+                if found:
+                    found = self._get_transaction_results(found, **kwargs)
+
+                block: Optional[Dict[str, Any]] = self._get_raw_block(height, **kwargs) if pending else None
+                if block is not None:
+                    self._cadence.observe_block(block)
+                    for tx_hash in get_transaction_hashes(block):
+                        item = pending.pop(tx_hash, None)
+                        if item is not None:
+                            found.append(item)
+                    height += 1
+                elif time.monotonic() < deadline:
+                    time.sleep(max(min(self._cadence.get_delay(), deadline - time.monotonic()), 0))
+                else:
+                    break
+        except TimeoutException:
+            pass
+
+        for item in items:
+            if not item.done:
+                item.set_exception(
+                    TimeoutException("Transaction result not available", item.request)
+                )
+        return items
+
+    def _get_batch_size(self, kwargs: Dict[str, Any]) -> Optional[int]:
+        # None makes a batch follow the batch size of the controller
+        return kwargs.get("batch_size", None if self.controller else 100)
+
+    def _get_raw_block(self, height: int, **kwargs) -> Optional[Dict[str, Any]]:
+        # Returns None if the block is not produced yet
+        request = RpcRequest(Method.GET_BLOCK_BY_HEIGHT, {"height": hex(height)})
+        try:
+            return self.send_request(request, **kwargs).result
+        except JSONRPCException:
+            return None
+
+    def _get_transaction_results(self, items: List[BatchItem], **kwargs) -> List[BatchItem]:
+        # Returns items whose results are still pending
+        batch = Batch(self, self._get_batch_size(kwargs), **kwargs)
+        for item in items:
+            batch.add(item.request)
+        batch.execute()
+
+        ret = []
+        for item, fetched in zip(items, batch.items):
+            if fetched.exception is not None and is_pending(fetched.exception):
+                ret.append(item)
+            elif fetched.response is not None:
+                item.set_response(fetched.response)
+            else:
+                item.set_exception(fetched.exception)
+
+        return ret
 
+    def send_transaction(self, tx: Union[builder.Transaction, Dict[str, Any]], **kwargs) -> bytes:
+        tx = self._sign_transaction(tx, kwargs.get("private_key"))
         request = RpcRequest(Method.SEND_TRANSACTION, tx)
         response = self.send_request(request, **kwargs)
         return hex_to_bytes(response.result)
@@ -172,19 +379,28 @@ class Client(object):
         return response.result
 
     def estimate_step(self, tx: Union[builder.Transaction, Dict[str, Any]], **kwargs) -> int:
-        if isinstance(tx, builder.Transaction):
-            tx = tx.to_dict()
-
-        if Key.STEP_LIMIT in tx:
-            del tx[Key.STEP_LIMIT]
-        if Key.SIGNATURE in tx:
-            del tx[Key.SIGNATURE]
-
-        request = RpcRequest(Method.ESTIMATE_STEP, tx)
+        request = self._create_estimate_step_request(tx)
         response = self.send_request(request, **kwargs)
         return str_to_int(response.result)
 
     def get_status(self, **kwargs) -> Dict[str, str]:
+        """Returns the status of the last block, from the head tracker while it is running
+        """
+        block: Optional[Dict[str, Any]] = self._get_head_block(kwargs)
+        if block is not None:
+            # A block observed as Block has its hash in bytes
+            block_hash = block["block_hash"]
+            if isinstance(block_hash, bytes):
+                block_hash = block_hash.hex()
+            timestamp = block.get("time_stamp", block.get("timestamp"))
+            return {
+                "lastBlock": {
+                    "blockHeight": hex(str_to_int(block["height"])),
+                    "blockHash": "0x" + normalize_hash(block_hash),
+                    "timestamp": hex(str_to_int(timestamp)),
+                }
+            }
+
         params = {"filter": ["lastBlock"]}
         request = RpcRequest(Method.GET_STATUS, params)
         response = self.send_request(request, **kwargs)
@@ -198,27 +414,26 @@ class Client(object):
 
     @multimethod
     def send_request(self, request: RpcRequest, **kwargs) -> RpcResponse:
-        hooks: Dict[str, Union[Callable, List[Callable]]] = kwargs.get("hooks")
-        if "height" in kwargs:
-            height: int = kwargs["height"]
-            if height > -1:
-                request.params["height"] = kwargs["height"]
-
-        # hooks for request
-        ret: bool = self._dispatch_hook("request", hooks, request)
-        if not ret:
-            raise HookException(f"request hooks stopped", request)
-
-        response = self._provider.send(request)
-
-        # hooks for response
-        ret: bool = self._dispatch_hook("response", hooks, response)
-        if not ret:
-            raise HookException(f"response hooks stopped", response)
-
-        if response.error:
-            raise JSONRPCException(f"{response.error}", response)
-
+        """Sends a request and returns its response
+
+        With raw=True in kwargs, a RawRpcResponse is returned
+        which keeps the body undecoded and bypasses the cache.
+        """
+        self._before_send(request, kwargs)
+
+        # A raw response is not decoded to be cached
+        cache: Optional[ResultCache] = None if kwargs.get("raw") else self._cache
+        response: Optional[RpcResponse] = None
+        if cache is not None:
+            response = cache.get(request)
+
+        if response is None:
+            response = self._provider.send(request, **self._get_provider_kwargs(kwargs))
+            if cache is not None:
+                cache.put(request, response)
+
+        self._after_send(response, kwargs)
+        self._check_response(response)
         return response
 
     @multimethod
@@ -228,27 +443,143 @@ class Client(object):
         request = RpcRequest(method, params)
         return self.send_request(request, **kwargs)
 
-    @classmethod
-    def _dispatch_hook(cls, key: str, hooks, hook_data: Union[RpcRequest, RpcResponse]):
-        hooks = hooks or {}
-        hooks = hooks.get(key)
+    def send_batch(self, rpc_requests: List[RpcRequest], **kwargs) -> List[RpcResponse]:
+        """Sends requests with one JSON-RPC 2.0 batch request
+
+        Unlike send_request(), error responses are returned as they are
+        so that each request can be handled separately.
+        """
+        for request in rpc_requests:
+            self._before_send(request, kwargs)
+
+        responses = self._provider.send_batch(
+            rpc_requests, **self._get_provider_kwargs(kwargs)
+        )
 
-        if hooks:
-            if hasattr(hooks, "__call__"):
-                hooks = [hooks]
+        for response in responses:
+            self._after_send(response, kwargs)
 
-            for hook in hooks:
-                ret: Optional[bool] = hook(hook_data)
-                if ret is False:
-                    return False
+        return responses
 
-        return True
+    @property
+    def executor(self) -> BoundedExecutor:
+        """The executor of submit() and map() shared by the bulk paths of this client
+        """
+        return self._get_executor()
+
+    @property
+    def executor_stats(self) -> Dict[str, Dict[str, float]]:
+        """Time spent in queue and running per priority of submit() and map()
+        """
+        return self._get_executor().stats.to_dict()
+
+    def submit(self, method: str, *args, **kwargs) -> Future:
+        """Calls a method of this client in a worker thread
+
+        Blocks while max_pending calls of the same priority are pending.
+        "timeout" in kwargs includes the time waiting in the queue.
+        "priority" in kwargs is Priority.HIGH for transactions
+        and Priority.NORMAL for the others by default.
+
+        :param method: the name of a method like "get_transaction_result"
+        :return: a future of the result
+        """
+        func: Callable = self._get_method(method)
+        priority: Priority = kwargs.pop("priority", None)
+        if priority is None:
+            priority = (
+                Priority.HIGH
+                if method in self._HIGH_PRIORITY_METHODS
+                else Priority.NORMAL
+            )
+
+        return self._get_executor().submit_with_priority(
+            priority, func, *args, **with_deadline(kwargs)
+        )
+
+    def map(self, method: str, *iterables: Iterable[Any], **kwargs) -> Iterator[Any]:
+        """Yields results of a method of this client called with args from iterables
+
+        Calls run in worker threads and results are yielded in order.
+        Calls are submitted as results are consumed, so at most max_pending
+        calls are ahead of the caller.
+        Calls run with Priority.LOW unless "priority" is in kwargs,
+        so a bulk read does not delay calls from submit().
+
+        :param method: the name of a method like "get_transaction_result"
+        :param iterables: iterables of positional arguments like in builtin map()
+        :param kwargs: keyword arguments passed to every call
+        """
+        func: Callable = self._get_method(method)
+        priority: Priority = kwargs.pop("priority", Priority.LOW)
+        if kwargs:
+            func = functools.partial(func, **with_deadline(kwargs))
+
+        return self._get_executor().map(func, *iterables, priority=priority)
+
+    def iter_blocks(
+            self, start: int, end: int, window: Optional[int] = None, retries: int = 3, **kwargs
+    ) -> Iterator[Union[Block, Dict[str, Any]]]:
+        """Yields blocks from start to end - 1 in height order
+
+        Up to window blocks are requested ahead. See blocks.iter_blocks() for details.
+        Without window, the concurrency of the controller or 16 is used.
+        """
+        return iter_blocks(self, start, end, window, retries, **kwargs)
+
+    def follow_blocks(self, from_height: int, depth: int = 16, **kwargs) -> Iterator[Union[Block, Dict[str, Any]]]:
+        """Yields blocks from from_height on as soon as they are produced
+
+        Each block is checked against the previous one before it is yielded.
+        See blocks.follow_blocks() for details.
+        """
+        return follow_blocks(self, from_height, depth, **kwargs)
+
+    def batch(self, max_size: int = 0, **kwargs) -> Batch:
+        """Returns a batch which queues requests and sends them at once
+
+        :param max_size: the maximum number of requests in one batch request (0: no limit)
+        """
+        return Batch(self, max_size, **kwargs)
+
+    def _get_method(self, name: str) -> Callable:
+        func = None if name.startswith("_") else getattr(self, name, None)
+        if not callable(func) or name in ("close", "map", "submit"):
+            raise ArgumentException(f"Invalid method: {name}")
+
+        return func
+
+    def _get_executor(self) -> BoundedExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = BoundedExecutor(
+                    self._max_workers,
+                    self._max_pending,
+                    thread_name_prefix="client",
+                    reserved=self._reserved,
+                )
+
+            return self._executor
 
     def get_data_by_hash(self, data_hash: bytes, **kwargs) -> bytes:
+        """Returns the blob addressed by data_hash from data_store or the node
+
+        :raise DataTypeException: the blob from the node does not match data_hash
+        """
+        store: Optional[DataStore] = self._data_store
+        data: Optional[bytes] = None if store is None else store.get(data_hash)
+        if data is not None:
+            return data
+
         params = {"hash": bytes_to_hex(data_hash)}
         request = RpcRequest(Method.GET_DATA_BY_HASH, params)
         response = self.send_request(request, **kwargs)
-        return base64.standard_b64decode(response.result)
+        data = base64.standard_b64decode(response.result)
+        if store is None:
+            DataStore.verify(data_hash, data)
+        else:
+            store.put(data_hash, data)
+        return data
 
     def get_block_header_by_height(self, height: int, **kwargs) -> bytes:
         params = {"height": hex(height)}
@@ -274,16 +605,41 @@ class ClientEx:
         return BlockHeader.from_bytes(bs)
 
     def get_validators_by_height(self, height: int, **kwargs) -> Validators:
+        kwargs = with_deadline(kwargs)
         block_header: BlockHeader = self.get_block_header_by_height(height - 1, **kwargs)
-        bs = self._client.get_data_by_hash(block_header.next_validators_hash, **kwargs)
-        return Validators.from_bytes(bs)
+        return self._get_object_by_hash(block_header.next_validators_hash, Validators.from_bytes, **kwargs)
 
     def get_votes_by_height(self, height: int, **kwargs) -> Votes:
+        kwargs = with_deadline(kwargs)
         block_header: BlockHeader = self.get_block_header_by_height(height + 1, **kwargs)
-        bs: bytes = self._client.get_data_by_hash(block_header.votes_hash, **kwargs)
-        return Votes.from_bytes(bs)
-
-
-def create_client(url: str, version: int = 3) -> Client:
-    o = urlparse(url)
-    return Client(HTTPProvider(f"{o.scheme}://{o.netloc}", version))
+        return self._get_object_by_hash(block_header.votes_hash, Votes.from_bytes, **kwargs)
+
+    def _get_object_by_hash(self, data_hash: bytes, decoder: Callable[[bytes], Any], **kwargs) -> Any:
+        # The same validator set is shared by many blocks, so it is decoded once
+        store: Optional[DataStore] = self._client.data_store
+        if store is None:
+            return decoder(self._client.get_data_by_hash(data_hash, **kwargs))
+
+        data: Optional[bytes] = None
+        if data_hash not in store:
+            data = self._client.get_data_by_hash(data_hash, **kwargs)
+
+        obj = store.get_object(data_hash, decoder)
+        if obj is None:
+            # Too large to be stored or evicted meanwhile
+            if data is None:
+                data = self._client.get_data_by_hash(data_hash, **kwargs)
+            obj = decoder(data)
+        return obj
+
+
+def create_client(url: Union[str, List[str]], version: int = 3) -> Client:
+    if isinstance(url, str):
+        o = urlparse(url)
+        return Client(HTTPProvider(f"{o.scheme}://{o.netloc}", version))
+
+    base_urls = []
+    for item in url:
+        o = urlparse(item)
+        base_urls.append(f"{o.scheme}://{o.netloc}")
+    return Client(MultiEndpointProvider(base_urls, version))
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers to wait for transactions in step with block production
+"""
+
+__all__ = (
+    "BlockCadence",
+    "PENDING_ERROR_CODES",
+    "get_transaction_hashes",
+    "is_pending",
+    "normalize_hash",
+)
+
+import math
+import threading
+import time
+from typing import Any, Dict, List, Optional, Union
+
+from .data.block import Block
+from .exception import JSONRPCException
+from .utils import str_to_int
+
+# Pending, executing and not found (not propagated yet) in goloop
+PENDING_ERROR_CODES = frozenset((-31002, -31003, -31004))
+
+# loopchain replies to a pending transaction with -32602 and one of these messages
+_PENDING_MESSAGES = ("pending", "executing")
+
+
+def is_pending(e: Exception) -> bool:
+    """Returns True if e means that a transaction is not in a block yet
+    """
+    if not isinstance(e, JSONRPCException):
+        return False
+
+    error: Optional[Dict[str, Any]] = getattr(e.user_data, "error", None)
+    if not isinstance(error, dict):
+        return False
+
+    if error.get("code") in PENDING_ERROR_CODES:
+        return True
+
+    message = str(error.get("message", "")).lower()
+    return any(value in message for value in _PENDING_MESSAGES)
+
+
+def normalize_hash(value: str) -> str:
+    """Returns a hash in lowercase hex without "0x" to compare hashes in any format
+    """
+    value = value.lower()
+    return value[2:] if value.startswith("0x") else value
+
+
+def get_transaction_hashes(block: Dict[str, Any]) -> List[str]:
+    """Returns normalized hashes of transactions in a block from icx_getBlockByHeight
+
+    Transactions are read from the raw block to avoid parsing them.
+    """
+    ret = []
+    for tx in block.get("confirmed_transaction_list", ()):
+        # txHash in v3 and tx_hash in v2
+        tx_hash: Optional[str] = tx.get("txHash") or tx.get("tx_hash")
+        if isinstance(tx_hash, str):
+            ret.append(normalize_hash(tx_hash))
+
+    return ret
+
+
+class BlockCadence(object):
+    """Estimates when the next block can be observed from blocks observed so far
+
+    The interval between blocks is a moving average of block timestamps.
+    The offset between node and local clocks includes the time
+    which a block takes to be available here.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        *,
+        margin: float = 0.05,
+        decay: float = 0.1,
+        max_age: float = 60.0,
+    ):
+        """
+
+        :param interval: initial interval between blocks in seconds
+        :param margin: seconds to wait after the expected block time
+        :param decay: weight of a new interval in the moving average
+        :param max_age: seconds after which an observation is regarded as stale
+        """
+        self._interval = interval
+        self._margin = margin
+        self._decay = decay
+        self._max_age = max_age
+
+        self._height: Optional[int] = None
+        # Block timestamp in seconds by the node clock
+        self._timestamp: Optional[float] = None
+        # Local time when a block is available minus its timestamp
+        self._offset: Optional[float] = None
+        self._observed_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def height(self) -> Optional[int]:
+        """The highest block height observed
+        """
+        return self._height
+
+    def is_stale(self) -> bool:
+        return (
+            self._height is None or time.monotonic() - self._observed_at > self._max_age
+        )
+
+    def observe(self, height: int, timestamp: int, received: Optional[float] = None):
+        """
+
+        :param height: block height
+        :param timestamp: block timestamp in microseconds
+        :param received: time.time() when the block was received (default: now)
+        """
+        if received is None:
+            received = time.time()
+        seconds = timestamp / 10 ** 6
+
+        with self._lock:
+            new: bool = self._height is None or height > self._height
+            if self._height is not None and height > self._height:
+                interval = (seconds - self._timestamp) / (height - self._height)
+                if interval > 0:
+                    self._interval += self._decay * (interval - self._interval)
+
+            if self._height is None or height >= self._height:
+                self._height = height
+                self._timestamp = seconds
+                self._observed_at = time.monotonic()
+
+            if new:
+                # A smaller offset is closer to when blocks become available,
+                # so it is taken at once. A larger one moves the offset by decay,
+                # so that one early outlier does not skew every later estimate.
+                offset = received - seconds
+                if self._offset is None or offset < self._offset:
+                    self._offset = offset
+                else:
+                    self._offset += self._decay * (offset - self._offset)
+
+    def observe_block(self, block: Union[Block, Dict[str, Any]]):
+        if isinstance(block, Block):
+            self.observe(block.height, block.timestamp)
+        elif isinstance(block, dict):
+            timestamp = block.get("time_stamp", block.get("timestamp"))
+            self.observe(str_to_int(block["height"]), str_to_int(timestamp))
+
+    def get_delay(self, now: Optional[float] = None) -> float:
+        """Returns seconds until just after the next block is expected
+
+        :param now: time.time() (default: now)
+        """
+        if now is None:
+            now = time.time()
+
+        with self._lock:
+            if self._timestamp is None:
+                return self._interval + self._margin
+
+            last: float = self._timestamp + self._offset
+            count: int = math.floor((now - last) / self._interval) + 1
+            return last + count * self._interval - now + self._margin
+
+    def get_wait(self, height: int, now: Optional[float] = None) -> float:
+        """Returns seconds until just after block height is expected, or 0 if it is due
+
+        :param height: block height
+        :param now: time.time() (default: now)
+        """
+        if now is None:
+            now = time.time()
+
+        with self._lock:
+            if self._timestamp is None:
+                return 0.0
+
+            last: float = self._timestamp + self._offset
+            expected: float = last + (height - self._height) * self._interval
+            return max(expected - now + self._margin, 0.0)
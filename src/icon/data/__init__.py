@@ -20,6 +20,10 @@ __all__ = (
     "Block",
     "BlockHeader",
     "EventLog",
+    "LazyBlock",
+    "LazyTransaction",
+    "LazyTransactionResult",
+    "RawRpcResponse",
     "RpcRequest",
     "RpcResponse",
     "Transaction",
@@ -34,10 +38,10 @@ from .address import (
     SYSTEM_SCORE_ADDRESS,
     GOVERNANCE_SCORE_ADDRESS,
 )
-from .block import Block
+from .block import Block, LazyBlock
 from .block_header import BlockHeader
 from .event_log import EventLog
 from .rpc_request import RpcRequest
-from .rpc_response import RpcResponse
-from .transaction import Transaction
-from .transaction_result import TransactionResult
+from .rpc_response import RawRpcResponse, RpcResponse
+from .transaction import LazyTransaction, Transaction
+from .transaction_result import LazyTransactionResult, TransactionResult
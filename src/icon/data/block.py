@@ -7,7 +7,13 @@ import json
 from typing import Dict, List, Union, Optional, Any
 
 from .address import Address
-from .transaction import get_transaction, BaseTransaction, Transaction
+from .lazy import Lazy
+from .transaction import (
+    get_lazy_transaction,
+    get_transaction,
+    BaseTransaction,
+    Transaction,
+)
 from ..builder.key import Key
 from ..utils import hex_to_bytes, str_to_int, bytes_to_hex
 
@@ -45,6 +51,13 @@ def _get_transactions(
     return [get_transaction(tx_dict) for tx_dict in block_dict[key]]
 
 
+def _get_lazy_transactions(
+    block_dict: Dict[str, Any]
+) -> List[Union[BaseTransaction, Transaction]]:
+    key = "confirmed_transaction_list"
+    return [get_lazy_transaction(tx_dict) for tx_dict in block_dict[key]]
+
+
 def _default(o: Any) -> Any:
     if isinstance(o, bytes):
         return bytes_to_hex(o)
@@ -130,26 +143,24 @@ class Block(object):
 
     def to_dict(self) -> Dict[str, Any]:
         ret = {
-            "version": self._version,
-            "height": self._height,
-            "block_hash": self._hash,
-            "prev_block_hash": self._prev_hash,
-            "merkle_tree_root_hash": self._merkle_tree_root_hash,
-            "timestamp": self._timestamp,
-            "peer_id": self._peer_id,
-            "signature": self._signature,
-            "transactions": self._transactions,
+            "version": self.version,
+            "height": self.height,
+            "block_hash": self.block_hash,
+            "prev_block_hash": self.prev_block_hash,
+            "merkle_tree_root_hash": self.merkle_tree_root_hash,
+            "timestamp": self.timestamp,
+            "peer_id": self.peer_id,
+            "signature": self.signature,
+            "transactions": self.transactions,
         }
 
-        if self._next_leader:
-            ret["next_leader"] = self._next_leader
+        if self.next_leader:
+            ret["next_leader"] = self.next_leader
 
         return ret
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Block:
-        print(data)
-
         version: str = data[Key.VERSION]
         height: int = str_to_int(data["height"])
         block_hash: bytes = hex_to_bytes(data["block_hash"])
@@ -173,3 +184,62 @@ class Block(object):
             signature=signature,
             transactions=transactions,
         )
+
+
+class LazyBlock(Lazy, Block):
+    """Block which converts each field of a raw block on first access
+
+    Transactions are converted lazily as well.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        Lazy.__init__(self, data)
+
+    @property
+    def version(self) -> str:
+        return self._data[Key.VERSION]
+
+    @property
+    def height(self) -> int:
+        return self._get("height", lambda data: str_to_int(data["height"]))
+
+    @property
+    def block_hash(self) -> bytes:
+        return self._get("block_hash", lambda data: hex_to_bytes(data["block_hash"]))
+
+    @property
+    def prev_block_hash(self) -> bytes:
+        return self._get(
+            "prev_block_hash", lambda data: hex_to_bytes(data["prev_block_hash"])
+        )
+
+    @property
+    def timestamp(self) -> int:
+        return self._get("timestamp", _get_timestamp)
+
+    @property
+    def merkle_tree_root_hash(self) -> bytes:
+        return self._get(
+            "merkle_tree_root_hash",
+            lambda data: hex_to_bytes(data["merkle_tree_root_hash"]),
+        )
+
+    @property
+    def peer_id(self) -> Address:
+        return self._get("peer_id", lambda data: Address.from_string(data["peer_id"]))
+
+    @property
+    def next_leader(self) -> Optional[Address]:
+        return self._get("next_leader", _get_next_leader)
+
+    @property
+    def signature(self) -> bytes:
+        return self._get("signature", _get_signature)
+
+    @property
+    def transactions(self) -> List[Transaction]:
+        return self._get("transactions", _get_lazy_transactions)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> LazyBlock:
+        return cls(data)
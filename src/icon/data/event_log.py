@@ -69,8 +69,9 @@ class EventLog(object):
     @classmethod
     def from_dict(cls, event_log: Dict) -> EventLog:
         score_address = Address.from_string(event_log["scoreAddress"])
-        indexed = event_log["indexed"]
-        data = event_log["data"]
+        # Copied not to convert the values in event_log
+        indexed = list(event_log["indexed"])
+        data = list(event_log["data"])
 
         signature = indexed[0]
         name, types = cls.parse_signature(signature)
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from typing import Any, Callable, Dict
+
+
+class Lazy(object):
+    """Keeps a raw dict from a response and converts its fields on first access
+
+    A converted field is kept to be returned again.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+        self._values: Dict[str, Any] = {}
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        return self._data
+
+    def _get(self, name: str, func: Callable[[Dict[str, Any]], Any]) -> Any:
+        try:
+            return self._values[name]
+        except KeyError:
+            value = self._values[name] = func(self._data)
+            return value
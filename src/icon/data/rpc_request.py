@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 
+import itertools
 import json
 import random
-from threading import Lock
 from typing import Optional, Dict, Any
 
 from ..utils import to_str_dict
@@ -11,8 +11,8 @@ _MAX_ID = 0x7FFFFFFF
 
 
 class RpcRequest(object):
-    _next_id = random.randint(0, _MAX_ID)
-    _id_lock = Lock()
+    # next() on a count is atomic, so ids are unique among threads without a lock
+    _ids = itertools.count(random.randint(0, _MAX_ID))
 
     def __init__(self, method: str, params: Optional[Dict[str, Any]] = None):
         self._id = self._get_next_id()
@@ -26,11 +26,7 @@ class RpcRequest(object):
 
     @classmethod
     def _get_next_id(cls) -> int:
-        with cls._id_lock:
-            _id = cls._next_id
-            cls._next_id = (cls._next_id + 1) % _MAX_ID
-
-        return _id
+        return next(cls._ids) % _MAX_ID
 
     @property
     def id(self) -> int:
@@ -1,17 +1,38 @@
 # -*- coding: utf-8 -*-
+from __future__ import annotations
 
 import json
-from typing import Dict, Optional, Union, Any
+import re
+from json.decoder import scanstring
+from threading import Lock
+from typing import Dict, Optional, Union, Any, Callable, Tuple
+
+
+# A JSON value of id: a number, a string or null
+_ID = rb'(-?\d+|"(?:[^"\\]|\\.)*"|null)'
+# id as the last member of the envelope
+_TAIL_ID = re.compile(rb',\s*"id"\s*:\s*' + _ID + rb"\s*\}\s*$")
+_WHITESPACE = re.compile(r"\s*")
+_NON_ASCII = re.compile(rb"[\x80-\xff]")
+# Members before result are small, so only the head of a body is scanned for them
+_HEAD_SIZE = 4096
+_DECODER = json.JSONDecoder()
 
 
 class RpcResponse(object):
     def __init__(self, json_text: Dict[str, Any]):
         self._json = json_text
         self._user_data = None
+        self._converted: Dict[Callable[[Any], Any], Any] = {}
+        self._lock = Lock()
 
     def __str__(self):
         return json.dumps(self._json, indent=4)
 
+    @property
+    def id(self) -> Any:
+        return self._json.get("id")
+
     @property
     def error(self) -> Optional[Dict[str, Union[int, str]]]:
         return self._json.get("error")
@@ -27,3 +48,163 @@ class RpcResponse(object):
     @user_data.setter
     def user_data(self, value: Any):
         self._user_data = value
+
+    def with_id(self, _id: Any) -> RpcResponse:
+        """Returns this response to a request with _id
+
+        The result and objects converted from it are shared with this response.
+        """
+        if self.id == _id:
+            return self
+
+        response = RpcResponse({**self._json, "id": _id})
+        response._user_data = self._user_data
+        response._converted = self._converted
+        response._lock = self._lock
+        return response
+
+    def convert(self, func: Callable[[Any], Any]) -> Any:
+        """Returns func(result) which is computed only once per func
+
+        All callers sharing this response get the same converted object.
+        """
+        with self._lock:
+            if func not in self._converted:
+                self._converted[func] = func(self.result)
+
+            return self._converted[func]
+
+
+class RawRpcResponse(RpcResponse):
+    """Response which keeps the body as it is received
+
+    Only id and error are read from the top-level members of the envelope
+    before result, and from id at its end. A response with result has no error.
+    The whole body is decoded on the first access to result, or when the envelope
+    is not in this form, so that a proxy can forward content
+    without decoding and encoding it again.
+    """
+
+    def __init__(self, content: bytes, decode: Callable[[bytes], Any] = json.loads):
+        """
+
+        :param content: the body of a response
+        :param decode: the function to decode content
+        """
+        super().__init__(None)
+        self._content = content
+        self._decode = decode
+        self._envelope: Optional[Dict[str, Any]] = None
+
+    def __str__(self):
+        return self._content.decode("utf-8")
+
+    @property
+    def content(self) -> bytes:
+        return self._content
+
+    @property
+    def id(self) -> Any:
+        return self._get_id()[0]
+
+    @property
+    def error(self) -> Optional[Dict[str, Union[int, str]]]:
+        if b'"error"' not in self._content:
+            return None
+
+        envelope: Optional[Dict[str, Any]] = self._get_envelope()
+        if envelope is None:
+            return self._get_json().get("error")
+        return envelope.get("error")
+
+    @property
+    def result(self) -> Optional[Union[str, Dict[str, str]]]:
+        return self._get_json().get("result")
+
+    def with_id(self, _id: Any) -> RawRpcResponse:
+        """Returns this response to a request with _id, rewriting only id in content
+        """
+        old_id, span = self._get_id()
+        if old_id == _id:
+            return self
+
+        if span is None:
+            content = json.dumps({**self._get_json(), "id": _id}).encode("utf-8")
+        else:
+            start, end = span
+            value: bytes = json.dumps(_id).encode("utf-8")
+            content = self._content[:start] + value + self._content[end:]
+
+        response = RawRpcResponse(content, self._decode)
+        response._user_data = self._user_data
+        return response
+
+    def _get_id(self) -> Tuple[Any, Optional[Tuple[int, int]]]:
+        # Returns id and its span in content, or None for the span if it is not found
+        envelope: Optional[Dict[str, Any]] = self._get_envelope()
+        if envelope is not None and "id" in envelope:
+            return envelope["id"], envelope["id:span"]
+
+        tail: int = max(len(self._content) - 64, 0)
+        match = _TAIL_ID.search(self._content, tail)
+        if envelope is not None and match is not None:
+            return json.loads(match.group(1)), match.span(1)
+
+        return self._get_json().get("id"), None
+
+    def _get_envelope(self) -> Optional[Dict[str, Any]]:
+        if self._envelope is None:
+            self._envelope = _scan_envelope(self._content[:_HEAD_SIZE])
+
+        return self._envelope or None
+
+    def _get_json(self) -> Dict[str, Any]:
+        if self._json is None:
+            data = self._decode(self._content)
+            self._json = data if isinstance(data, dict) else {}
+
+        return self._json
+
+
+def _scan_envelope(head: bytes) -> Dict[str, Any]:
+    """Returns the top-level members of an envelope before result
+
+    "id:span" holds the span of id in head, and "result" is True if result follows.
+    An empty dict is returned if head is not an envelope in this form.
+    """
+    # A byte is a character in latin-1, so offsets in text are offsets in head
+    text: str = head.decode("latin-1")
+    members: Dict[str, Any] = {}
+    try:
+        i = _WHITESPACE.match(text, 0).end()
+        if text[i] != "{":
+            return {}
+
+        while True:
+            i = _WHITESPACE.match(text, i + 1).end()
+            if text[i] != '"':
+                return {}
+            key, i = scanstring(text, i + 1)
+            i = _WHITESPACE.match(text, i).end()
+            if text[i] != ":":
+                return {}
+            i = _WHITESPACE.match(text, i + 1).end()
+            if key == "result":
+                members["result"] = True
+                return members
+
+            start = i
+            members[key], i = _DECODER.raw_decode(text, i)
+            if _NON_ASCII.search(head, start, i):
+                # Like a message of error in UTF-8
+                members[key] = json.loads(head[start:i])
+            if key == "id":
+                members["id:span"] = start, i
+            i = _WHITESPACE.match(text, i).end()
+            if text[i] == "}":
+                return members
+            if text[i] != ",":
+                return {}
+    except (IndexError, ValueError):
+        # Cut off at the end of head or not JSON
+        return {}
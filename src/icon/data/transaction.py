@@ -5,9 +5,10 @@ from __future__ import annotations
 import base64
 import json
 from enum import IntEnum, auto
-from typing import Optional, Dict, Union, Any
+from typing import Callable, Optional, Dict, Union, Any
 
 from .address import Address
+from .lazy import Lazy
 from ..builder.key import Key
 from ..exception import JSONRPCException
 from ..utils import str_to_int, hex_to_bytes, bytes_to_hex
@@ -24,6 +25,12 @@ class DataType(IntEnum):
         return self.name.lower()
 
 
+def _get_optional(
+    data: Dict[str, Any], key: str, func: Callable[[Any], Any]
+) -> Optional[Any]:
+    return func(data[key]) if key in data else None
+
+
 def get_transaction(data: Dict[str, Any]) -> Union[Transaction, BaseTransaction]:
     data_type: str = data.get(Key.DATA_TYPE, "")
 
@@ -33,6 +40,16 @@ def get_transaction(data: Dict[str, Any]) -> Union[Transaction, BaseTransaction]
         return Transaction.from_dict(data)
 
 
+def get_lazy_transaction(data: Dict[str, Any]) -> Union[Transaction, BaseTransaction]:
+    data_type: str = data.get(Key.DATA_TYPE, "")
+
+    # A base transaction is one per block, so it is converted at once
+    if data_type == "base":
+        return BaseTransaction.from_dict(data)
+    else:
+        return LazyTransaction.from_dict(data)
+
+
 class _JSONEncoder(json.JSONEncoder):
     def default(self, o: Any) -> Any:
         if isinstance(o, Address):
@@ -160,6 +177,10 @@ class Transaction(object):
     def value(self) -> int:
         return self._value
 
+    @property
+    def step_limit(self) -> int:
+        return self._step_limit
+
     @property
     def data_type(self) -> Optional[str]:
         return self._data_type
@@ -179,14 +200,14 @@ class Transaction(object):
 
     def to_dict(self) -> Dict[str, Any]:
         ret = {
-            "version": self._version,
-            "nid": self._nid,
-            "from": self._from,
-            "to": self._to,
-            "value": self._value,
-            "stepLimit": self._step_limit,
-            "timestamp": self._timestamp,
-            "signature": bytes_to_hex(self._signature),
+            "version": self.version,
+            "nid": self.nid,
+            "from": self.from_,
+            "to": self.to,
+            "value": self.value,
+            "stepLimit": self.step_limit,
+            "timestamp": self.timestamp,
+            "signature": bytes_to_hex(self.signature),
         }
 
         keys = (
@@ -199,13 +220,13 @@ class Transaction(object):
             "blockHash",
         )
         values = (
-            self._nonce,
-            self._data_type,
-            self._data,
-            self._tx_index,
-            self._tx_hash,
-            self._block_height,
-            self._block_hash,
+            self.nonce,
+            self.data_type,
+            self.data,
+            self.tx_index,
+            self.tx_hash,
+            self.block_height,
+            self.block_hash,
         )
         for key, value in zip(keys, values):
             if value is not None:
@@ -270,6 +291,86 @@ class Transaction(object):
         return tx_dict.get("data")
 
 
+class LazyTransaction(Lazy, Transaction):
+    """Transaction which converts each field of a raw transaction on first access
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        Lazy.__init__(self, data)
+
+    @property
+    def version(self) -> int:
+        return self._get("version", lambda data: str_to_int(data["version"]))
+
+    @property
+    def nid(self) -> int:
+        return self._get("nid", lambda data: str_to_int(data.get("nid", "0x0")))
+
+    @property
+    def from_(self) -> Address:
+        return self._get("from", lambda data: Address.from_string(data["from"]))
+
+    @property
+    def to(self) -> Address:
+        return self._get("to", lambda data: Address.from_string(data["to"]))
+
+    @property
+    def tx_index(self) -> Optional[int]:
+        return self._get(
+            "txIndex", lambda data: _get_optional(data, "txIndex", str_to_int)
+        )
+
+    @property
+    def tx_hash(self) -> Optional[bytes]:
+        return self._get(
+            "txHash", lambda data: _get_optional(data, "txHash", hex_to_bytes)
+        )
+
+    @property
+    def block_height(self) -> Optional[int]:
+        return self._get(
+            "blockHeight", lambda data: _get_optional(data, "blockHeight", str_to_int)
+        )
+
+    @property
+    def block_hash(self) -> Optional[bytes]:
+        return self._get(
+            "blockHash", lambda data: _get_optional(data, "blockHash", hex_to_bytes)
+        )
+
+    @property
+    def timestamp(self) -> int:
+        return self._get("timestamp", self._get_timestamp)
+
+    @property
+    def nonce(self) -> Optional[int]:
+        return self._get("nonce", lambda data: self._get_nonce(data.get("nonce")))
+
+    @property
+    def value(self) -> int:
+        return self._get("value", lambda data: str_to_int(data.get("value", "0x0")))
+
+    @property
+    def step_limit(self) -> int:
+        return self._get("stepLimit", lambda data: str_to_int(data["stepLimit"]))
+
+    @property
+    def data_type(self) -> Optional[str]:
+        return self._data.get("dataType")
+
+    @property
+    def data(self) -> Optional[Any]:
+        return self._get_data(self._data)
+
+    @property
+    def signature(self) -> bytes:
+        return self._get("signature", lambda data: base64.b64decode(data["signature"]))
+
+    @classmethod
+    def from_dict(cls, tx_dict: Dict[str, Any]) -> LazyTransaction:
+        return cls(tx_dict)
+
+
 class BaseTransaction(object):
     class PRep(object):
         def __init__(self, irep: int, rrep: int, total_delegation: int, value: int):
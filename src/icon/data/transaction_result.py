@@ -15,7 +15,7 @@
 
 from __future__ import annotations
 
-__all__ = "TransactionResult"
+__all__ = ("LazyTransactionResult", "TransactionResult")
 
 import json
 from enum import IntEnum
@@ -23,6 +23,7 @@ from typing import List, Dict, Optional, Any
 
 from .address import Address
 from .event_log import EventLog
+from .lazy import Lazy
 from ..utils import (
     bytes_to_hex,
     hex_to_bytes,
@@ -110,7 +111,7 @@ class TransactionResult(object):
 
     @property
     def success(self) -> bool:
-        return self._status == self.Status.SUCCESS
+        return self.status == self.Status.SUCCESS
 
     @property
     def status(self) -> Status:
@@ -170,24 +171,24 @@ class TransactionResult(object):
 
     def to_dict(self) -> Dict[str, Any]:
         ret = {
-            "status": self._status,
-            "to": self._to,
-            "blockHeight": self._block_height,
-            "blockHash": self._block_hash,
-            "txIndex": self._tx_index,
-            "txHash": self._tx_hash,
-            "stepPrice": self._step_price,
-            "stepUsed": self._step_used,
-            "fee": self._fee,
-            "cumulativeStepUsed": self._cumulative_step_used,
-            "logsBloom": self._logs_bloom,
-            "eventLogs": [event_log.to_dict() for event_log in self._event_logs],
+            "status": self.status,
+            "to": self.to,
+            "blockHeight": self.block_height,
+            "blockHash": self.block_hash,
+            "txIndex": self.tx_index,
+            "txHash": self.tx_hash,
+            "stepPrice": self.step_price,
+            "stepUsed": self.step_used,
+            "fee": self.fee,
+            "cumulativeStepUsed": self.cumulative_step_used,
+            "logsBloom": self.logs_bloom,
+            "eventLogs": [event_log.to_dict() for event_log in self.event_logs],
         }
 
-        if self._failure is not None:
-            ret["failure"] = self._failure.to_dict()
-        if isinstance(self._score_address, Address):
-            ret["scoreAddress"] = self._score_address
+        if self.failure is not None:
+            ret["failure"] = self.failure.to_dict()
+        if isinstance(self.score_address, Address):
+            ret["scoreAddress"] = self.score_address
 
         return ret
 
@@ -234,3 +235,90 @@ class TransactionResult(object):
     @classmethod
     def _parse_event_logs(cls, event_logs: List[Dict[str, str]]) -> List[EventLog]:
         return [EventLog.from_dict(event_log) for event_log in event_logs]
+
+
+class LazyTransactionResult(Lazy, TransactionResult):
+    """TransactionResult which converts each field of a raw result on first access
+
+    Event logs, which take the most time to convert, are converted all together
+    when event_logs is read first.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        Lazy.__init__(self, data)
+
+    @property
+    def status(self) -> TransactionResult.Status:
+        return self._get(
+            "status", lambda data: TransactionResult.Status(str_to_int(data["status"]))
+        )
+
+    @property
+    def failure(self) -> Optional[TransactionResult.Failure]:
+        return self._get(
+            "failure",
+            lambda data: TransactionResult.Failure.from_dict(data["failure"])
+            if "failure" in data
+            else None,
+        )
+
+    @property
+    def tx_hash(self) -> bytes:
+        return self._get("txHash", lambda data: hex_to_bytes(data["txHash"]))
+
+    @property
+    def tx_index(self) -> int:
+        return self._get("txIndex", lambda data: str_to_int(data["txIndex"]))
+
+    @property
+    def to(self) -> Address:
+        return self._get("to", lambda data: Address.from_string(data["to"]))
+
+    @property
+    def block_height(self) -> int:
+        return self._get("blockHeight", lambda data: str_to_int(data["blockHeight"]))
+
+    @property
+    def block_hash(self) -> bytes:
+        return self._get("blockHash", lambda data: hex_to_bytes(data["blockHash"]))
+
+    @property
+    def step_price(self) -> int:
+        return self._get("stepPrice", lambda data: str_to_int(data["stepPrice"]))
+
+    @property
+    def step_used(self) -> int:
+        return self._get("stepUsed", lambda data: str_to_int(data["stepUsed"]))
+
+    @property
+    def cumulative_step_used(self) -> int:
+        return self._get(
+            "cumulativeStepUsed", lambda data: str_to_int(data["cumulativeStepUsed"])
+        )
+
+    @property
+    def score_address(self) -> Optional[Address]:
+        return self._get(
+            "scoreAddress",
+            lambda data: Address.from_string(data["scoreAddress"])
+            if "scoreAddress" in data
+            else None,
+        )
+
+    @property
+    def fee(self) -> int:
+        return self.step_price * self.step_used
+
+    @property
+    def logs_bloom(self) -> Optional[bytes]:
+        return self._get("logsBloom", lambda data: hex_to_bytes(data.get("logsBloom")))
+
+    @property
+    def event_logs(self) -> List[EventLog]:
+        return self._get(
+            "eventLogs", lambda data: self._parse_event_logs(data["eventLogs"])
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> LazyTransactionResult:
+        return cls(data)
@@ -18,6 +18,8 @@ class SDKException(Exception):
         BUILDER_ERROR = 8
         ARG_ERROR = 9
         HOOK_ERROR = 10
+        TIMEOUT_ERROR = 11
+        TRANSPORT_ERROR = 12
 
         def __str__(self) -> str:
             return str(self.name).capitalize().replace("_", " ")
@@ -111,5 +113,14 @@ class HookException(SDKException):
 
 
 class TimeoutException(SDKException):
+    """Error when a request is not completed before its deadline"""
+
     def __init__(self, message: Optional[str], user_data: Any = None):
-        super().__init__(SDKException.Code.HOOK_ERROR, message, user_data)
+        super().__init__(SDKException.Code.TIMEOUT_ERROR, message, user_data)
+
+
+class TransportException(SDKException):
+    """Error when a request cannot reach a node or its response is broken"""
+
+    def __init__(self, message: Optional[str], user_data: Any = None):
+        super().__init__(SDKException.Code.TRANSPORT_ERROR, message, user_data)
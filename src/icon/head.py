@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tracker of the head of the chain shared by all users of a client
+"""
+
+from __future__ import annotations
+
+__all__ = ("HeadTracker",)
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .builder.method import Method
+from .confirmation import normalize_hash
+from .data.block import Block
+from .data.rpc_request import RpcRequest
+from .exception import TimeoutException
+from .hooks import Hooks
+from .utils import str_to_int
+
+if TYPE_CHECKING:
+    from .client import Client
+
+
+class HeadTracker(object):
+    """Polls the last block once per block interval and publishes the head
+
+    A block is requested just after the time expected by client.cadence,
+    so one request per block serves every user of the client.
+    Blocks observed elsewhere, like in follow_blocks(), can be fed with observe_block().
+
+    Subscribers are called with the last block under the "head" key of hooks
+    when the height rises. Callers can block in wait_for_height()
+    or await async_wait_for_height() instead of polling.
+    """
+
+    def __init__(self, client: Client, min_interval: float = 0.1):
+        """
+
+        :param client: client which sends requests
+        :param min_interval: the minimum seconds between polls
+        """
+        self._client = client
+        self._min_interval = min_interval
+
+        self._height: Optional[int] = None
+        self._block_hash: Optional[str] = None
+        self._block: Optional[Dict[str, Any]] = None
+        self._condition = threading.Condition()
+        # Events of coroutines waiting in async_wait_for_height()
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+        self._hooks = Hooks()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._polls = 0
+
+    def __enter__(self) -> HeadTracker:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @property
+    def height(self) -> Optional[int]:
+        """The highest block height observed
+        """
+        return self._height
+
+    @property
+    def block_hash(self) -> Optional[str]:
+        """The hash of the head block in hex without "0x"
+        """
+        return self._block_hash
+
+    @property
+    def block(self) -> Optional[Dict[str, Any]]:
+        """The head block as it is in the response
+        """
+        return self._block
+
+    @property
+    def polls(self) -> int:
+        """The number of getLastBlock requests sent
+        """
+        return self._polls
+
+    @property
+    def hooks(self) -> Hooks:
+        """Hooks called with the head block under "head" when the height rises
+        """
+        return self._hooks
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def subscribe(
+        self, callback: Callable[[Dict[str, Any]], Any], blocking: bool = False
+    ):
+        """Calls callback with each new head block
+
+        :param callback: a callable which takes a block
+        :param blocking: if True, callback is called in the polling thread
+        """
+        self._hooks.add("head", callback, blocking)
+
+    def unsubscribe(self, callback: Callable[[Dict[str, Any]], Any]):
+        self._hooks.remove("head", callback)
+
+    def start(self):
+        """Starts polling in a daemon thread if it is not running
+        """
+        with self._condition:
+            if self.running:
+                return
+
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="head_tracker", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._hooks.close()
+
+    def observe_block(self, block: Union[Block, Dict[str, Any]]):
+        """Moves the head to block if it is higher
+        """
+        if isinstance(block, Block):
+            height, block_hash = block.height, block.block_hash.hex()
+            data = block.to_dict()
+        else:
+            height = str_to_int(block["height"])
+            block_hash = normalize_hash(block["block_hash"])
+            data = block
+
+        with self._condition:
+            if self._height is not None and height <= self._height:
+                return
+
+            self._height = height
+            self._block_hash = block_hash
+            self._block = data
+            self._condition.notify_all()
+            waiters = self._waiters
+
+        for loop, event in waiters:
+            loop.call_soon_threadsafe(event.set)
+        if self._hooks:
+            self._hooks.dispatch("head", data)
+
+    def wait_for_height(self, height: int, timeout: Optional[float] = None) -> int:
+        """Blocks until the head reaches height and returns the head height
+
+        Polling starts if it is not running.
+
+        :param height: block height to wait for
+        :param timeout: seconds to wait at most (None: no limit)
+        :raise TimeoutException: the head does not reach height in time
+        """
+        self.start()
+        with self._condition:
+            ok = self._condition.wait_for(
+                lambda: self._height is not None and self._height >= height, timeout
+            )
+            if not ok:
+                raise TimeoutException(f"Block {height} not reached", self._height)
+            return self._height
+
+    async def async_wait_for_height(
+        self, height: int, timeout: Optional[float] = None
+    ) -> int:
+        """wait_for_height() for coroutines which does not block the event loop
+        """
+        self.start()
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        entry = loop, event
+        deadline: Optional[float] = None if timeout is None else loop.time() + timeout
+
+        with self._condition:
+            self._waiters = self._waiters + [entry]
+        try:
+            # event.set() runs in the loop, so it cannot slip in between the check and clear()
+            while self._height is None or self._height < height:
+                event.clear()
+                remaining = None if deadline is None else deadline - loop.time()
+                try:
+                    await asyncio.wait_for(event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    raise TimeoutException(f"Block {height} not reached", self._height)
+        finally:
+            with self._condition:
+                self._waiters = [item for item in self._waiters if item is not entry]
+
+        return self._height
+
+    def _run(self):
+        cadence = self._client.cadence
+        while not self._stopped.is_set():
+            try:
+                self._poll()
+                delay = cadence.get_delay()
+            except Exception:
+                # A transient failure is retried a block later
+                delay = cadence.interval
+
+            self._stopped.wait(max(delay, self._min_interval))
+
+    def _poll(self):
+        self._polls += 1
+        response = self._client.send_request(
+            RpcRequest(Method.GET_LAST_BLOCK), timeout=self._client.cadence.interval
+        )
+        block: Dict[str, Any] = response.result
+        self._client.cadence.observe_block(block)
+        self.observe_block(block)
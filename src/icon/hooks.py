@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Hooks registered once and called on every request
+"""
+
+__all__ = ("Hooks",)
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .exception import ArgumentException
+
+# (blocking hooks, non-blocking hooks)
+_Chain = Tuple[Tuple[Callable, ...], Tuple[Callable, ...]]
+
+
+class Hooks(object):
+    """Hook chains per key like "request" and "response"
+
+    Chains are compiled into tuples when hooks are added or removed,
+    so dispatching them takes no lock and no lookup of per-call arguments.
+
+    A blocking hook is called in the request path and stops it by returning False.
+    A non-blocking hook is called in a background thread and its return is ignored.
+    A coroutine function is always non-blocking: it is scheduled as a task
+    in the running event loop, or run in the background thread without one.
+    Calls of non-blocking hooks over max_pending waiting for the background thread
+    are dropped and counted, so a slow hook does not pile up requests in memory.
+    """
+
+    def __init__(self, max_pending: int = 1000):
+        """
+
+        :param max_pending: the maximum number of calls waiting for the background thread
+        """
+        self._max_pending = max_pending
+        self._hooks: Dict[str, List[Tuple[Callable, bool]]] = {}
+        self._chains: Dict[str, _Chain] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._tasks: Set[asyncio.Future] = set()
+        self._pending = 0
+        self._failures = 0
+        self._dropped = 0
+
+    def __bool__(self) -> bool:
+        return bool(self._chains)
+
+    @property
+    def failures(self) -> int:
+        """The number of non-blocking hooks which raised an exception
+        """
+        return self._failures
+
+    @property
+    def dropped(self) -> int:
+        """The number of calls of non-blocking hooks dropped for max_pending
+        """
+        return self._dropped
+
+    def add(
+        self, key: str, hook: Callable[[Any], Optional[bool]], blocking: bool = True
+    ):
+        """
+
+        :param key: "request" or "response"
+        :param hook: a callable which takes a request or a response
+        :param blocking: if False, hook is called without blocking the request
+        """
+        if not callable(hook):
+            raise ArgumentException(f"Invalid hook: {hook}")
+        if asyncio.iscoroutinefunction(hook):
+            blocking = False
+
+        with self._lock:
+            self._hooks.setdefault(key, []).append((hook, blocking))
+            self._compile()
+
+    def remove(self, key: str, hook: Callable[[Any], Optional[bool]]):
+        with self._lock:
+            hooks = self._hooks.get(key, [])
+            self._hooks[key] = [item for item in hooks if item[0] is not hook]
+            self._compile()
+
+    def clear(self):
+        with self._lock:
+            self._hooks.clear()
+            self._compile()
+
+    def dispatch(self, key: str, hook_data: Any) -> bool:
+        """Calls hooks for key and returns False if a blocking hook returns False
+        """
+        chain: Optional[_Chain] = self._chains.get(key)
+        if chain is None:
+            return True
+
+        blocking, non_blocking = chain
+        for hook in blocking:
+            if hook(hook_data) is False:
+                return False
+        for hook in non_blocking:
+            self._submit(hook, hook_data)
+
+        return True
+
+    def close(self):
+        """Waits for non-blocking hooks running in the background thread
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _compile(self):
+        chains: Dict[str, _Chain] = {}
+        for key, hooks in self._hooks.items():
+            if hooks:
+                chains[key] = (
+                    tuple(hook for hook, blocking in hooks if blocking),
+                    tuple(hook for hook, blocking in hooks if not blocking),
+                )
+
+        # Replaced at once so that dispatch() sees either the old or the new one
+        self._chains = chains
+
+    def _submit(self, hook: Callable, hook_data: Any):
+        is_coroutine: bool = asyncio.iscoroutinefunction(hook)
+        if is_coroutine:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                # Tasks are kept until done not to be garbage-collected
+                task = loop.create_task(hook(hook_data))
+                self._tasks.add(task)
+                task.add_done_callback(self._on_task_done)
+                return
+
+        with self._lock:
+            if self._pending >= self._max_pending:
+                self._dropped += 1
+                return
+            self._pending += 1
+
+        if is_coroutine:
+            future = self._get_executor().submit(asyncio.run, hook(hook_data))
+        else:
+            future = self._get_executor().submit(hook, hook_data)
+        future.add_done_callback(self._on_done)
+
+    def _on_task_done(self, task: asyncio.Future):
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            with self._lock:
+                self._failures += 1
+
+    def _on_done(self, future: Future):
+        with self._lock:
+            self._pending -= 1
+            if future.exception() is not None:
+                self._failures += 1
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # One thread keeps hooks in the order of requests
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="hooks"
+                )
+
+            return self._executor
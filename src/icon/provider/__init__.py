@@ -13,7 +13,46 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-__all__ = ("HTTPProvider", "Provider")
+__all__ = (
+    "AIMDController",
+    "AIMDLimit",
+    "AdaptiveProvider",
+    "AsyncAdaptiveProvider",
+    "AsyncCoalescingProvider",
+    "AsyncGovernedProvider",
+    "AsyncGovernor",
+    "AsyncHTTPProvider",
+    "AsyncHedgingProvider",
+    "AsyncProvider",
+    "CoalescingProvider",
+    "Codec",
+    "GovernedProvider",
+    "Governor",
+    "HTTPProvider",
+    "HedgingProvider",
+    "JSONCodec",
+    "Limit",
+    "MultiEndpointProvider",
+    "OrjsonCodec",
+    "Provider",
+    "QueueStats",
+    "TransportStats",
+)
 
+from .aimd import AIMDController, AIMDLimit, AdaptiveProvider, AsyncAdaptiveProvider
+from .async_http_provider import AsyncHTTPProvider
+from .async_provider import AsyncProvider
+from .coalescing_provider import AsyncCoalescingProvider, CoalescingProvider
+from .codec import Codec, JSONCodec, OrjsonCodec
+from .governor import (
+    AsyncGovernedProvider,
+    AsyncGovernor,
+    GovernedProvider,
+    Governor,
+    Limit,
+)
+from .hedging_provider import AsyncHedgingProvider, HedgingProvider
 from .http_provider import HTTPProvider
+from .metrics import QueueStats, TransportStats
+from .multi_endpoint_provider import MultiEndpointProvider
 from .provider import Provider
@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .async_provider import AsyncProvider
+from .provider import Provider
+from ..data.rpc_request import RpcRequest
+from ..data.rpc_response import RpcResponse
+from ..exception import ArgumentException, TimeoutException
+from ..utils.deadline import get_deadline, get_timeout, is_endpoint_failure
+
+# HTTP status codes of a node which sheds load
+_RATE_LIMITED_STATUS_CODES = frozenset((429, 503))
+
+
+class AIMDLimit(object):
+    """A limit which grows additively and shrinks multiplicatively
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        min_value: int = 1,
+        max_value: int = 64,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+    ):
+        """
+
+        :param initial: the value to start with
+        :param min_value: the lowest value
+        :param max_value: the highest value
+        :param increase: the value added on growth
+        :param decrease: the factor multiplied on shrink
+        """
+        if not 1 <= min_value <= initial <= max_value:
+            raise ArgumentException(
+                f"Invalid limit: {min_value} <= {initial} <= {max_value}"
+            )
+        if increase <= 0 or not 0 < decrease < 1:
+            raise ArgumentException(
+                f"Invalid factors: increase={increase} decrease={decrease}"
+            )
+
+        self._value = float(initial)
+        self._min_value = min_value
+        self._max_value = max_value
+        self._increase = increase
+        self._decrease = decrease
+
+    @property
+    def value(self) -> int:
+        return int(self._value)
+
+    def grow(self, scale: float = 1.0):
+        self._value = min(self._value + self._increase * scale, self._max_value)
+
+    def shrink(self):
+        self._value = max(self._value * self._decrease, self._min_value)
+
+
+class AIMDController(object):
+    """Tunes request concurrency and batch size to the health of an endpoint
+
+    Both limits grow while requests succeed in time and shrink at once
+    on a timeout, a rate-limited response, a transport failure, or a latency
+    over max_latency or latency_ratio times the average latency per request.
+    Single requests and batch requests are compared with their own averages,
+    as a request in a large batch takes much less time than a single one.
+    A limit grows only while it is reached, so idle time does not inflate it.
+    Requests which started before the last shrink do not shrink the limits again,
+    so a burst of timeouts from one congestion counts once.
+    """
+
+    def __init__(
+        self,
+        concurrency: Optional[AIMDLimit] = None,
+        batch_size: Optional[AIMDLimit] = None,
+        max_latency: Optional[float] = None,
+        latency_ratio: float = 2.0,
+        decay: float = 0.9,
+    ):
+        """
+
+        :param concurrency: the limit of requests in flight
+            (default: from 4 to 64 by 1 for every round of requests)
+        :param batch_size: the limit of requests in a batch request
+            (default: from 20 to 500 by 10 for every batch request)
+        :param max_latency: seconds which a request can take at most (None: no limit)
+        :param latency_ratio: the ratio of latency to the average regarded as congestion
+        :param decay: the weight of the average in updating it with a new latency
+        """
+        self._concurrency = concurrency or AIMDLimit(4, 1, 64)
+        self._batch_size = batch_size or AIMDLimit(20, 1, 500, increase=10)
+        self._max_latency = max_latency
+        self._latency_ratio = latency_ratio
+        self._decay = decay
+
+        # The average latency per request keyed by whether it is in a batch
+        self._latencies: Dict[bool, Optional[float]] = {False: None, True: None}
+        self._last_shrink = 0.0
+        self._stats: Dict[str, int] = {
+            "increases": 0,
+            "decreases": 0,
+            "timeouts": 0,
+            "rateLimited": 0,
+            "failures": 0,
+        }
+        self._lock = threading.Lock()
+
+    @property
+    def concurrency(self) -> int:
+        return self._concurrency.value
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size.value
+
+    def to_dict(self) -> Dict[str, Union[int, float]]:
+        """Returns a snapshot of the current limits and the number of adjustments
+        """
+        with self._lock:
+            return {
+                "concurrency": self._concurrency.value,
+                "batchSize": self._batch_size.value,
+                "latency": self._latencies[False] or 0.0,
+                "batchLatency": self._latencies[True] or 0.0,
+                **self._stats,
+            }
+
+    def observe(
+        self,
+        started: float,
+        latency: float,
+        size: int = 1,
+        in_flight: int = 1,
+        timed_out: bool = False,
+        rate_limited: bool = False,
+        failed: bool = False,
+    ):
+        """Adjusts limits with the outcome of a request
+
+        :param started: time.monotonic() when the request started
+        :param latency: seconds which the request took
+        :param size: the number of requests in a batch request
+        :param in_flight: the number of requests in flight when it started
+        :param timed_out: True if the request timed out
+        :param rate_limited: True if the endpoint rejected it for its load
+        :param failed: True if it failed otherwise, like with an error page of a proxy
+        """
+        with self._lock:
+            congested = timed_out or rate_limited or failed
+            if not (timed_out or failed):
+                per_request = latency / max(size, 1)
+                congested |= self._is_slow(latency, per_request, size > 1)
+                self._update_latency(per_request, size > 1)
+
+            if congested:
+                self._stats["timeouts"] += timed_out
+                self._stats["rateLimited"] += rate_limited
+                self._stats["failures"] += failed
+                if started >= self._last_shrink:
+                    self._concurrency.shrink()
+                    if size > 1:
+                        self._batch_size.shrink()
+                    self._last_shrink = time.monotonic()
+                    self._stats["decreases"] += 1
+                return
+
+            grown = False
+            if in_flight >= self._concurrency.value:
+                # By increase for every round of requests
+                self._concurrency.grow(1 / self._concurrency.value)
+                grown = True
+            if size > 1 and size >= self._batch_size.value:
+                self._batch_size.grow()
+                grown = True
+            self._stats["increases"] += grown
+
+    def _is_slow(self, latency: float, per_request: float, batch: bool) -> bool:
+        if self._max_latency is not None and latency > self._max_latency:
+            return True
+
+        average: Optional[float] = self._latencies[batch]
+        return average is not None and per_request > average * self._latency_ratio
+
+    def _update_latency(self, per_request: float, batch: bool):
+        average: Optional[float] = self._latencies[batch]
+        if average is None:
+            self._latencies[batch] = per_request
+        else:
+            self._latencies[batch] = average * self._decay + per_request * (
+                1 - self._decay
+            )
+
+
+def _is_rate_limited(responses: List[RpcResponse]) -> bool:
+    for response in responses:
+        # requests.Response or aiohttp.ClientResponse
+        user_data = getattr(response, "user_data", None)
+        status = getattr(user_data, "status_code", getattr(user_data, "status", None))
+        if status in _RATE_LIMITED_STATUS_CODES:
+            return True
+
+    return False
+
+
+class AdaptiveProvider(Provider):
+    """Sends requests within the concurrency limit tuned by an AIMDController
+
+    Callers block while the limit is reached or until their deadline passes.
+    Bulk paths of Client read controller.batch_size to split batch requests.
+    """
+
+    def __init__(self, provider: Provider, controller: Optional[AIMDController] = None):
+        self._provider = provider
+        self._controller = controller or AIMDController()
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @property
+    def base_url(self) -> str:
+        return getattr(self._provider, "base_url", repr(self._provider))
+
+    @property
+    def controller(self) -> AIMDController:
+        return self._controller
+
+    def close(self):
+        self._provider.close()
+
+    def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+        return self._call(
+            lambda: self._provider.send(request, **kwargs), [request], kwargs
+        )
+
+    def send_batch(self, rpc_requests: List[RpcRequest], **kwargs) -> List[RpcResponse]:
+        return self._call(
+            lambda: self._provider.send_batch(rpc_requests, **kwargs),
+            rpc_requests,
+            kwargs,
+        )
+
+    def _call(
+        self,
+        func: Callable[[], Any],
+        rpc_requests: List[RpcRequest],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        deadline: Optional[float] = get_deadline(kwargs)
+        with self._condition:
+            while self._in_flight >= self._controller.concurrency:
+                timeout: Optional[float] = get_timeout(deadline, rpc_requests)
+                self._condition.wait(timeout)
+            self._in_flight += 1
+            in_flight = self._in_flight
+
+        started = time.monotonic()
+        try:
+            ret = func()
+        except Exception as e:
+            # Like an error page of a proxy shedding load which fails to decode.
+            # Neither the deadline of the caller nor a governor says anything of the node.
+            if is_endpoint_failure(e, deadline):
+                timed_out = isinstance(e, TimeoutException)
+                self._controller.observe(
+                    started,
+                    time.monotonic() - started,
+                    len(rpc_requests),
+                    timed_out=timed_out,
+                    failed=not timed_out,
+                )
+            raise
+        else:
+            responses = ret if isinstance(ret, list) else [ret]
+            self._controller.observe(
+                started,
+                time.monotonic() - started,
+                len(rpc_requests),
+                in_flight,
+                rate_limited=_is_rate_limited(responses),
+            )
+            return ret
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                # The limit may have grown, so all waiters check it again
+                self._condition.notify_all()
+
+
+class AsyncAdaptiveProvider(AsyncProvider):
+    """AdaptiveProvider on asyncio
+
+    It has to be used in one event loop.
+    """
+
+    def __init__(
+        self, provider: AsyncProvider, controller: Optional[AIMDController] = None
+    ):
+        self._provider = provider
+        self._controller = controller or AIMDController()
+        self._in_flight = 0
+        self._condition: Optional[asyncio.Condition] = None
+
+    @property
+    def base_url(self) -> str:
+        return getattr(self._provider, "base_url", repr(self._provider))
+
+    @property
+    def controller(self) -> AIMDController:
+        return self._controller
+
+    async def close(self):
+        await self._provider.close()
+
+    async def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+        return await self._call(
+            lambda: self._provider.send(request, **kwargs), [request], kwargs
+        )
+
+    async def send_batch(
+        self, rpc_requests: List[RpcRequest], **kwargs
+    ) -> List[RpcResponse]:
+        return await self._call(
+            lambda: self._provider.send_batch(rpc_requests, **kwargs),
+            rpc_requests,
+            kwargs,
+        )
+
+    async def _call(
+        self,
+        func: Callable[[], Any],
+        rpc_requests: List[RpcRequest],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        if self._condition is None:
+            # Created on first use to bind it to the running loop
+            self._condition = asyncio.Condition()
+
+        deadline: Optional[float] = get_deadline(kwargs)
+        async with self._condition:
+            while self._in_flight >= self._controller.concurrency:
+                timeout: Optional[float] = get_timeout(deadline, rpc_requests)
+                try:
+                    await asyncio.wait_for(self._condition.wait(), timeout)
+                except asyncio.TimeoutError:
+                    raise TimeoutException("Deadline exceeded", rpc_requests)
+            self._in_flight += 1
+            in_flight = self._in_flight
+
+        started = time.monotonic()
+        try:
+            ret = await func()
+        except Exception as e:
+            # Like an error page of a proxy shedding load which fails to decode.
+            # Neither the deadline of the caller nor a governor says anything of the node.
+            if is_endpoint_failure(e, deadline):
+                timed_out = isinstance(e, TimeoutException)
+                self._controller.observe(
+                    started,
+                    time.monotonic() - started,
+                    len(rpc_requests),
+                    timed_out=timed_out,
+                    failed=not timed_out,
+                )
+            raise
+        else:
+            responses = ret if isinstance(ret, list) else [ret]
+            self._controller.observe(
+                started,
+                time.monotonic() - started,
+                len(rpc_requests),
+                in_flight,
+                rate_limited=_is_rate_limited(responses),
+            )
+            return ret
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import zlib
+from typing import Any, Dict, List, Optional
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+from .async_provider import AsyncProvider
+from .codec import Codec, get_default_codec
+from .http_common import (
+    check_resendable,
+    compress,
+    decode,
+    get_batch_method,
+    group_by_url,
+    is_compression_rejected,
+    match_responses,
+)
+from .metrics import TransportStats
+from ..builder.method import Method
+from ..data.rpc_request import RpcRequest
+from ..data.rpc_response import RawRpcResponse, RpcResponse
+from ..exception import TimeoutException, TransportException
+from ..hooks import Hooks
+from ..utils.deadline import get_deadline, get_timeout
+
+
+class AsyncHTTPProvider(AsyncProvider):
+    """HTTP provider on asyncio
+
+    All requests share one aiohttp connection pool,
+    so a single event loop can keep many requests in flight.
+    aiohttp is required: pip install gw-iconsdk[async]
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        version: int = 3,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        codec: Optional[Codec] = None,
+        compress_threshold: Optional[int] = None,
+    ):
+        """
+
+        :param base_url: ex) https://localhost:9000
+        :param version: JSON-RPC API version
+        :param limit: the maximum number of connections in the pool (0: no limit)
+        :param limit_per_host: the maximum number of connections per host (0: no limit)
+        :param codec: codec for request and response bodies (default: the fastest available)
+        :param compress_threshold: request bodies of this size in bytes or larger
+            are sent with gzip (default: None, no compression)
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for AsyncHTTPProvider: pip install gw-iconsdk[async]"
+            )
+
+        self._base_url = base_url
+        self._version = version
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._codec: Codec = codec if codec is not None else get_default_codec()
+        self._headers = {
+            "Content-Type": self._codec.content_type,
+            "Accept-Encoding": "gzip, deflate",
+        }
+        self._compress_threshold = compress_threshold
+        self._stats = TransportStats()
+        self._hooks = Hooks()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        self._url = "/".join((self._base_url, "api", f"v{version}"))
+        self._debug_url = "/".join((self._base_url, "api", "debug", f"v{version}"))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def compress_threshold(self) -> Optional[int]:
+        return self._compress_threshold
+
+    @property
+    def stats(self) -> TransportStats:
+        """Bytes on the wire and decoded bytes per method
+
+        Requests in a batch with different methods are counted under "batch".
+        """
+        return self._stats
+
+    @property
+    def hooks(self) -> Hooks:
+        """Hooks called with each aiohttp.ClientResponse under "response"
+        """
+        return self._hooks
+
+    async def close(self):
+        """Closes all pooled connections
+        """
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
+        self._hooks.close()
+
+    async def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+        url = self._get_url(request.method)
+        request.url = url
+
+        deadline: Optional[float] = get_deadline(kwargs)
+        response, content = await self._post(
+            url, request.to_dict(), deadline, request, request.method
+        )
+
+        if kwargs.get("raw"):
+            rpc_response = RawRpcResponse(content, self._codec.decode)
+        else:
+            rpc_response = RpcResponse(decode(self._codec, content, url, request))
+        rpc_response.user_data = response
+
+        # Decoding a response is also bound by the deadline
+        get_timeout(deadline, request)
+        return rpc_response
+
+    async def send_batch(
+        self, rpc_requests: List[RpcRequest], **kwargs
+    ) -> List[RpcResponse]:
+        groups: Dict[str, List[RpcRequest]] = group_by_url(rpc_requests, self._get_url)
+        deadline: Optional[float] = get_deadline(kwargs)
+        rpc_responses: Dict[int, RpcResponse] = {}
+        for url, group in groups.items():
+            json_data = [request.to_dict() for request in group]
+            response, content = await self._post(
+                url, json_data, deadline, group, get_batch_method(group),
+            )
+            data = decode(self._codec, content, url, group)
+
+            for request, item in zip(group, match_responses(group, data)):
+                rpc_response = RpcResponse(item)
+                rpc_response.user_data = response
+                rpc_responses[request.id] = rpc_response
+
+        get_timeout(deadline, rpc_requests)
+        return [rpc_responses[request.id] for request in rpc_requests]
+
+    async def _post(
+        self,
+        url: str,
+        data: Any,
+        deadline: Optional[float],
+        user_data: Any,
+        method: str,
+    ):
+        body: bytes = self._codec.encode(data)
+        wire_body, headers = compress(body, self._compress_threshold, self._headers)
+
+        try:
+            response, content = await self._request(
+                url, wire_body, headers, deadline, user_data
+            )
+
+            if wire_body is not body and is_compression_rejected(
+                response.status,
+                self._decompress(
+                    content,
+                    response.headers.get("Content-Encoding", ""),
+                    url,
+                    user_data,
+                ),
+            ):
+                # The server does not accept compressed bodies. Stop compressing.
+                self._compress_threshold = None
+                check_resendable(response.status, data, url, user_data)
+                wire_body, headers = body, self._headers
+                response, content = await self._request(
+                    url, wire_body, headers, deadline, user_data
+                )
+        except asyncio.TimeoutError as e:
+            raise TimeoutException(f"Request timed out: {url}", user_data) from e
+        except aiohttp.ClientError as e:
+            raise TransportException(f"Request failed: {url}: {e}", user_data) from e
+
+        decoded: bytes = self._decompress(
+            content, response.headers.get("Content-Encoding", ""), url, user_data
+        )
+        self._stats.add(method, len(body), len(wire_body), len(decoded), len(content))
+        if self._hooks:
+            self._hooks.dispatch("response", response)
+        return response, decoded
+
+    async def _request(
+        self,
+        url: str,
+        body: bytes,
+        headers: Dict[str, str],
+        deadline: Optional[float],
+        user_data: Any,
+    ):
+        kwargs = {"data": body, "headers": headers}
+        timeout: Optional[float] = get_timeout(deadline, user_data)
+        if timeout is not None:
+            # Both the request and reading the response are bound by timeout
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+        async with self._get_session().post(url, **kwargs) as response:
+            return response, await response.read()
+
+    @staticmethod
+    def _decompress(content: bytes, encoding: str, url: str, user_data: Any) -> bytes:
+        """
+        :raise TransportException: content is corrupt
+        """
+        encoding = encoding.strip().lower()
+        try:
+            if encoding == "gzip":
+                return zlib.decompress(content, 16 + zlib.MAX_WBITS)
+            if encoding == "deflate":
+                try:
+                    return zlib.decompress(content)
+                except zlib.error:
+                    # Some servers send raw deflate data without a zlib header
+                    return zlib.decompress(content, -zlib.MAX_WBITS)
+        except zlib.error as e:
+            # Like requests raising ContentDecodingError in HTTPProvider
+            raise TransportException(f"Invalid response: {url}: {e}", user_data) from e
+
+        return content
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # ClientSession has to be created in a running event loop
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self._limit, limit_per_host=self._limit_per_host
+            )
+            # Responses are decompressed by this provider to count bytes on the wire
+            self._session = aiohttp.ClientSession(
+                connector=connector, auto_decompress=False
+            )
+
+        return self._session
+
+    def _get_url(self, method: str) -> str:
+        if method in {Method.ESTIMATE_STEP, Method.GET_ACCOUNT}:
+            return self._debug_url
+
+        return self._url
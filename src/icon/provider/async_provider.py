@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from abc import ABCMeta, abstractmethod
+from typing import List
+
+from ..data.rpc_request import RpcRequest
+from ..data.rpc_response import RpcResponse
+
+
+class AsyncProvider(metaclass=ABCMeta):
+    """The provider defines how the AsyncClient connects to a node on asyncio"""
+
+    @abstractmethod
+    async def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+        raise NotImplementedError("Providers must implement this method")
+
+    async def send_batch(
+        self, rpc_requests: List[RpcRequest], **kwargs
+    ) -> List[RpcResponse]:
+        """Sends multiple requests and returns responses in the same order
+        """
+        return list(
+            await asyncio.gather(
+                *(self.send(request, **kwargs) for request in rpc_requests)
+            )
+        )
+
+    async def close(self):
+        """Releases resources held by the provider like pooled connections
+        """
+        pass
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import threading
+from concurrent.futures import Future, wait
+from typing import Any, Dict, List, Tuple
+
+from .async_provider import AsyncProvider
+from .provider import Provider
+from ..builder.method import Method
+from ..data.rpc_request import RpcRequest
+from ..data.rpc_response import RpcResponse
+from ..exception import TimeoutException
+from ..utils.deadline import get_deadline, get_timeout
+
+
+def _get_key(request: RpcRequest, kwargs: Dict[str, Any]) -> Tuple[str, str, bool]:
+    # Params are canonicalized so that the order of keys does not matter
+    params = request.to_dict().get("params")
+    params = json.dumps(params, sort_keys=True, separators=(",", ":"))
+    # Raw and decoded responses are not shared with each other
+    return request.method, params, bool(kwargs.get("raw"))
+
+
+class CoalescingProvider(Provider):
+    """Shares one call among identical read requests in flight
+
+    A read-only request with the same method and params as a request in flight
+    waits for the response of that request instead of being sent.
+    All of them get the same RpcResponse, so the object converted from its result
+    by Client is shared as well.
+
+    A waiting request gives up when its own deadline passes,
+    but it fails if the request in flight fails, even because of a shorter deadline.
+    Batch requests are sent as they are.
+    """
+
+    def __init__(self, provider: Provider):
+        self._provider = provider
+        self._lock = threading.Lock()
+        self._calls: Dict[Tuple[str, str, bool], Future] = {}
+        self._coalesced = 0
+
+    @property
+    def coalesced(self) -> int:
+        """The number of requests which shared a call in flight
+        """
+        return self._coalesced
+
+    def close(self):
+        self._provider.close()
+
+    def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+        if not Method.is_read_only(request.method):
+            return self._provider.send(request, **kwargs)
+
+        key = _get_key(request, kwargs)
+        with self._lock:
+            future: Future = self._calls.get(key)
+            if future is None:
+                future = self._calls[key] = Future()
+                leader = True
+            else:
+                self._coalesced += 1
+                leader = False
+
+        if not leader:
+            timeout = get_timeout(get_deadline(kwargs), request)
+            done, _ = wait({future}, timeout=timeout)
+            if not done:
+                raise TimeoutException("Deadline exceeded", request)
+            # The shared response has the id of the leader
+            return future.result().with_id(request.id)
+
+        try:
+            response: RpcResponse = self._provider.send(request, **kwargs)
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+
+        self._finish(key)
+        future.set_result(response)
+        return response
+
+    def send_batch(self, rpc_requests: List[RpcRequest], **kwargs) -> List[RpcResponse]:
+        return self._provider.send_batch(rpc_requests, **kwargs)
+
+    def _finish(self, key: Tuple[str, str, bool]):
+        # Requests from now on make a new call
+        with self._lock:
+            del self._calls[key]
+
+
+class AsyncCoalescingProvider(AsyncProvider):
+    """CoalescingProvider on asyncio
+
+    A call in flight goes on even if the request which started it is cancelled.
+    """
+
+    def __init__(self, provider: AsyncProvider):
+        self._provider = provider
+        self._calls: Dict[Tuple[str, str, bool], asyncio.Future] = {}
+        self._coalesced = 0
+
+    @property
+    def coalesced(self) -> int:
+        return self._coalesced
+
+    async def close(self):
+        await self._provider.close()
+
+    async def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+        if not Method.is_read_only(request.method):
+            return await self._provider.send(request, **kwargs)
+
+        key = _get_key(request, kwargs)
+        task: asyncio.Future = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._provider.send(request, **kwargs))
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._finish(key, task))
+            return await asyncio.shield(task)
+
+        self._coalesced += 1
+        timeout = get_timeout(get_deadline(kwargs), request)
+        try:
+            response: RpcResponse = await asyncio.wait_for(
+                asyncio.shield(task), timeout
+            )
+        except asyncio.TimeoutError as e:
+            raise TimeoutException("Deadline exceeded", request) from e
+        return response.with_id(request.id)
+
+    async def send_batch(
+        self, rpc_requests: List[RpcRequest], **kwargs
+    ) -> List[RpcResponse]:
+        return await self._provider.send_batch(rpc_requests, **kwargs)
+
+    def _finish(self, key: Tuple[str, str, bool], task: asyncio.Future):
+        if self._calls.get(key) is task:
+            del self._calls[key]
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = ("Codec", "JSONCodec", "OrjsonCodec", "get_default_codec")
+
+import json
+import re
+from abc import ABCMeta, abstractmethod
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# A number out of 64 bits, which orjson turns into a float
+# Digits in a string may match it too, which only costs a decoding by json
+_BIG_INT = re.compile(rb"[:\[,]\s*-?\d{19,}\s*[,\]}]")
+
+
+class Codec(metaclass=ABCMeta):
+    """Encodes JSON-RPC requests to bytes and decodes responses from bytes
+    """
+
+    content_type = "application/json"
+
+    @abstractmethod
+    def encode(self, o: Any) -> bytes:
+        raise NotImplementedError("Codecs must implement this method")
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        raise NotImplementedError("Codecs must implement this method")
+
+
+class JSONCodec(Codec):
+    """Codec based on json in the standard library
+    """
+
+    def encode(self, o: Any) -> bytes:
+        return json.dumps(o, separators=(",", ":")).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(Codec):
+    """Codec based on orjson which is much faster than json
+
+    orjson supports only integers in 64 bits, so data with a larger integer
+    is encoded and decoded by json instead.
+
+    pip install orjson
+    """
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is required for OrjsonCodec: pip install orjson")
+
+    def encode(self, o: Any) -> bytes:
+        try:
+            return orjson.dumps(o)
+        except TypeError:
+            # orjson.JSONEncodeError on an integer out of 64 bits
+            return json.dumps(o, separators=(",", ":")).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        if _BIG_INT.search(data):
+            return json.loads(data)
+
+        return orjson.loads(data)
+
+
+def get_default_codec() -> Codec:
+    """Returns the fastest codec available
+
+    Both codecs give the same results, including for integers out of 64 bits.
+    """
+    if orjson is not None:
+        return OrjsonCodec()
+
+    return JSONCodec()
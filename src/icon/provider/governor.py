@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .async_provider import AsyncProvider
+from .metrics import QueueStats
+from .provider import Provider
+from ..builder.method import Method
+from ..data.rpc_request import RpcRequest
+from ..data.rpc_response import RpcResponse
+from ..exception import TimeoutException
+from ..utils.deadline import get_deadline, get_timeout
+
+
+class MethodClass(object):
+    READ = "read"
+    WRITE = "write"
+    DEBUG = "debug"
+
+    # Methods which HTTPProvider sends to the debug url
+    DEBUG_METHODS = frozenset((Method.ESTIMATE_STEP, Method.GET_ACCOUNT))
+
+    @classmethod
+    def of(cls, method: str) -> str:
+        if method in cls.DEBUG_METHODS or method.startswith("debug_"):
+            return cls.DEBUG
+        if Method.is_read_only(method):
+            return cls.READ
+
+        return cls.WRITE
+
+
+class Limit(object):
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+    ):
+        """
+
+        :param rate: the maximum number of requests per second (None: no limit)
+        :param burst: the number of requests which can be sent at once (default: max(rate, 1))
+        :param max_in_flight: the maximum number of requests in flight (None: no limit)
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError(f"Invalid rate: {rate}")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError(f"Invalid max_in_flight: {max_in_flight}")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(int(rate or 1), 1)
+        self.max_in_flight = max_in_flight
+
+
+class TokenBucket(object):
+    def __init__(self, rate: float, burst: int):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """Takes a token and returns seconds to wait before using it
+
+        Tokens may be taken in advance, so waiting callers are served in order.
+
+        :param max_wait: seconds which a caller can wait at most (None: no limit)
+        :return: None without taking a token if it would take longer than max_wait
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._tokens + (now - self._last) * self._rate, self._burst
+            )
+            self._last = now
+
+            delay = max(1 - self._tokens, 0) / self._rate
+            if max_wait is not None and delay > max_wait:
+                return None
+
+            self._tokens -= 1
+            return delay
+
+
+class Governor(object):
+    """Limits the rate and concurrency of requests to an endpoint per method class
+
+    Method classes are "read", "write" (icx_sendTransaction) and "debug".
+    Callers block until a slot and a token are available or their deadline passes.
+    """
+
+    def __init__(
+        self,
+        read: Optional[Limit] = None,
+        write: Optional[Limit] = None,
+        debug: Optional[Limit] = None,
+    ):
+        limits = {
+            MethodClass.READ: read,
+            MethodClass.WRITE: write,
+            MethodClass.DEBUG: debug,
+        }
+
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._max_in_flight: Dict[str, int] = {}
+        for key, limit in limits.items():
+            if limit is None:
+                continue
+            if limit.rate is not None:
+                self._buckets[key] = TokenBucket(limit.rate, limit.burst)
+            if limit.max_in_flight is not None:
+                self._max_in_flight[key] = limit.max_in_flight
+
+        self._slots: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._stats = QueueStats()
+
+    @property
+    def stats(self) -> QueueStats:
+        """Time spent waiting for a slot and a token per method class
+        """
+        return self._stats
+
+    def acquire(self, key: str, deadline: Optional[float], user_data: Any = None):
+        start = time.monotonic()
+
+        slots = self._get_slots(key)
+        if slots is not None:
+            timeout: Optional[float] = get_timeout(deadline, user_data)
+            if not slots.acquire(timeout=timeout):
+                self._timeout(key, start, user_data)
+
+        try:
+            delay: Optional[float] = self._reserve(key, deadline, user_data)
+            if delay is None:
+                self._timeout(key, start, user_data)
+            if delay > 0:
+                time.sleep(delay)
+        except BaseException:
+            if slots is not None:
+                slots.release()
+            raise
+
+        self._stats.add(key, time.monotonic() - start)
+
+    def release(self, key: str):
+        slots = self._slots.get(key)
+        if slots is not None:
+            slots.release()
+
+    def _get_slots(self, key: str):
+        if key not in self._max_in_flight:
+            return None
+
+        with self._lock:
+            slots = self._slots.get(key)
+            if slots is None:
+                slots = self._slots[key] = self._create_slots(self._max_in_flight[key])
+
+        return slots
+
+    def _create_slots(self, max_in_flight: int):
+        return threading.BoundedSemaphore(max_in_flight)
+
+    def _reserve(
+        self, key: str, deadline: Optional[float], user_data: Any
+    ) -> Optional[float]:
+        bucket: Optional[TokenBucket] = self._buckets.get(key)
+        if bucket is None:
+            return 0.0
+
+        return bucket.reserve(get_timeout(deadline, user_data))
+
+    def _timeout(self, key: str, start: float, user_data: Any):
+        self._stats.add(key, time.monotonic() - start, timed_out=True)
+        raise TimeoutException(f"No {key} slot available before deadline", user_data)
+
+
+class AsyncGovernor(Governor):
+    """Governor on asyncio
+
+    Slots are created on first use and have to be used in the same event loop.
+    """
+
+    async def acquire(self, key: str, deadline: Optional[float], user_data: Any = None):
+        start = time.monotonic()
+
+        slots: Optional[asyncio.Semaphore] = self._get_slots(key)
+        if slots is not None:
+            timeout: Optional[float] = get_timeout(deadline, user_data)
+            try:
+                await asyncio.wait_for(slots.acquire(), timeout)
+            except asyncio.TimeoutError:
+                self._timeout(key, start, user_data)
+
+        try:
+            delay: Optional[float] = self._reserve(key, deadline, user_data)
+            if delay is None:
+                self._timeout(key, start, user_data)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        except BaseException:
+            if slots is not None:
+                slots.release()
+            raise
+
+        self._stats.add(key, time.monotonic() - start)
+
+    def _create_slots(self, max_in_flight: int):
+        return asyncio.BoundedSemaphore(max_in_flight)
+
+
+def _get_keys(rpc_requests: List[RpcRequest]) -> List[str]:
+    # Sorted to take slots of a mixed batch in the same order everywhere
+    return sorted({MethodClass.of(request.method) for request in rpc_requests})
+
+
+class GovernedProvider(Provider):
+    """Sends requests within the rate and concurrency limits of an endpoint
+
+    A batch request takes one slot and one token of each method class in it.
+    Wrap each provider of MultiEndpointProvider to limit endpoints separately.
+    """
+
+    def __init__(self, provider: Provider, governor: Governor):
+        self._provider = provider
+        self._governor = governor
+
+    @property
+    def base_url(self) -> str:
+        return getattr(self._provider, "base_url", repr(self._provider))
+
+    @property
+    def governor(self) -> Governor:
+        return self._governor
+
+    def close(self):
+        self._provider.close()
+
+    def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+        return self._call(
+            lambda: self._provider.send(request, **kwargs), [request], kwargs
+        )
+
+    def send_batch(self, rpc_requests: List[RpcRequest], **kwargs) -> List[RpcResponse]:
+        return self._call(
+            lambda: self._provider.send_batch(rpc_requests, **kwargs),
+            rpc_requests,
+            kwargs,
+        )
+
+    def _call(
+        self,
+        func: Callable[[], Any],
+        rpc_requests: List[RpcRequest],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        deadline: Optional[float] = get_deadline(kwargs)
+        acquired: List[str] = []
+        try:
+            for key in _get_keys(rpc_requests):
+                self._governor.acquire(key, deadline, rpc_requests)
+                acquired.append(key)
+
+            return func()
+        finally:
+            for key in acquired:
+                self._governor.release(key)
+
+
+class AsyncGovernedProvider(AsyncProvider):
+    """GovernedProvider on asyncio
+    """
+
+    def __init__(self, provider: AsyncProvider, governor: AsyncGovernor):
+        self._provider = provider
+        self._governor = governor
+
+    @property
+    def base_url(self) -> str:
+        return getattr(self._provider, "base_url", repr(self._provider))
+
+    @property
+    def governor(self) -> AsyncGovernor:
+        return self._governor
+
+    async def close(self):
+        await self._provider.close()
+
+    async def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+        return await self._call(
+            lambda: self._provider.send(request, **kwargs), [request], kwargs
+        )
+
+    async def send_batch(
+        self, rpc_requests: List[RpcRequest], **kwargs
+    ) -> List[RpcResponse]:
+        return await self._call(
+            lambda: self._provider.send_batch(rpc_requests, **kwargs),
+            rpc_requests,
+            kwargs,
+        )
+
+    async def _call(
+        self,
+        func: Callable[[], Any],
+        rpc_requests: List[RpcRequest],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        deadline: Optional[float] = get_deadline(kwargs)
+        acquired: List[str] = []
+        try:
+            for key in _get_keys(rpc_requests):
+                await self._governor.acquire(key, deadline, rpc_requests)
+                acquired.append(key)
+
+            return await func()
+        finally:
+            for key in acquired:
+                self._governor.release(key)
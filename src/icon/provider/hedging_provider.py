@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .async_provider import AsyncProvider
+from .provider import Provider
+from ..builder.method import Method
+from ..data.rpc_request import RpcRequest
+from ..data.rpc_response import RpcResponse
+
+
+class LatencyTracker(object):
+    """Keeps recent latencies to get the delay before a hedged request
+    """
+
+    def __init__(
+        self, percentile: float, window: int, min_samples: int, initial_delay: float
+    ):
+        if not 0 < percentile <= 100:
+            raise ValueError(f"Invalid percentile: {percentile}")
+
+        self._percentile = percentile
+        self._min_samples = min_samples
+        self._initial_delay = initial_delay
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def add(self, latency: float):
+        with self._lock:
+            self._samples.append(latency)
+
+    def get_delay(self) -> float:
+        """Returns the latency under which the given percentile of requests complete
+        """
+        with self._lock:
+            if len(self._samples) < self._min_samples:
+                return self._initial_delay
+            samples = sorted(self._samples)
+
+        index = min(int(len(samples) * self._percentile / 100), len(samples) - 1)
+        return samples[index]
+
+
+# Methods of the requests and whether they are in a batch request
+_Key = Tuple[bool, Tuple[str, ...]]
+
+
+class LatencyTrackers(object):
+    """LatencyTracker for each kind of requests
+
+    A cheap icx_getBalance and a heavy icx_call, or a single request
+    and a batch request, take so different time
+    that one distribution hedges the former too late and the latter too early.
+    """
+
+    def __init__(
+        self, percentile: float, window: int, min_samples: int, initial_delay: float
+    ):
+        if not 0 < percentile <= 100:
+            raise ValueError(f"Invalid percentile: {percentile}")
+
+        self._args = percentile, window, min_samples, initial_delay
+        self._trackers: Dict[_Key, LatencyTracker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, rpc_requests: List[RpcRequest]) -> LatencyTracker:
+        key: _Key = (
+            len(rpc_requests) > 1,
+            tuple(sorted({request.method for request in rpc_requests})),
+        )
+        with self._lock:
+            tracker: Optional[LatencyTracker] = self._trackers.get(key)
+            if tracker is None:
+                tracker = self._trackers[key] = LatencyTracker(*self._args)
+            return tracker
+
+
+def _is_hedgeable(rpc_requests: List[RpcRequest]) -> bool:
+    return all(Method.is_read_only(request.method) for request in rpc_requests)
+
+
+class HedgingProvider(Provider):
+    """Sends a duplicate of a slow read request to cut tail latency
+
+    If a read-only request has not completed within the given percentile
+    of recent latencies of the same kind of requests, the same request is sent again.
+    Requests which change states like icx_sendTransaction are never hedged.
+
+    Both attempts run in the thread pool, and the first successful one is returned.
+    The other is cancelled if it has not started yet, or its result is ignored.
+    A failed first attempt is hedged at once.
+
+    The duplicate goes to secondary if given, or to provider again.
+    A MultiEndpointProvider sends it to another endpoint
+    because the endpoint of the first attempt is busy with it.
+    """
+
+    def __init__(
+        self,
+        provider: Provider,
+        secondary: Optional[Provider] = None,
+        *,
+        percentile: float = 95.0,
+        window: int = 100,
+        min_samples: int = 10,
+        initial_delay: float = 1.0,
+        max_workers: int = 32,
+    ):
+        """
+
+        :param provider: provider for the first attempt
+        :param secondary: provider for the hedged attempt (default: provider)
+        :param percentile: percentile of recent latencies to wait before hedging
+        :param window: the number of recent latencies to keep for each kind of requests
+        :param min_samples: the number of latencies required to use the percentile
+        :param initial_delay: seconds to wait before hedging until min_samples are collected
+        :param max_workers: the maximum number of threads sending read requests
+        """
+        self._provider = provider
+        self._secondary = secondary if secondary is not None else provider
+        self._trackers = LatencyTrackers(percentile, window, min_samples, initial_delay)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="HedgingProvider"
+        )
+        self._lock = threading.Lock()
+        self._hedged = 0
+
+    @property
+    def hedged(self) -> int:
+        """The number of hedged requests sent so far
+        """
+        return self._hedged
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self._provider.close()
+        if self._secondary is not self._provider:
+            self._secondary.close()
+
+    def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+        if not _is_hedgeable([request]):
+            return self._provider.send(request, **kwargs)
+
+        return self._hedge(lambda provider: provider.send(request, **kwargs), [request])
+
+    def send_batch(self, rpc_requests: List[RpcRequest], **kwargs) -> List[RpcResponse]:
+        if not _is_hedgeable(rpc_requests):
+            return self._provider.send_batch(rpc_requests, **kwargs)
+
+        return self._hedge(
+            lambda provider: provider.send_batch(rpc_requests, **kwargs), rpc_requests
+        )
+
+    def _hedge(
+        self, func: Callable[[Provider], Any], rpc_requests: List[RpcRequest]
+    ) -> Any:
+        tracker: LatencyTracker = self._trackers.get(rpc_requests)
+        first: Future = self._submit(func, self._provider, tracker)
+
+        done, _ = wait({first}, timeout=tracker.get_delay())
+        if first in done and first.exception() is None:
+            return first.result()
+
+        with self._lock:
+            self._hedged += 1
+        second: Future = self._submit(func, self._secondary, tracker)
+
+        pending = {first, second}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for f in pending:
+                        # Only a request which has not started yet can be cancelled
+                        f.cancel()
+                    return future.result()
+                error = future.exception()
+
+        raise error
+
+    def _submit(
+        self,
+        func: Callable[[Provider], Any],
+        provider: Provider,
+        tracker: LatencyTracker,
+    ) -> Future:
+        def run():
+            start = time.monotonic()
+            ret = func(provider)
+            tracker.add(time.monotonic() - start)
+            return ret
+
+        return self._executor.submit(run)
+
+
+class AsyncHedgingProvider(AsyncProvider):
+    """HedgingProvider on asyncio
+
+    The attempt which loses the race is cancelled.
+    """
+
+    def __init__(
+        self,
+        provider: AsyncProvider,
+        secondary: Optional[AsyncProvider] = None,
+        *,
+        percentile: float = 95.0,
+        window: int = 100,
+        min_samples: int = 10,
+        initial_delay: float = 1.0,
+    ):
+        self._provider = provider
+        self._secondary = secondary if secondary is not None else provider
+        self._trackers = LatencyTrackers(percentile, window, min_samples, initial_delay)
+        self._hedged = 0
+
+    @property
+    def hedged(self) -> int:
+        return self._hedged
+
+    async def close(self):
+        await self._provider.close()
+        if self._secondary is not self._provider:
+            await self._secondary.close()
+
+    async def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+        if not _is_hedgeable([request]):
+            return await self._provider.send(request, **kwargs)
+
+        return await self._hedge(
+            lambda provider: provider.send(request, **kwargs), [request]
+        )
+
+    async def send_batch(
+        self, rpc_requests: List[RpcRequest], **kwargs
+    ) -> List[RpcResponse]:
+        if not _is_hedgeable(rpc_requests):
+            return await self._provider.send_batch(rpc_requests, **kwargs)
+
+        return await self._hedge(
+            lambda provider: provider.send_batch(rpc_requests, **kwargs), rpc_requests
+        )
+
+    async def _hedge(
+        self, func: Callable[[AsyncProvider], Any], rpc_requests: List[RpcRequest]
+    ) -> Any:
+        tracker: LatencyTracker = self._trackers.get(rpc_requests)
+        first = asyncio.ensure_future(self._run(func, self._provider, tracker))
+        done, _ = await asyncio.wait({first}, timeout=tracker.get_delay())
+        if first in done and first.exception() is None:
+            return first.result()
+
+        self._hedged += 1
+        second = asyncio.ensure_future(self._run(func, self._secondary, tracker))
+
+        pending = {first, second}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise error
+
+    async def _run(
+        self,
+        func: Callable[[AsyncProvider], Any],
+        provider: AsyncProvider,
+        tracker: LatencyTracker,
+    ):
+        start = time.monotonic()
+        ret = await func(provider)
+        tracker.add(time.monotonic() - start)
+        return ret
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers shared by HTTPProvider and AsyncHTTPProvider
+"""
+
+__all__ = (
+    "check_resendable",
+    "compress",
+    "decode",
+    "get_batch_method",
+    "group_by_url",
+    "is_compression_rejected",
+    "match_responses",
+)
+
+import gzip
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .codec import Codec
+from ..builder.method import Method
+from ..data.rpc_request import RpcRequest
+from ..exception import TransportException
+
+
+def compress(
+    body: bytes, threshold: Optional[int], headers: Dict[str, str]
+) -> Tuple[bytes, Dict[str, str]]:
+    """Returns body with gzip and headers for it if body is threshold or larger
+    """
+    if threshold is None or len(body) < threshold:
+        return body, headers
+
+    headers = {**headers, "Content-Encoding": "gzip"}
+    return gzip.compress(body, compresslevel=6), headers
+
+
+def decode(codec: Codec, content: bytes, url: str, user_data: Any) -> Any:
+    """Decodes a response body
+
+    :raise TransportException: content is not JSON
+    """
+    # A proxy in front of a node may reply with a non-JSON body like an HTML page
+    try:
+        return codec.decode(content)
+    except ValueError as e:
+        raise TransportException(f"Invalid response: {url}", user_data) from e
+
+
+def is_compression_rejected(status: int, content: bytes) -> bool:
+    """Returns True if a server replied to a compressed request as it cannot read it
+
+    :param status: HTTP status code of the response
+    :param content: the decompressed body of the response
+    """
+    if status == 415:
+        return True
+    if status != 400:
+        return False
+
+    # goloop replies to an invalid JSON-RPC request with 400 and an error body
+    try:
+        data = json.loads(content)
+    except ValueError:
+        return True
+    return not (isinstance(data, list) or (isinstance(data, dict) and "error" in data))
+
+
+def check_resendable(status: int, data: Any, url: str, user_data: Any):
+    """Raises TransportException if data may have been processed and changes states
+
+    A server which replied 415 did not process the body, so it is always sent again.
+    A write rejected with 400 and a non-JSON body is not sent twice,
+    as it is not known whether the server processed it.
+    """
+    if status == 415:
+        return
+
+    items = data if isinstance(data, list) else [data]
+    if any(not Method.is_read_only(item.get("method", "")) for item in items):
+        raise TransportException(
+            f"Compressed request rejected, send it again: {url}", user_data
+        )
+
+
+def group_by_url(
+    rpc_requests: List[RpcRequest], get_url: Callable[[str], str]
+) -> Dict[str, List[RpcRequest]]:
+    """Groups requests by url, so debug methods are sent in a separate batch
+    """
+    groups: Dict[str, List[RpcRequest]] = {}
+    for request in rpc_requests:
+        url = get_url(request.method)
+        request.url = url
+        groups.setdefault(url, []).append(request)
+
+    return groups
+
+
+def get_batch_method(rpc_requests: List[RpcRequest]) -> str:
+    """Returns the method of requests in a batch to count them under, or "batch"
+    """
+    methods = {request.method for request in rpc_requests}
+    return methods.pop() if len(methods) == 1 else "batch"
+
+
+def match_responses(rpc_requests: List[RpcRequest], data: Any) -> List[Dict[str, Any]]:
+    """Returns the responses in a batch response in the order of requests
+    """
+    if isinstance(data, dict):
+        # A server may reply to a whole batch with a single error object
+        return [{**data, "id": request.id} for request in rpc_requests]
+
+    items: Dict[int, Dict[str, Any]] = {
+        item.get("id"): item for item in data if isinstance(item, dict)
+    }
+    return [
+        items.get(
+            request.id,
+            {
+                "jsonrpc": "2.0",
+                "id": request.id,
+                "error": {"code": -32603, "message": "Response not found"},
+            },
+        )
+        for request in rpc_requests
+    ]
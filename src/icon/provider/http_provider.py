@@ -13,28 +13,91 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any
+
 import requests
+from requests.adapters import HTTPAdapter
 
+from .codec import Codec, get_default_codec
+from .http_common import (
+    check_resendable,
+    compress,
+    decode,
+    get_batch_method,
+    group_by_url,
+    is_compression_rejected,
+    match_responses,
+)
+from .metrics import TransportStats
 from .provider import Provider
 from ..builder.method import Method
 from ..data.rpc_request import RpcRequest
-from ..data.rpc_response import RpcResponse
+from ..data.rpc_response import RawRpcResponse, RpcResponse
+from ..exception import TimeoutException, TransportException
+from ..hooks import Hooks
+from ..utils.deadline import get_deadline, get_timeout
 
 
 class HTTPProvider(Provider):
-    def __init__(self, base_url: str, version: int = 3):
+    def __init__(
+        self,
+        base_url: str,
+        version: int = 3,
+        *,
+        pool_connections: int = 1,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        timeout: Optional[float] = None,
+        codec: Optional[Codec] = None,
+        compress_threshold: Optional[int] = None,
+    ):
         """
 
         :param base_url: ex) https://localhost:9000
+        :param version: JSON-RPC API version
+        :param pool_connections: the number of host pools to keep
+        :param pool_maxsize: the maximum number of keep-alive connections per host
+        :param pool_block: if True, a caller waits for a free connection
+            instead of opening one beyond pool_maxsize
+        :param timeout: timeout in seconds for requests without a deadline
+        :param codec: codec for request and response bodies (default: the fastest available)
+        :param compress_threshold: request bodies of this size in bytes or larger
+            are sent with gzip (default: None, no compression)
         """
 
         self._base_url = base_url
         self._version = version
-        self._hooks = {}
+        self._timeout = timeout
+        self._codec: Codec = codec if codec is not None else get_default_codec()
+        self._headers = {
+            "Content-Type": self._codec.content_type,
+            "Accept-Encoding": "gzip, deflate",
+        }
+        self._compress_threshold = compress_threshold
+        self._stats = TransportStats()
+        self._hooks = Hooks()
 
         self._url = "/".join((self._base_url, "api", f"v{version}"))
         self._debug_url = "/".join((self._base_url, "api", "debug", f"v{version}"))
 
+        # All threads share one connection pool through the same adapter.
+        # Each thread gets its own Session so that no session state is shared.
+        self._pool_maxsize = pool_maxsize
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     @property
     def base_url(self) -> str:
         return self._base_url
@@ -43,19 +106,172 @@ class HTTPProvider(Provider):
     def version(self) -> int:
         return self._version
 
+    @property
+    def compress_threshold(self) -> Optional[int]:
+        return self._compress_threshold
+
+    @property
+    def stats(self) -> TransportStats:
+        """Bytes on the wire and decoded bytes per method
+
+        Requests in a batch with different methods are counted under "batch".
+        """
+        return self._stats
+
+    @property
+    def hooks(self) -> Hooks:
+        """Hooks called with each requests.Response under "response"
+        """
+        return self._hooks
+
+    def warm_up(self, connections: Optional[int] = None):
+        """Opens keep-alive connections in advance
+
+        :param connections: the number of connections to open (default: pool_maxsize)
+        """
+        if connections is None:
+            connections = self._pool_maxsize
+        connections = max(min(connections, self._pool_maxsize), 1)
+
+        def func(_):
+            self.send(RpcRequest(Method.GET_TOTAL_SUPPLY))
+
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            list(executor.map(func, range(connections)))
+
+    def close(self):
+        """Closes all pooled connections
+        """
+        self._adapter.close()
+        self._hooks.close()
+
     def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
         url = self._get_url(request.method)
         request.url = url
 
-        response: requests.Response = requests.post(url, json=request.to_dict())
+        deadline: Optional[float] = get_deadline(kwargs)
+        response: requests.Response = self._post(
+            url, request.to_dict(), deadline, request, request.method
+        )
 
         if "hooks" in kwargs:
             self._dispatch_hook("response", kwargs["hooks"], response)
 
-        rpc_response = RpcResponse(response.json())
+        if kwargs.get("raw"):
+            rpc_response = RawRpcResponse(response.content, self._codec.decode)
+        else:
+            rpc_response = RpcResponse(
+                decode(self._codec, response.content, url, request)
+            )
         rpc_response.user_data = response
+
+        # Decoding a response is also bound by the deadline
+        get_timeout(deadline, request)
         return rpc_response
 
+    def send_batch(self, rpc_requests: List[RpcRequest], **kwargs) -> List[RpcResponse]:
+        """Sends requests as JSON-RPC 2.0 batch requests
+
+        Requests are grouped by url, so debug methods are sent in a separate batch.
+        Responses are matched with requests by id and returned in the same order.
+        """
+        groups: Dict[str, List[RpcRequest]] = group_by_url(rpc_requests, self._get_url)
+        deadline: Optional[float] = get_deadline(kwargs)
+        rpc_responses: Dict[int, RpcResponse] = {}
+        for url, group in groups.items():
+            response: requests.Response = self._post(
+                url,
+                [request.to_dict() for request in group],
+                deadline,
+                group,
+                get_batch_method(group),
+            )
+
+            if "hooks" in kwargs:
+                self._dispatch_hook("response", kwargs["hooks"], response)
+
+            data = decode(self._codec, response.content, url, group)
+            for request, item in zip(group, match_responses(group, data)):
+                rpc_response = RpcResponse(item)
+                rpc_response.user_data = response
+                rpc_responses[request.id] = rpc_response
+
+        get_timeout(deadline, rpc_requests)
+        return [rpc_responses[request.id] for request in rpc_requests]
+
+    def _post(
+        self,
+        url: str,
+        data: Any,
+        deadline: Optional[float],
+        user_data: Any,
+        method: str,
+    ) -> requests.Response:
+        # The body is encoded only once and sent as it is
+        body: bytes = self._codec.encode(data)
+        wire_body, headers = compress(body, self._compress_threshold, self._headers)
+
+        session: requests.Session = self._get_session()
+        try:
+            # timeout covers both connecting and reading
+            response = session.post(
+                url,
+                data=wire_body,
+                headers=headers,
+                timeout=self._get_timeout(deadline, user_data),
+            )
+
+            if wire_body is not body and is_compression_rejected(
+                response.status_code, response.content
+            ):
+                # The server does not accept compressed bodies. Stop compressing.
+                self._compress_threshold = None
+                check_resendable(response.status_code, data, url, user_data)
+                wire_body, headers = body, self._headers
+                response = session.post(
+                    url,
+                    data=wire_body,
+                    headers=headers,
+                    timeout=self._get_timeout(deadline, user_data),
+                )
+        except requests.Timeout as e:
+            raise TimeoutException(f"Request timed out: {url}", user_data) from e
+        except requests.RequestException as e:
+            raise TransportException(f"Request failed: {url}: {e}", user_data) from e
+
+        self._stats.add(
+            method,
+            len(body),
+            len(wire_body),
+            len(response.content),
+            self._get_wire_size(response),
+        )
+        if self._hooks:
+            self._hooks.dispatch("response", response)
+        return response
+
+    def _get_timeout(self, deadline: Optional[float], user_data: Any):
+        timeout: Optional[float] = get_timeout(deadline, user_data)
+        return self._timeout if timeout is None else timeout
+
+    @staticmethod
+    def _get_wire_size(response: requests.Response) -> int:
+        # raw counts the bytes read from the socket before decompression
+        try:
+            return response.raw.tell()
+        except (AttributeError, OSError):
+            return len(response.content)
+
+    def _get_session(self) -> requests.Session:
+        session: Optional[requests.Session] = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", self._adapter)
+            session.mount("https://", self._adapter)
+            self._local.session = session
+
+        return session
+
     def _get_url(self, method: str) -> str:
         if method in {Method.ESTIMATE_STEP, Method.GET_ACCOUNT}:
             return self._debug_url
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from typing import Dict
+
+
+class TransportStats(object):
+    """Counts bytes on the wire and decoded bytes per JSON-RPC method
+
+    Bytes on the wire differ from decoded bytes when bodies are compressed.
+    """
+
+    KEYS = (
+        "requests",
+        "requestBytes",
+        "requestWireBytes",
+        "responseBytes",
+        "responseWireBytes",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def add(
+        self,
+        method: str,
+        request_bytes: int,
+        request_wire_bytes: int,
+        response_bytes: int,
+        response_wire_bytes: int,
+    ):
+        values = (
+            1,
+            request_bytes,
+            request_wire_bytes,
+            response_bytes,
+            response_wire_bytes,
+        )
+
+        with self._lock:
+            stats = self._stats.get(method)
+            if stats is None:
+                stats = self._stats[method] = dict.fromkeys(self.KEYS, 0)
+
+            for key, value in zip(self.KEYS, values):
+                stats[key] += value
+
+    def to_dict(self) -> Dict[str, Dict[str, int]]:
+        """Returns a snapshot of stats keyed by method
+        """
+        with self._lock:
+            return {method: dict(stats) for method, stats in self._stats.items()}
+
+    def clear(self):
+        with self._lock:
+            self._stats.clear()
+
+
+class QueueStats(object):
+    """Counts time spent waiting for a slot per method class or priority
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def add(self, key: str, delay: float, timed_out: bool = False):
+        with self._lock:
+            stats = self._get_stats(key)
+            stats["timeouts" if timed_out else "acquired"] += 1
+            stats["waitTime"] += delay
+            stats["maxWaitTime"] = max(stats["maxWaitTime"], delay)
+
+    def add_latency(self, key: str, latency: float):
+        """Counts seconds which a call took after it left the queue
+        """
+        with self._lock:
+            stats = self._get_stats(key)
+            stats["calls"] = stats.get("calls", 0) + 1
+            stats["latency"] = stats.get("latency", 0.0) + latency
+            stats["maxLatency"] = max(stats.get("maxLatency", 0.0), latency)
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """Returns a snapshot of stats keyed by method class or priority
+
+        waitTime is the sum of seconds which callers spent in queue.
+        """
+        with self._lock:
+            return {key: dict(stats) for key, stats in self._stats.items()}
+
+    def clear(self):
+        with self._lock:
+            self._stats.clear()
+
+    def _get_stats(self, key: str) -> Dict[str, float]:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = {
+                "acquired": 0,
+                "timeouts": 0,
+                "waitTime": 0.0,
+                "maxWaitTime": 0.0,
+            }
+
+        return stats
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional, Union
+
+from .http_provider import HTTPProvider
+from .provider import Provider
+from ..builder.method import Method
+from ..data.rpc_request import RpcRequest
+from ..data.rpc_response import RpcResponse
+from ..utils.deadline import get_deadline, is_endpoint_failure
+
+
+class Endpoint(object):
+    """Keeps the load and health of a node behind MultiEndpointProvider
+    """
+
+    def __init__(self, provider: Provider, name: str, decay: float):
+        self._provider = provider
+        self._name = name
+        self._decay = decay
+
+        # Moving average of latency in seconds. None means not measured yet
+        self._latency: Optional[float] = None
+        self._in_flight = 0
+        self._failures = 0
+        self._healthy = True
+
+    @property
+    def provider(self) -> Provider:
+        return self._provider
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def latency(self) -> Optional[float]:
+        return self._latency
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def failures(self) -> int:
+        return self._failures
+
+    @property
+    def healthy(self) -> bool:
+        return self._healthy
+
+    @property
+    def score(self) -> float:
+        """Expected time to complete a new request. The lower, the better
+        """
+        latency = self._latency if self._latency is not None else 0.0
+        return latency * (self._in_flight + 1)
+
+    def on_start(self):
+        self._in_flight += 1
+
+    def on_success(self, latency: float):
+        self._in_flight -= 1
+        self._failures = 0
+        self._healthy = True
+        self._update_latency(latency)
+
+    def on_cancel(self):
+        # The request failed for a reason other than this endpoint
+        self._in_flight -= 1
+
+    def on_failure(self, max_failures: int):
+        self._in_flight -= 1
+        self._failures += 1
+        if self._failures >= max_failures:
+            self._healthy = False
+
+    def _update_latency(self, latency: float):
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency = self._decay * latency + (1 - self._decay) * self._latency
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self._name,
+            "latency": self._latency,
+            "inFlight": self._in_flight,
+            "failures": self._failures,
+            "healthy": self._healthy,
+        }
+
+
+class MultiEndpointProvider(Provider):
+    """Spreads requests over multiple nodes
+
+    Each request goes to the healthy endpoint with the lowest expected latency,
+    which is the moving average of its latency multiplied by its requests in flight.
+    An endpoint failing max_failures times in a row is ejected
+    and probed in the background until it responds again.
+    Only transport errors and timeouts of the endpoint count as failures,
+    not the deadline of a caller nor a slot of a governor running out.
+    """
+
+    def __init__(
+        self,
+        endpoints: List[Union[str, Provider]],
+        version: int = 3,
+        *,
+        decay: float = 0.3,
+        max_failures: int = 3,
+        probe_interval: float = 5.0,
+        **kwargs,
+    ):
+        """
+
+        :param endpoints: base urls of nodes (ex: https://localhost:9000) or providers
+        :param version: JSON-RPC API version
+        :param decay: weight of a new latency sample in the moving average (0 < decay <= 1)
+        :param max_failures: the number of consecutive failures to eject an endpoint
+        :param probe_interval: seconds between probes of ejected endpoints
+        :param kwargs: arguments passed to HTTPProvider
+        """
+        if len(endpoints) == 0:
+            raise ValueError("No endpoints")
+
+        self._endpoints: List[Endpoint] = []
+        for endpoint in endpoints:
+            if isinstance(endpoint, str):
+                name = endpoint
+                provider = HTTPProvider(endpoint, version, **kwargs)
+            else:
+                name = getattr(endpoint, "base_url", repr(endpoint))
+                provider = endpoint
+
+            self._endpoints.append(Endpoint(provider, name, decay))
+
+        self._max_failures = max_failures
+        self._probe_interval = probe_interval
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._prober: Optional[threading.Thread] = None
+
+    @property
+    def endpoints(self) -> List[Endpoint]:
+        return list(self._endpoints)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [endpoint.to_dict() for endpoint in self._endpoints]
+
+    def close(self):
+        self._stop_event.set()
+        for endpoint in self._endpoints:
+            endpoint.provider.close()
+
+    def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+        endpoint = self._acquire()
+        return self._run(endpoint, endpoint.provider.send, request, **kwargs)
+
+    def send_batch(self, rpc_requests: List[RpcRequest], **kwargs) -> List[RpcResponse]:
+        endpoint = self._acquire()
+        return self._run(endpoint, endpoint.provider.send_batch, rpc_requests, **kwargs)
+
+    def _acquire(self) -> Endpoint:
+        with self._lock:
+            endpoints = [endpoint for endpoint in self._endpoints if endpoint.healthy]
+            if not endpoints:
+                # All endpoints are ejected; try the least failing ones
+                min_failures = min(endpoint.failures for endpoint in self._endpoints)
+                endpoints = [
+                    endpoint
+                    for endpoint in self._endpoints
+                    if endpoint.failures == min_failures
+                ]
+
+            endpoint = min(
+                endpoints,
+                key=lambda item: (item.score, item.in_flight, random.random()),
+            )
+            endpoint.on_start()
+
+        return endpoint
+
+    def _run(self, endpoint: Endpoint, func, *args, **kwargs):
+        deadline: Optional[float] = get_deadline(kwargs)
+        start = time.monotonic()
+        try:
+            ret = func(*args, **kwargs)
+        except Exception as e:
+            with self._lock:
+                if is_endpoint_failure(e, deadline):
+                    endpoint.on_failure(self._max_failures)
+                    if not endpoint.healthy:
+                        self._start_prober()
+                else:
+                    endpoint.on_cancel()
+            raise
+
+        with self._lock:
+            endpoint.on_success(time.monotonic() - start)
+        return ret
+
+    def _start_prober(self):
+        # The prober starts when an endpoint is ejected for the first time
+        if self._prober is None and self._probe_interval > 0:
+            self._prober = threading.Thread(
+                target=self._probe_loop, name="EndpointProber", daemon=True
+            )
+            self._prober.start()
+
+    def _probe_loop(self):
+        while not self._stop_event.wait(self._probe_interval):
+            for endpoint in self._endpoints:
+                if not endpoint.healthy:
+                    self._probe(endpoint)
+
+    def _probe(self, endpoint: Endpoint):
+        with self._lock:
+            endpoint.on_start()
+
+        try:
+            self._run(
+                endpoint, endpoint.provider.send, RpcRequest(Method.GET_TOTAL_SUPPLY)
+            )
+        except Exception:
+            pass
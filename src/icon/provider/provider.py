@@ -14,6 +14,7 @@
 # limitations under the License.
 
 from abc import ABCMeta, abstractmethod
+from typing import List
 
 from ..data.rpc_request import RpcRequest
 from ..data.rpc_response import RpcResponse
@@ -23,5 +24,18 @@ class Provider(metaclass=ABCMeta):
     """The provider defines how the IconService connects to Loopchain."""
 
     @abstractmethod
-    def send(self, request: RpcRequest) -> RpcResponse:
+    def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
         raise NotImplementedError("Providers must implement this method")
+
+    def send_batch(self, rpc_requests: List[RpcRequest], **kwargs) -> List[RpcResponse]:
+        """Sends multiple requests and returns responses in the same order
+
+        Providers which support JSON-RPC 2.0 batch requests override this method
+        to send them all at once.
+        """
+        return [self.send(request, **kwargs) for request in rpc_requests]
+
+    def close(self):
+        """Releases resources held by the provider like pooled connections
+        """
+        pass
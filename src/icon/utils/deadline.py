@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for per-call deadlines
+
+A deadline is an absolute time in time.monotonic() seconds.
+Callers pass either "deadline" or "timeout" in seconds as a keyword argument.
+"""
+
+__all__ = ("get_deadline", "get_timeout", "is_endpoint_failure", "with_deadline")
+
+import time
+from typing import Any, Dict, Optional
+
+from ..exception import TimeoutException, TransportException
+
+
+def get_deadline(kwargs: Dict[str, Any]) -> Optional[float]:
+    """Returns a deadline from "deadline" or "timeout" in kwargs
+
+    If both are given, the earlier one is used.
+    """
+    deadline: Optional[float] = kwargs.get("deadline")
+
+    timeout: Optional[float] = kwargs.get("timeout")
+    if timeout is not None:
+        value = time.monotonic() + timeout
+        deadline = value if deadline is None else min(deadline, value)
+
+    return deadline
+
+
+def with_deadline(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns a copy of kwargs whose "timeout" is converted to "deadline"
+
+    Nested calls with the returned kwargs share the same deadline.
+    """
+    if "timeout" not in kwargs:
+        return kwargs
+
+    ret = dict(kwargs)
+    ret["deadline"] = get_deadline(ret)
+    del ret["timeout"]
+    return ret
+
+
+def get_timeout(deadline: Optional[float], user_data: Any = None) -> Optional[float]:
+    """Returns seconds left until a given deadline
+
+    :return: None if there is no deadline
+    :raise TimeoutException: the deadline has passed
+    """
+    if deadline is None:
+        return None
+
+    timeout = deadline - time.monotonic()
+    if timeout <= 0:
+        raise TimeoutException("Deadline exceeded", user_data)
+
+    return timeout
+
+
+def is_endpoint_failure(e: Exception, deadline: Optional[float]) -> bool:
+    """Returns True if e says an endpoint failed
+
+    Only a transport error or a timeout of a transport before deadline counts.
+    A deadline check or a governor raises TimeoutException without a cause.
+    """
+    if isinstance(e, TransportException):
+        return True
+    if not isinstance(e, TimeoutException) or e.__cause__ is None:
+        return False
+
+    # A request cut short by the deadline of the caller says nothing of the endpoint
+    return deadline is None or time.monotonic() < deadline
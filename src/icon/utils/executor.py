@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Thread pool with a bounded number of pending calls per priority
+"""
+
+__all__ = ("BoundedExecutor", "Priority")
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from enum import IntEnum
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Tuple
+
+from ..exception import ArgumentException
+from ..provider.metrics import QueueStats
+
+
+class Priority(IntEnum):
+    # Transactions
+    HIGH = 0
+    # Reads which a user waits for
+    NORMAL = 1
+    # Background scans like backfills
+    LOW = 2
+
+    def __str__(self) -> str:
+        return self.name.lower()
+
+
+# (future, fn, args, kwargs, time submitted)
+_WorkItem = Tuple[Future, Callable, tuple, dict, float]
+
+
+class BoundedExecutor(object):
+    """Thread pool which blocks submit() while max_pending calls are pending
+
+    A pending call is one queued or running, so memory for queued calls is bounded
+    and callers are slowed down to the pace of workers.
+
+    Each priority has its own queue and its own max_pending, so a backfill
+    filling the low queue does not block submitting a transaction.
+    A free worker takes a call of the highest priority first
+    and reserved workers are kept from low priority calls.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_pending: int,
+        thread_name_prefix: str = "",
+        *,
+        reserved: int = 0,
+    ):
+        """
+
+        :param max_workers: the number of worker threads
+        :param max_pending: the maximum number of calls queued or running per priority
+        :param thread_name_prefix: the prefix of worker thread names
+        :param reserved: the number of workers which do not run low priority calls
+        """
+        if max_workers < 1 or max_pending < max_workers:
+            raise ArgumentException(
+                f"Invalid arguments: max_workers={max_workers} max_pending={max_pending}"
+            )
+        if not 0 <= reserved < max_workers:
+            raise ArgumentException(f"Invalid reserved: {reserved}")
+
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._thread_name_prefix = thread_name_prefix or "BoundedExecutor"
+        # The maximum number of calls running at once per priority
+        self._limits: Dict[Priority, int] = {
+            priority: max_workers for priority in Priority
+        }
+        self._limits[Priority.LOW] = max_workers - reserved
+
+        self._slots: Dict[Priority, threading.BoundedSemaphore] = {
+            priority: threading.BoundedSemaphore(max_pending) for priority in Priority
+        }
+        self._queues: Dict[Priority, Deque[_WorkItem]] = {
+            priority: deque() for priority in Priority
+        }
+        self._running: Dict[Priority, int] = {priority: 0 for priority in Priority}
+        self._condition = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._idle = 0
+        # Idle workers notified but not awake yet
+        self._waking = 0
+        self._shutdown = False
+        self._stats = QueueStats()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    @property
+    def max_pending(self) -> int:
+        return self._max_pending
+
+    @property
+    def stats(self) -> QueueStats:
+        """Time spent in queue and running per priority
+        """
+        return self._stats
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Schedules fn(*args, **kwargs) with normal priority
+
+        Blocks while max_pending calls of normal priority are pending.
+        """
+        return self.submit_with_priority(Priority.NORMAL, fn, *args, **kwargs)
+
+    def submit_with_priority(
+        self, priority: Priority, fn: Callable, *args, **kwargs
+    ) -> Future:
+        """Schedules fn(*args, **kwargs) and returns a future of its result
+
+        Blocks while max_pending calls of the same priority are pending.
+        """
+        priority = Priority(priority)
+        slots = self._slots[priority]
+        slots.acquire()
+
+        future = Future()
+        future.add_done_callback(lambda _: slots.release())
+        with self._condition:
+            if self._shutdown:
+                slots.release()
+                raise RuntimeError("Cannot submit after shutdown")
+
+            self._queues[priority].append((future, fn, args, kwargs, time.monotonic()))
+            if not self._wake_idle() and len(self._threads) < self._max_workers:
+                self._start_thread()
+
+        return future
+
+    def map(
+        self,
+        fn: Callable,
+        *iterables: Iterable[Any],
+        priority: Priority = Priority.NORMAL,
+    ) -> Iterator[Any]:
+        """Yields fn(*args) for args in zip(*iterables) in order
+
+        Calls are submitted as results are consumed,
+        so at most max_pending calls are ahead of the caller.
+        """
+        futures: Deque[Future] = deque()
+        try:
+            for args in zip(*iterables):
+                if len(futures) >= self._max_pending:
+                    yield futures.popleft().result()
+                futures.append(self.submit_with_priority(priority, fn, *args))
+
+            while futures:
+                yield futures.popleft().result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def shutdown(self, wait: bool = True):
+        """Stops workers after calls in queue are done
+        """
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+            threads = list(self._threads)
+
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def _start_thread(self):
+        name = f"{self._thread_name_prefix}_{len(self._threads)}"
+        thread = threading.Thread(target=self._work, name=name, daemon=True)
+        self._threads.append(thread)
+        thread.start()
+
+    def _wake_idle(self) -> bool:
+        # Wakes an idle worker which no other call has woken yet, under the lock
+        if self._idle <= self._waking:
+            return False
+
+        self._waking += 1
+        self._condition.notify()
+        return True
+
+    def _pop(self) -> Tuple[Priority, _WorkItem]:
+        # Returns a call of the highest priority which can run now or None
+        for priority in Priority:
+            queue = self._queues[priority]
+            while queue and queue[0][0].cancelled():
+                # Dropped without running. Waiters on it are notified.
+                queue.popleft()[0].set_running_or_notify_cancel()
+
+            if queue and self._running[priority] < self._limits[priority]:
+                self._running[priority] += 1
+                return priority, queue.popleft()
+
+        return None
+
+    def _work(self):
+        while True:
+            with self._condition:
+                entry = self._pop()
+                while entry is None:
+                    if self._shutdown and not any(self._queues.values()):
+                        # Wake up the others to exit as well
+                        self._condition.notify_all()
+                        return
+
+                    self._idle += 1
+                    self._condition.wait()
+                    self._idle -= 1
+                    self._waking = max(self._waking - 1, 0)
+                    entry = self._pop()
+
+            priority, (future, fn, args, kwargs, submitted) = entry
+            self._run(priority, future, fn, args, kwargs, submitted)
+
+            with self._condition:
+                self._running[priority] -= 1
+                if any(self._queues.values()):
+                    # A low priority call may be waiting for a free slot
+                    self._wake_idle()
+
+    def _run(
+        self,
+        priority: Priority,
+        future: Future,
+        fn: Callable,
+        args: tuple,
+        kwargs: dict,
+        submitted: float,
+    ):
+        key = str(priority)
+        started = time.monotonic()
+        self._stats.add(key, started - submitted)
+        if not future.set_running_or_notify_cancel():
+            return
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+        self._stats.add_latency(key, time.monotonic() - started)
@@ -13,9 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gzip
+import json
 import os
+import threading
 import time
-from typing import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict
 
 import pytest
 from icon.data import Address, AddressPrefix
@@ -91,10 +95,120 @@ class DummyProvider(Provider):
     def response(self, value: RpcResponse):
         self._response = value
 
-    def send(self, request: RpcRequest) -> RpcResponse:
+    def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
         return self._response
 
 
 @pytest.fixture
 def dummy_provider():
     return DummyProvider()
+
+
+class JSONRPCHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        body: bytes = self.rfile.read(length)
+        self.server.paths.append(self.path)
+        self.server.headers.append(self.headers)
+
+        if self.headers.get("Content-Encoding") == "gzip":
+            if not self.server.accept_gzip:
+                self.send_response(self.server.reject_status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = gzip.decompress(body)
+
+        body = json.loads(body)
+
+        if isinstance(body, list):
+            ret = [self.server.dispatch(item) for item in body]
+        else:
+            ret = self.server.dispatch(body)
+
+        data: bytes = json.dumps(ret).encode("utf-8")
+        self.send_response(self.server.status)
+        self.send_header("Content-Type", "application/json")
+        if self.server.gzip_responses and "gzip" in self.headers.get(
+            "Accept-Encoding", ""
+        ):
+            data = gzip.compress(data)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class JSONRPCServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    class Error(Exception):
+        """Raised in a result function to reply with an error response
+        """
+
+        def __init__(self, code: int, message: str):
+            super().__init__(code, message)
+            self.code = code
+            self.message = message
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), JSONRPCHandler)
+        self.connections = 0
+        self.paths = []
+        self.headers = []
+        self.accept_gzip = True
+        # HTTP status of responses to compressed requests if accept_gzip is False
+        self.reject_status = 415
+        self.gzip_responses = False
+        # HTTP status of responses which are not rejected
+        self.status = 200
+        self.results: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address
+        return f"http://{host}:{port}"
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        func = self.results.get(request["method"])
+        if func is None:
+            return {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": -32601, "message": "Method not found"},
+            }
+
+        try:
+            result = func(request)
+        except self.Error as e:
+            return {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": e.code, "message": e.message},
+            }
+
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+
+@pytest.fixture
+def json_rpc_server():
+    server = JSONRPCServer()
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+from icon.builder import Method
+from icon.client import Client
+from icon.data import (
+    Block,
+    LazyBlock,
+    LazyTransaction,
+    LazyTransactionResult,
+    TransactionResult,
+)
+from icon.data.transaction import BaseTransaction
+from icon.provider import HTTPProvider
+from icon.utils import bytes_to_hex
+
+BLOCK = {
+    "version": "0.5",
+    "height": "0x1050040",
+    "signature": "QotwNw1J7HufCDISyHSSMSPlomS07tM0fZzFfIWg8aRFW90zFfFfYrV1RnwwL1Bb0FEQ7tw4XIDfdNwq+pkHtgE=",
+    "prev_block_hash": "a7fdb4d8207f832a2dbb716c0a5d43cf6f52fc69f375b36a02979b0233b43921",
+    "merkle_tree_root_hash": "0x49c072898557955cef50b2bc2e5a62e20ace4a49961624605a0994dbd62286c5",
+    "time_stamp": 1586090680791618,
+    "block_hash": "c89185360aae47c3a3e633737414e3efce557af165ba976222dad1939e39aec0",
+    "peer_id": "hx6f89b2c25c15f6294c79810221753131067ed3f8",
+    "next_leader": "hx6f89b2c25c15f6294c79810221753131067ed3f8",
+    "confirmed_transaction_list": [
+        {
+            "version": "0x3",
+            "timestamp": "0x5a28a839c3242",
+            "dataType": "base",
+            "data": {
+                "prep": {
+                    "irep": "0x92b17680aa306dedeb8",
+                    "rrep": "0x22f",
+                    "totalDelegation": "0xc0b93aca28aac6ffb961a6",
+                    "value": "0x3f259eb7fcd16c91",
+                },
+                "result": {
+                    "coveredByFee": "0x3612df8756e000",
+                    "coveredByOverIssuedICX": "0x0",
+                    "issue": "0x3eef8bd8757a8c91",
+                },
+            },
+            "txHash": "0x368bc1a545e5e2d4b600439f996bdc0ec949bd3755bf3f7b1c57a0a57b4af526",
+        },
+        {
+            "version": "0x3",
+            "from": "hx894644f1b9b7fa52866b1465ff06c44c3bc79c68",
+            "to": "cx1b97c1abfd001d5cd0b5a3f93f22cccfea77e34e",
+            "timestamp": "0x5a28a82997578",
+            "nid": "0x1",
+            "stepLimit": "0x2625a00",
+            "dataType": "call",
+            "value": "0x1bc16d674ec80000",
+            "data": {"method": "bet_on_numbers", "params": {"numbers": "1,4"}},
+            "signature": "2nx+dUL8MPBroB96I22UsK/+wsU4Nfiyn+k4RhH6E7N4FtvyQgeC4LYdxw1oI4pIX3n6OaLxLFJcH2gOZu/s8wA=",
+            "txHash": "0x926631ff8639daf7c6096081f2db13d9b1dbf5f46ffce209082c9fbb1e493a68",
+        },
+    ],
+}
+
+
+class TestLazyBlock(object):
+    def test_from_dict(self):
+        block = LazyBlock.from_dict(BLOCK)
+        assert isinstance(block, Block)
+        assert repr(block) == repr(Block.from_dict(BLOCK))
+
+    def test_parse_on_access(self):
+        block = LazyBlock.from_dict(BLOCK)
+        assert block.height == 0x1050040
+
+        transactions = block.transactions
+        assert block.transactions is transactions
+        assert isinstance(transactions[0], BaseTransaction)
+
+        tx = transactions[1]
+        assert isinstance(tx, LazyTransaction)
+        assert tx.tx_hash == bytes.fromhex(
+            BLOCK["confirmed_transaction_list"][1]["txHash"][2:]
+        )
+
+        # Only the fields read so far are converted
+        assert set(block._values) == {"height", "transactions"}
+        assert set(tx._values) == {"txHash"}
+        assert tx.raw is BLOCK["confirmed_transaction_list"][1]
+
+    def test_client(self, json_rpc_server):
+        json_rpc_server.results[Method.GET_BLOCK_BY_HEIGHT] = lambda request: BLOCK
+        client = Client(HTTPProvider(json_rpc_server.url))
+
+        assert type(client.get_block_by_height(1)) is Block
+        block = client.get_block_by_height(1, lazy=True)
+        assert isinstance(block, LazyBlock)
+        assert block.height == 0x1050040
+
+
+class TestLazyTransactionResult(object):
+    def test_from_dict(self, block_hash, tx_hash, address, step_price, logs_bloom):
+        data = {
+            "txHash": bytes_to_hex(tx_hash),
+            "blockHeight": "0xe65585",
+            "blockHash": bytes_to_hex(block_hash),
+            "txIndex": "0x2",
+            "to": str(address),
+            "stepUsed": "0x186a0",
+            "stepPrice": hex(step_price),
+            "cumulativeStepUsed": "0x12345678",
+            "eventLogs": [
+                {
+                    "scoreAddress": "cx0000000000000000000000000000000000000000",
+                    "indexed": [
+                        "ICXTransfer(Address,Address,int)",
+                        str(address),
+                        str(address),
+                        "0x1",
+                    ],
+                    "data": [],
+                }
+            ],
+            "logsBloom": bytes_to_hex(logs_bloom),
+            "status": "0x0",
+            "failure": {"code": "0x7d64", "message": "Out of balance"},
+        }
+
+        tx_result = LazyTransactionResult.from_dict(data)
+        assert not tx_result.success
+        assert tx_result.fee == step_price * 0x186A0
+        assert set(tx_result._values) == {"status", "stepPrice", "stepUsed"}
+        assert tx_result.event_logs is tx_result.event_logs
+        assert repr(tx_result) == repr(TransactionResult.from_dict(data))
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+from icon.data import RawRpcResponse
+
+
+class TestRawRpcResponse(object):
+    @pytest.mark.parametrize(
+        "content,_id",
+        (
+            (b'{"jsonrpc":"2.0","result":{"id":5},"id":1}', 1),
+            (b'{"jsonrpc": "2.0", "id": "a\\"b", "result": [{"id": 2}]}', 'a"b'),
+            (b'{"jsonrpc":"2.0","result":{"id":5},"id":null}\n', None),
+        ),
+    )
+    def test_envelope(self, content: bytes, _id):
+        response = RawRpcResponse(content)
+        assert response.id == _id
+        assert response.error is None
+        assert response.content is content
+        # The body is not decoded
+        assert response._json is None
+
+    def test_error(self):
+        content = (
+            '{"jsonrpc":"2.0","error":{"code":-32000,"message":"result \\"é\\""},"id":3}'
+        ).encode("utf-8")
+        response = RawRpcResponse(content)
+        assert response.error == {"code": -32000, "message": 'result "é"'}
+        assert response.id == 3
+        assert response._json is None
+
+        # "error" in result does not decode the body
+        response = RawRpcResponse(b'{"jsonrpc":"2.0","result":{"error":"0x1"},"id":4}')
+        assert response.error is None
+        assert response._json is None
+
+    def test_decode(self):
+        # id is neither before result nor at the end
+        response = RawRpcResponse(b'{"result":{"x":{"id":3}},"id":7,"n":0}')
+        assert response.id == 7
+        assert response.result == {"x": {"id": 3}}
+
+    @pytest.mark.parametrize(
+        "content",
+        (
+            b'{"jsonrpc":"2.0","result":{"id":5},"id":1}',
+            b'{"jsonrpc":"2.0","id":1,"result":"0x1"}',
+            b'{"jsonrpc":"2.0","error":{"code":-1,"message":"m"},"id":1}',
+            b'{"result":"0x1","id":1,"n":0}',
+        ),
+    )
+    def test_with_id(self, content: bytes):
+        response = RawRpcResponse(content)
+        assert response.with_id(1) is response
+
+        other = response.with_id("a")
+        assert other.id == "a"
+        assert json.loads(other.content) == {**json.loads(content), "id": "a"}
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+from icon.builder import Method
+from icon.client import Client
+from icon.data import RpcRequest, RpcResponse
+from icon.exception import ArgumentException, TimeoutException, TransportException
+from icon.provider import (
+    AIMDController,
+    AIMDLimit,
+    AdaptiveProvider,
+    AsyncAdaptiveProvider,
+    AsyncProvider,
+    Provider,
+)
+
+
+class FakeProvider(Provider):
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.status = 200
+        self.timeout = False
+        self.error = False
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.batch_sizes = []
+        self._lock = threading.Lock()
+
+    def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+
+        if self.timeout:
+            raise TimeoutException("Request timed out", request) from TimeoutError()
+        if self.error:
+            raise TransportException("Invalid response", request)
+        response = RpcResponse({"jsonrpc": "2.0", "id": request.id, "result": "0x0"})
+        response.user_data = SimpleNamespace(status_code=self.status)
+        return response
+
+    def send_batch(self, rpc_requests, **kwargs):
+        self.batch_sizes.append(len(rpc_requests))
+        return [self.send(request) for request in rpc_requests]
+
+
+class TestAIMDController(object):
+    def test_limit(self):
+        limit = AIMDLimit(4, 2, 6)
+        limit.grow()
+        limit.grow()
+        limit.grow()
+        assert limit.value == 6
+        limit.shrink()
+        assert limit.value == 3
+        limit.shrink()
+        assert limit.value == 2
+
+        with pytest.raises(ArgumentException):
+            AIMDLimit(1, 2, 6)
+        with pytest.raises(ArgumentException):
+            AIMDLimit(4, decrease=1.0)
+
+    def test_observe(self):
+        controller = AIMDController(AIMDLimit(4, 1, 64), AIMDLimit(20, 1, 500, 10))
+
+        # Grows by one for every round of requests which reach the limit
+        for _ in range(4):
+            controller.observe(time.monotonic(), 0.01, in_flight=4)
+        assert controller.concurrency == 5
+
+        # Does not grow while the limit is not reached
+        controller.observe(time.monotonic(), 0.01, in_flight=1)
+        assert controller.concurrency == 5
+
+        controller.observe(time.monotonic(), 0.2, size=20, in_flight=5)
+        assert controller.batch_size == 30
+
+        # A latency over twice the average shrinks both limits
+        started = time.monotonic()
+        controller.observe(started, 1.0, size=30, in_flight=5)
+        assert controller.concurrency == 2
+        assert controller.batch_size == 15
+
+        # A timeout of a request started before the shrink is counted once
+        controller.observe(started, 1.0, timed_out=True)
+        assert controller.concurrency == 2
+        controller.observe(time.monotonic(), 1.0, rate_limited=True)
+        assert controller.concurrency == 1
+
+        stats = controller.to_dict()
+        assert stats["concurrency"] == 1
+        assert stats["batchSize"] == 15
+        assert stats["decreases"] == 2
+        assert stats["timeouts"] == 1
+        assert stats["rateLimited"] == 1
+
+    def test_batch_latency(self):
+        controller = AIMDController(AIMDLimit(8))
+
+        # A large batch request takes long, but less per request than a single one
+        controller.observe(time.monotonic(), 1.0, size=500, in_flight=8)
+        for _ in range(5):
+            controller.observe(time.monotonic(), 0.05, in_flight=1)
+        assert controller.concurrency == 8
+
+        stats = controller.to_dict()
+        assert stats["decreases"] == 0
+        assert stats["latency"] == pytest.approx(0.05)
+        assert stats["batchLatency"] == pytest.approx(0.002)
+
+    def test_max_latency(self):
+        controller = AIMDController(AIMDLimit(8), max_latency=0.5)
+        controller.observe(time.monotonic(), 0.6, in_flight=8)
+        assert controller.concurrency == 4
+
+
+class TestAdaptiveProvider(object):
+    def test_concurrency(self):
+        fake = FakeProvider(latency=0.01)
+        controller = AIMDController(AIMDLimit(2, 1, 4))
+        provider = AdaptiveProvider(fake, controller)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(
+                executor.map(
+                    lambda _: provider.send(RpcRequest(Method.GET_LAST_BLOCK)),
+                    range(40),
+                )
+            )
+        assert fake.max_in_flight <= 4
+        assert controller.concurrency == 4
+
+        fake.status = 429
+        provider.send(RpcRequest(Method.GET_LAST_BLOCK))
+        assert controller.concurrency == 2
+
+        fake.timeout = True
+        with pytest.raises(TimeoutException):
+            provider.send(RpcRequest(Method.GET_LAST_BLOCK))
+        assert controller.concurrency == 1
+
+    def test_failure(self):
+        fake = FakeProvider()
+        fake.error = True
+        controller = AIMDController(AIMDLimit(4))
+        provider = AdaptiveProvider(fake, controller)
+
+        # Like an error page of a proxy which does not decode
+        with pytest.raises(TransportException):
+            provider.send(RpcRequest(Method.GET_LAST_BLOCK))
+        assert controller.concurrency == 2
+        assert controller.to_dict()["failures"] == 1
+
+    def test_not_node_failure(self):
+        controller = AIMDController(AIMDLimit(4))
+
+        class DeadlineProvider(FakeProvider):
+            def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+                # From a deadline check or a governor
+                raise TimeoutException("Deadline exceeded", request)
+
+        provider = AdaptiveProvider(DeadlineProvider(), controller)
+        with pytest.raises(TimeoutException):
+            provider.send(RpcRequest(Method.GET_LAST_BLOCK))
+
+        # A transport timeout after the deadline of the caller
+        fake = FakeProvider()
+        fake.timeout = True
+        provider = AdaptiveProvider(fake, controller)
+        with pytest.raises(TimeoutException):
+            provider.send(RpcRequest(Method.GET_LAST_BLOCK), deadline=time.monotonic())
+
+        assert controller.concurrency == 4
+        assert controller.to_dict()["decreases"] == 0
+
+    def test_deadline(self):
+        fake = FakeProvider(latency=0.2)
+        provider = AdaptiveProvider(fake, AIMDController(AIMDLimit(1, 1, 1)))
+
+        thread = threading.Thread(
+            target=provider.send, args=(RpcRequest(Method.GET_LAST_BLOCK),)
+        )
+        thread.start()
+        time.sleep(0.05)
+        with pytest.raises(TimeoutException):
+            provider.send(RpcRequest(Method.GET_LAST_BLOCK), timeout=0.05)
+        thread.join()
+
+    def test_client_batch(self):
+        fake = FakeProvider()
+        controller = AIMDController(batch_size=AIMDLimit(2, 1, 8, increase=2))
+        client = Client(AdaptiveProvider(fake, controller))
+        assert client.controller is controller
+
+        with client.batch(max_size=None) as batch:
+            for _ in range(12):
+                batch.get_last_block()
+
+        # Each full batch request grows the batch size
+        assert fake.batch_sizes == [2, 4, 6]
+
+    def test_async(self):
+        class AsyncFakeProvider(AsyncProvider):
+            def __init__(self):
+                self.in_flight = 0
+                self.max_in_flight = 0
+
+            async def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                await asyncio.sleep(0.01)
+                self.in_flight -= 1
+                return RpcResponse({"jsonrpc": "2.0", "id": request.id, "result": 1})
+
+        async def main():
+            fake = AsyncFakeProvider()
+            provider = AsyncAdaptiveProvider(fake, AIMDController(AIMDLimit(2, 1, 3)))
+            await asyncio.gather(
+                *(provider.send(RpcRequest(Method.GET_LAST_BLOCK)) for _ in range(30))
+            )
+            return fake.max_in_flight, provider.controller.concurrency
+
+        max_in_flight, concurrency = asyncio.run(main())
+        assert max_in_flight <= 3
+        assert concurrency == 3
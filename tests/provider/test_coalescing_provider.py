@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from icon.builder import Method
+from icon.client import Client
+from icon.data import RpcRequest, RpcResponse
+from icon.exception import TimeoutException
+from icon.provider import (
+    AsyncCoalescingProvider,
+    AsyncProvider,
+    CoalescingProvider,
+    Provider,
+)
+
+
+class CountingProvider(Provider):
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+        with self._lock:
+            self.count += 1
+        time.sleep(self.latency)
+        return RpcResponse(
+            {"jsonrpc": "2.0", "id": request.id, "result": dict(request.params)}
+        )
+
+
+class AsyncCountingProvider(AsyncProvider):
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.count = 0
+
+    async def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+        self.count += 1
+        await asyncio.sleep(self.latency)
+        return RpcResponse({"jsonrpc": "2.0", "id": request.id, "result": "0x1"})
+
+
+class TestCoalescingProvider(object):
+    def test_coalesce_identical_reads(self):
+        counting = CountingProvider(0.2)
+        provider = CoalescingProvider(counting)
+
+        def func(i: int) -> RpcResponse:
+            # The order of params does not matter
+            params = {"a": "0x1", "b": "0x2"} if i % 2 else {"b": "0x2", "a": "0x1"}
+            return provider.send(RpcRequest(Method.GET_SCORE_API, params))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(executor.map(func, range(8)))
+
+        assert counting.count == 1
+        assert provider.coalesced == 7
+        assert all(response.result is responses[0].result for response in responses)
+        # Each response has the id of its request
+        assert len({response.id for response in responses}) == 8
+
+        # A request after the call has completed makes a new call
+        func(0)
+        assert counting.count == 2
+
+    def test_no_coalesce(self):
+        counting = CountingProvider(0.1)
+        provider = CoalescingProvider(counting)
+
+        requests = [
+            RpcRequest(Method.GET_BALANCE, {"address": "hx0"}),
+            RpcRequest(Method.GET_BALANCE, {"address": "hx1"}),
+            RpcRequest(Method.SEND_TRANSACTION, {"nonce": "0x0"}),
+            RpcRequest(Method.SEND_TRANSACTION, {"nonce": "0x0"}),
+        ]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(provider.send, requests))
+
+        assert counting.count == 4
+        assert provider.coalesced == 0
+
+    def test_waiter_deadline(self):
+        provider = CoalescingProvider(CountingProvider(0.5))
+        request = RpcRequest(Method.GET_BALANCE, {"address": "hx0"})
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(provider.send, request)
+            time.sleep(0.1)
+            with pytest.raises(TimeoutException):
+                provider.send(
+                    RpcRequest(Method.GET_BALANCE, {"address": "hx0"}), timeout=0.1
+                )
+            assert future.result().result == {"address": "hx0"}
+
+    def test_share_converted_result(self):
+        provider = CoalescingProvider(CountingProvider(0.2))
+        client = Client(provider)
+
+        def from_dict(result) -> object:
+            return object()
+
+        def func(_) -> object:
+            response = client.send_request(
+                RpcRequest(Method.GET_BLOCK_BY_HEIGHT, {"height": "0x1"})
+            )
+            return Client._convert(response, from_dict)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            blocks = list(executor.map(func, range(4)))
+
+        assert provider.coalesced == 3
+        assert all(block is blocks[0] for block in blocks)
+
+
+class TestAsyncCoalescingProvider(object):
+    def test_coalesce_identical_reads(self):
+        counting = AsyncCountingProvider(0.1)
+        provider = AsyncCoalescingProvider(counting)
+
+        requests = [RpcRequest(Method.GET_TOTAL_SUPPLY, {}) for _ in range(10)]
+
+        async def main():
+            return await asyncio.gather(
+                *[provider.send(request) for request in requests]
+            )
+
+        responses = asyncio.run(main())
+        assert counting.count == 1
+        assert provider.coalesced == 9
+        assert all(response.result == "0x1" for response in responses)
+        assert [response.id for response in responses] == [
+            request.id for request in requests
+        ]
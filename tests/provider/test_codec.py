@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import importlib.util
+
+import pytest
+from icon.builder import Method
+from icon.data import RpcRequest
+from icon.provider import Codec, HTTPProvider, JSONCodec, OrjsonCodec
+from icon.provider.codec import get_default_codec
+
+CODECS = [JSONCodec]
+if importlib.util.find_spec("orjson") is not None:
+    CODECS.append(OrjsonCodec)
+
+
+class TestCodec(object):
+    @pytest.mark.parametrize("codec_class", CODECS)
+    def test_encode_decode(self, codec_class):
+        codec: Codec = codec_class()
+        request = RpcRequest(
+            Method.CALL, {"to": "cx" + "0" * 40, "data": {"method": "name"}}
+        )
+
+        data: bytes = codec.encode(request.to_dict())
+        assert isinstance(data, bytes)
+        assert codec.decode(data) == request.to_dict()
+
+    @pytest.mark.parametrize("codec_class", CODECS)
+    def test_big_int(self, codec_class):
+        codec: Codec = codec_class()
+        o = {"result": {"supply": 2 ** 80, "values": [-(2 ** 70), 1]}}
+
+        data: bytes = codec.encode(o)
+        assert data == b'{"result":{"supply":%d,"values":[%d,1]}}' % (
+            2 ** 80,
+            -(2 ** 70),
+        )
+        assert codec.decode(data) == o
+        assert codec.decode(b'{"result":"%d"}' % 2 ** 80) == {"result": str(2 ** 80)}
+
+    def test_get_default_codec(self):
+        assert isinstance(get_default_codec(), CODECS[-1])
+
+    @pytest.mark.parametrize("codec_class", CODECS)
+    def test_provider(self, json_rpc_server, codec_class):
+        json_rpc_server.results[Method.GET_SCORE_API] = lambda req: [
+            {"type": "function", "name": "name"}
+        ]
+
+        with HTTPProvider(json_rpc_server.url, codec=codec_class()) as provider:
+            response = provider.send(RpcRequest(Method.GET_SCORE_API, {}))
+            assert response.result == [{"type": "function", "name": "name"}]
+
+            responses = provider.send_batch(
+                [RpcRequest(Method.GET_SCORE_API, {}) for _ in range(2)]
+            )
+            assert [response.result[0]["name"] for response in responses] == [
+                "name",
+                "name",
+            ]
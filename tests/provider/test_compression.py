@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+from icon.builder import Method
+from icon.data import RpcRequest
+from icon.exception import TransportException
+from icon.provider import HTTPProvider, TransportStats
+
+
+def _deploy_request(size: int) -> RpcRequest:
+    return RpcRequest(
+        Method.SEND_TRANSACTION, {"data": {"content": "0x" + "00" * size}}
+    )
+
+
+class TestTransportStats(object):
+    def test_add(self):
+        stats = TransportStats()
+        stats.add(Method.GET_BLOCK_BY_HEIGHT, 10, 10, 1000, 100)
+        stats.add(Method.GET_BLOCK_BY_HEIGHT, 10, 10, 2000, 200)
+
+        assert stats.to_dict() == {
+            Method.GET_BLOCK_BY_HEIGHT: {
+                "requests": 2,
+                "requestBytes": 20,
+                "requestWireBytes": 20,
+                "responseBytes": 3000,
+                "responseWireBytes": 300,
+            }
+        }
+
+        stats.clear()
+        assert stats.to_dict() == {}
+
+
+class TestCompression(object):
+    def test_compressed_response(self, json_rpc_server):
+        json_rpc_server.gzip_responses = True
+        json_rpc_server.results[Method.GET_BLOCK_BY_HEIGHT] = lambda req: "0" * 10000
+
+        with HTTPProvider(json_rpc_server.url) as provider:
+            response = provider.send(
+                RpcRequest(Method.GET_BLOCK_BY_HEIGHT, {"height": "0x1"})
+            )
+
+        assert response.result == "0" * 10000
+        assert "gzip" in json_rpc_server.headers[0]["Accept-Encoding"]
+
+        stats = provider.stats.to_dict()[Method.GET_BLOCK_BY_HEIGHT]
+        assert stats["requests"] == 1
+        assert stats["responseBytes"] > 10000
+        assert stats["responseWireBytes"] < 1000
+
+    def test_compressed_request(self, json_rpc_server):
+        json_rpc_server.results[Method.SEND_TRANSACTION] = lambda req: len(
+            req["params"]["data"]["content"]
+        )
+
+        with HTTPProvider(json_rpc_server.url, compress_threshold=1024) as provider:
+            # Small bodies are not compressed
+            provider.send(RpcRequest(Method.GET_TOTAL_SUPPLY))
+            assert "Content-Encoding" not in json_rpc_server.headers[-1]
+
+            response = provider.send(_deploy_request(10000))
+            assert response.result == 20002
+            assert json_rpc_server.headers[-1]["Content-Encoding"] == "gzip"
+
+        stats = provider.stats.to_dict()[Method.SEND_TRANSACTION]
+        assert stats["requestBytes"] > 20000
+        assert stats["requestWireBytes"] < 1000
+
+    def test_compression_rejected(self, json_rpc_server):
+        json_rpc_server.accept_gzip = False
+        json_rpc_server.results[Method.CALL] = lambda req: "0x1"
+        json_rpc_server.results[Method.SEND_TRANSACTION] = lambda req: "0x1"
+        call = RpcRequest(Method.CALL, {"data": {"params": "0x" + "00" * 10000}})
+
+        with HTTPProvider(json_rpc_server.url, compress_threshold=1024) as provider:
+            assert provider.send(call).result == "0x1"
+            assert provider.compress_threshold is None
+
+            assert provider.send(call).result == "0x1"
+
+        # Only the first request is sent twice
+        assert [
+            headers.get("Content-Encoding") for headers in json_rpc_server.headers
+        ] == ["gzip", None, None]
+
+    def test_write_resent_on_415(self, json_rpc_server):
+        json_rpc_server.accept_gzip = False
+        json_rpc_server.results[Method.SEND_TRANSACTION] = lambda req: "0x1"
+
+        with HTTPProvider(json_rpc_server.url, compress_threshold=1024) as provider:
+            # The server did not process the body
+            assert provider.send(_deploy_request(10000)).result == "0x1"
+            assert provider.compress_threshold is None
+
+        assert [
+            headers.get("Content-Encoding") for headers in json_rpc_server.headers
+        ] == ["gzip", None]
+
+    def test_write_not_resent(self, json_rpc_server):
+        json_rpc_server.accept_gzip = False
+        json_rpc_server.reject_status = 400
+        json_rpc_server.results[Method.SEND_TRANSACTION] = lambda req: "0x1"
+
+        with HTTPProvider(json_rpc_server.url, compress_threshold=1024) as provider:
+            with pytest.raises(TransportException):
+                provider.send(_deploy_request(10000))
+            assert provider.compress_threshold is None
+
+            assert provider.send(_deploy_request(10000)).result == "0x1"
+
+        assert [
+            headers.get("Content-Encoding") for headers in json_rpc_server.headers
+        ] == ["gzip", None]
+
+    def test_json_rpc_error(self, json_rpc_server):
+        # goloop replies to invalid params with 400 and a JSON-RPC error
+        json_rpc_server.status = 400
+
+        with HTTPProvider(json_rpc_server.url, compress_threshold=1024) as provider:
+            response = provider.send(_deploy_request(10000))
+            assert response.error["code"] == -32601
+            assert provider.compress_threshold == 1024
+
+        assert len(json_rpc_server.headers) == 1
+
+    def test_batch_stats(self, json_rpc_server):
+        json_rpc_server.results[Method.GET_BALANCE] = lambda req: "0x0"
+        json_rpc_server.results[Method.GET_TOTAL_SUPPLY] = lambda req: "0x1"
+
+        with HTTPProvider(json_rpc_server.url) as provider:
+            provider.send_batch(
+                [RpcRequest(Method.GET_BALANCE, {"address": "hx0"}) for _ in range(2)]
+            )
+            provider.send_batch(
+                [RpcRequest(Method.GET_BALANCE), RpcRequest(Method.GET_TOTAL_SUPPLY)]
+            )
+
+        stats = provider.stats.to_dict()
+        assert stats.keys() == {Method.GET_BALANCE, "batch"}
+        assert stats["batch"]["requests"] == 1
+
+    def test_async_compression(self, json_rpc_server):
+        pytest.importorskip("aiohttp")
+        from icon.provider import AsyncHTTPProvider
+
+        json_rpc_server.gzip_responses = True
+        json_rpc_server.results[Method.SEND_TRANSACTION] = lambda req: "0" * 10000
+
+        async def main():
+            async with AsyncHTTPProvider(
+                json_rpc_server.url, compress_threshold=1024
+            ) as provider:
+                response = await provider.send(_deploy_request(10000))
+                return provider, response
+
+        provider, response = asyncio.run(main())
+        assert response.result == "0" * 10000
+        assert json_rpc_server.headers[-1]["Content-Encoding"] == "gzip"
+
+        stats = provider.stats.to_dict()[Method.SEND_TRANSACTION]
+        assert stats["requestWireBytes"] < 1000 < stats["requestBytes"]
+        assert stats["responseWireBytes"] < 1000 < stats["responseBytes"]
+
+    def test_async_corrupt_response(self):
+        pytest.importorskip("aiohttp")
+        from icon.provider import AsyncHTTPProvider
+
+        with pytest.raises(TransportException):
+            AsyncHTTPProvider._decompress(b"corrupt", "gzip", "url", None)
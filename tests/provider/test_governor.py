@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from icon.builder import Method
+from icon.data import RpcRequest, RpcResponse
+from icon.exception import TimeoutException
+from icon.provider import (
+    AsyncGovernedProvider,
+    AsyncGovernor,
+    AsyncProvider,
+    GovernedProvider,
+    Governor,
+    Limit,
+    Provider,
+)
+from icon.provider.governor import MethodClass, TokenBucket
+
+
+class TrackingProvider(Provider):
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.times = []
+        self._lock = threading.Lock()
+
+    def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.times.append(time.monotonic())
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+        return RpcResponse({"jsonrpc": "2.0", "id": request.id, "result": "0x0"})
+
+
+class AsyncTrackingProvider(AsyncProvider):
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.latency)
+        self.in_flight -= 1
+        return RpcResponse({"jsonrpc": "2.0", "id": request.id, "result": "0x0"})
+
+
+def test_method_class():
+    assert MethodClass.of(Method.GET_BALANCE) == MethodClass.READ
+    assert MethodClass.of(Method.SEND_TRANSACTION) == MethodClass.WRITE
+    assert MethodClass.of(Method.ESTIMATE_STEP) == MethodClass.DEBUG
+    assert MethodClass.of(Method.GET_ACCOUNT) == MethodClass.DEBUG
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+    # No token is taken if it cannot be used in time
+    assert bucket.reserve(max_wait=0.1) is None
+    assert bucket.reserve() == pytest.approx(0.3, abs=0.01)
+
+
+class TestGovernedProvider(object):
+    def test_rate(self):
+        tracking = TrackingProvider()
+        provider = GovernedProvider(tracking, Governor(read=Limit(rate=20, burst=1)))
+
+        for _ in range(5):
+            provider.send(RpcRequest(Method.GET_BALANCE, {}))
+
+        # Requests are spaced by 1 / rate
+        assert tracking.times[-1] - tracking.times[0] >= 0.19
+        stats = provider.governor.stats.to_dict()[MethodClass.READ]
+        assert stats["acquired"] == 5
+        assert stats["waitTime"] >= 0.19
+
+    def test_max_in_flight(self):
+        tracking = TrackingProvider(0.05)
+        governor = Governor(read=Limit(max_in_flight=2), write=Limit(max_in_flight=1))
+        provider = GovernedProvider(tracking, governor)
+
+        def func(i: int):
+            method = Method.SEND_TRANSACTION if i % 4 == 0 else Method.GET_BALANCE
+            provider.send(RpcRequest(method, {}))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(func, range(16)))
+
+        assert tracking.max_in_flight <= 3
+        stats = governor.stats.to_dict()
+        assert stats[MethodClass.READ]["acquired"] == 12
+        assert stats[MethodClass.WRITE]["acquired"] == 4
+
+    def test_deadline(self):
+        governor = Governor(write=Limit(rate=1, burst=1))
+        provider = GovernedProvider(TrackingProvider(), governor)
+
+        provider.send(RpcRequest(Method.SEND_TRANSACTION, {}))
+        with pytest.raises(TimeoutException):
+            provider.send(RpcRequest(Method.SEND_TRANSACTION, {}), timeout=0.1)
+
+        # Reads are not limited
+        provider.send(RpcRequest(Method.GET_BALANCE, {}), timeout=0.1)
+        assert governor.stats.to_dict()[MethodClass.WRITE]["timeouts"] == 1
+
+    def test_batch(self):
+        governor = Governor(read=Limit(max_in_flight=1), debug=Limit(max_in_flight=1))
+        provider = GovernedProvider(TrackingProvider(), governor)
+
+        provider.send_batch(
+            [RpcRequest(Method.GET_BALANCE, {}), RpcRequest(Method.ESTIMATE_STEP, {})]
+        )
+        stats = governor.stats.to_dict()
+        assert stats[MethodClass.READ]["acquired"] == 1
+        assert stats[MethodClass.DEBUG]["acquired"] == 1
+
+
+class TestAsyncGovernedProvider(object):
+    def test_max_in_flight(self):
+        tracking = AsyncTrackingProvider(0.05)
+        provider = AsyncGovernedProvider(
+            tracking, AsyncGovernor(read=Limit(rate=100, max_in_flight=3))
+        )
+
+        async def main():
+            await asyncio.gather(
+                *[provider.send(RpcRequest(Method.GET_BALANCE, {})) for _ in range(10)]
+            )
+
+        asyncio.run(main())
+        assert tracking.max_in_flight == 3
+        assert provider.governor.stats.to_dict()[MethodClass.READ]["acquired"] == 10
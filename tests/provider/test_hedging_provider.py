@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import time
+
+from icon.builder import Method
+from icon.data import RpcRequest, RpcResponse
+from icon.exception import TimeoutException
+from icon.provider import (
+    AsyncHedgingProvider,
+    AsyncProvider,
+    HedgingProvider,
+    Provider,
+)
+from icon.provider.hedging_provider import LatencyTrackers
+
+
+def _create_response(request: RpcRequest, result: str) -> RpcResponse:
+    return RpcResponse({"jsonrpc": "2.0", "id": request.id, "result": result})
+
+
+class SlowProvider(Provider):
+    def __init__(self, name: str, latency: float, fail: bool = False):
+        self.name = name
+        self.latency = latency
+        self.fail = fail
+        self.count = 0
+        self.started = []
+
+    def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+        self.count += 1
+        self.started.append(time.monotonic())
+        time.sleep(self.latency)
+        if self.fail:
+            raise TimeoutException("Request timed out", request)
+        return _create_response(request, self.name)
+
+
+class AsyncSlowProvider(AsyncProvider):
+    def __init__(self, name: str, latency: float):
+        self.name = name
+        self.latency = latency
+        self.cancelled = 0
+
+    async def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+        try:
+            await asyncio.sleep(self.latency)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return _create_response(request, self.name)
+
+
+class TestHedgingProvider(object):
+    def test_hedge_slow_read(self):
+        slow = SlowProvider("slow", 0.3, fail=True)
+        fast = SlowProvider("fast", 0.0)
+        provider = HedgingProvider(slow, fast, initial_delay=0.01)
+
+        start = time.monotonic()
+        response = provider.send(RpcRequest(Method.GET_BALANCE, {}))
+        assert response.result == "fast"
+        # Sent before the first attempt failed
+        assert fast.started[0] - start < 0.2
+        assert provider.hedged == 1
+        provider.close()
+
+    def test_hedge_slow_successful_read(self):
+        slow = SlowProvider("slow", 0.5)
+        fast = SlowProvider("fast", 0.0)
+        provider = HedgingProvider(slow, fast, initial_delay=0.01)
+
+        start = time.monotonic()
+        response = provider.send(RpcRequest(Method.GET_BALANCE, {}))
+        assert response.result == "fast"
+        # Without waiting for the slow attempt
+        assert time.monotonic() - start < 0.3
+        assert provider.hedged == 1
+        provider.close()
+
+    def test_hedge_failed_read(self):
+        failing = SlowProvider("failing", 0.0, fail=True)
+        fast = SlowProvider("fast", 0.0)
+        provider = HedgingProvider(failing, fast, initial_delay=1.0)
+
+        start = time.monotonic()
+        response = provider.send(RpcRequest(Method.GET_BALANCE, {}))
+        assert response.result == "fast"
+        assert time.monotonic() - start < 0.5
+        assert provider.hedged == 1
+        provider.close()
+
+    def test_no_hedge_for_write(self):
+        slow = SlowProvider("slow", 0.05)
+        fast = SlowProvider("fast", 0.0)
+        provider = HedgingProvider(slow, fast, initial_delay=0.01)
+
+        response = provider.send(RpcRequest(Method.SEND_TRANSACTION, {}))
+        assert response.result == "slow"
+        assert fast.count == 0
+        assert provider.hedged == 0
+        provider.close()
+
+    def test_no_hedge_for_fast_read(self):
+        primary = SlowProvider("primary", 0.0)
+        secondary = SlowProvider("secondary", 0.0)
+        provider = HedgingProvider(primary, secondary, initial_delay=1.0)
+
+        for _ in range(10):
+            assert provider.send(RpcRequest(Method.CALL, {})).result == "primary"
+        assert secondary.count == 0
+        provider.close()
+
+    def test_latency_per_method(self):
+        trackers = LatencyTrackers(95.0, 100, 10, 1.0)
+        for _ in range(10):
+            trackers.get([RpcRequest(Method.GET_BALANCE, {})]).add(0.01)
+
+        assert trackers.get([RpcRequest(Method.GET_BALANCE, {})]).get_delay() == 0.01
+        assert trackers.get([RpcRequest(Method.CALL, {})]).get_delay() == 1.0
+        batch = [RpcRequest(Method.GET_BALANCE, {}) for _ in range(2)]
+        assert trackers.get(batch).get_delay() == 1.0
+
+    def test_async_hedge_cancels_loser(self):
+        slow = AsyncSlowProvider("slow", 1.0)
+        fast = AsyncSlowProvider("fast", 0.0)
+        provider = AsyncHedgingProvider(slow, fast, initial_delay=0.01)
+
+        response = asyncio.run(
+            provider.send(RpcRequest(Method.GET_BLOCK_BY_HEIGHT, {}))
+        )
+        assert response.result == "fast"
+        assert slow.cancelled == 1
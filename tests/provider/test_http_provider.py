@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+import json
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from icon.builder import Method
+from icon.data import RawRpcResponse, RpcRequest, RpcResponse
+from icon.exception import SDKException, TimeoutException, TransportException
+from icon.provider import HTTPProvider
+
+
+class TestHTTPProvider(object):
+    def test_send_reuses_connection(self, json_rpc_server):
+        json_rpc_server.results[Method.GET_TOTAL_SUPPLY] = lambda req: "0x1"
+
+        with HTTPProvider(json_rpc_server.url) as provider:
+            for _ in range(10):
+                response: RpcResponse = provider.send(
+                    RpcRequest(Method.GET_TOTAL_SUPPLY)
+                )
+                assert response.result == "0x1"
+
+        assert json_rpc_server.connections == 1
+
+    def test_send_from_threads(self, json_rpc_server):
+        json_rpc_server.results[Method.GET_BALANCE] = lambda req: req["params"][
+            "address"
+        ]
+        provider = HTTPProvider(json_rpc_server.url, pool_maxsize=4, pool_block=True)
+
+        def func(i: int) -> str:
+            request = RpcRequest(Method.GET_BALANCE, {"address": hex(i)})
+            return provider.send(request).result
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(func, range(100)))
+
+        provider.close()
+        assert results == [hex(i) for i in range(100)]
+        assert json_rpc_server.connections <= 4
+
+    def test_send_raw(self, json_rpc_server):
+        json_rpc_server.results[Method.GET_TOTAL_SUPPLY] = lambda req: "0x1"
+        request = RpcRequest(Method.GET_TOTAL_SUPPLY)
+
+        with HTTPProvider(json_rpc_server.url) as provider:
+            response = provider.send(request, raw=True)
+
+        assert isinstance(response, RawRpcResponse)
+        assert response.id == request.id
+        assert response.error is None
+        assert json.loads(response.content)["result"] == "0x1"
+
+    def test_warm_up(self, json_rpc_server):
+        json_rpc_server.results[Method.GET_TOTAL_SUPPLY] = lambda req: "0x0"
+
+        provider = HTTPProvider(json_rpc_server.url, pool_maxsize=2)
+        provider.warm_up()
+        connections: int = json_rpc_server.connections
+        assert 1 <= connections <= 2
+
+        provider.send(RpcRequest(Method.GET_TOTAL_SUPPLY))
+        assert json_rpc_server.connections == connections
+        provider.close()
+
+    def test_send_timeout(self, json_rpc_server):
+        def get_total_supply(request):
+            time.sleep(0.5)
+            return "0x0"
+
+        json_rpc_server.results[Method.GET_TOTAL_SUPPLY] = get_total_supply
+        request = RpcRequest(Method.GET_TOTAL_SUPPLY)
+
+        with HTTPProvider(json_rpc_server.url) as provider:
+            with pytest.raises(TimeoutException) as exc_info:
+                provider.send(request, timeout=0.1)
+            assert exc_info.value.code == SDKException.Code.TIMEOUT_ERROR
+            assert exc_info.value.user_data is request
+
+            with pytest.raises(TimeoutException):
+                provider.send(request, deadline=time.monotonic() - 1)
+
+    def test_send_transport_error(self):
+        # Nothing listens on the port
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+        sock.close()
+
+        with HTTPProvider(f"http://127.0.0.1:{port}") as provider:
+            with pytest.raises(TransportException) as exc_info:
+                provider.send(RpcRequest(Method.GET_TOTAL_SUPPLY))
+            assert exc_info.value.code == SDKException.Code.TRANSPORT_ERROR
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+import pytest
+from icon.builder import Method
+from icon.data import RpcRequest, RpcResponse
+from icon.exception import TimeoutException, TransportException
+from icon.provider import MultiEndpointProvider, Provider
+
+
+class FakeProvider(Provider):
+    def __init__(self, name: str, latency: float = 0.0):
+        self.base_url = name
+        self.latency = latency
+        self.fail = False
+        self.error = None
+        self.count = 0
+
+    def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+        self.count += 1
+        time.sleep(self.latency)
+        if self.error is not None:
+            raise self.error
+        if self.fail:
+            raise TransportException(self.base_url)
+
+        return RpcResponse({"jsonrpc": "2.0", "id": request.id, "result": "0x0"})
+
+
+class TestMultiEndpointProvider(object):
+    def test_prefer_fast_endpoint(self):
+        fast = FakeProvider("fast", 0.001)
+        slow = FakeProvider("slow", 0.02)
+        provider = MultiEndpointProvider([slow, fast], probe_interval=0)
+
+        for _ in range(50):
+            provider.send(RpcRequest(Method.GET_TOTAL_SUPPLY))
+
+        assert fast.count > slow.count
+        assert slow.count >= 1
+        stats = provider.stats()
+        assert [item["name"] for item in stats] == ["slow", "fast"]
+        assert all(item["inFlight"] == 0 for item in stats)
+
+    def test_eject_and_probe(self):
+        good = FakeProvider("good")
+        bad = FakeProvider("bad")
+        bad.fail = True
+        provider = MultiEndpointProvider(
+            [bad, good], max_failures=1, probe_interval=0.01
+        )
+
+        for _ in range(10):
+            try:
+                provider.send(RpcRequest(Method.GET_TOTAL_SUPPLY))
+            except TransportException:
+                pass
+
+        assert not provider.endpoints[0].healthy
+        assert good.count >= 9
+
+        bad.fail = False
+        deadline = time.monotonic() + 2.0
+        while not provider.endpoints[0].healthy and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert provider.endpoints[0].healthy
+        provider.close()
+
+    def test_not_endpoint_failure(self):
+        fake = FakeProvider("fake")
+        provider = MultiEndpointProvider([fake], max_failures=1, probe_interval=0)
+        request = RpcRequest(Method.GET_TOTAL_SUPPLY)
+
+        # From a deadline check or a governor
+        fake.error = TimeoutException("Deadline exceeded")
+        with pytest.raises(TimeoutException):
+            provider.send(request)
+
+        # A transport timeout after the deadline of the caller
+        fake.error = TimeoutException("Request timed out")
+        fake.error.__cause__ = TimeoutError()
+        with pytest.raises(TimeoutException):
+            provider.send(request, deadline=time.monotonic())
+
+        endpoint = provider.endpoints[0]
+        assert endpoint.healthy
+        assert endpoint.failures == 0
+        assert endpoint.in_flight == 0
+
+        # A transport timeout within the deadline
+        with pytest.raises(TimeoutException):
+            provider.send(request, timeout=10)
+        assert not endpoint.healthy
+
+    def test_no_endpoints(self):
+        with pytest.raises(ValueError):
+            MultiEndpointProvider([])
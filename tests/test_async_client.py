@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import base64
+import hashlib
+import os
+
+import pytest
+from icon.builder import Method
+from icon.data import Address, RpcRequest
+from icon.data.validators import Validators
+from icon.data.vote import Votes
+from icon.exception import JSONRPCException
+from icon.utils import bytes_to_hex, rlp
+
+pytest.importorskip("aiohttp")
+
+from icon import AsyncClient
+from icon.provider import AsyncHTTPProvider
+
+
+class TestAsyncClient(object):
+    @pytest.fixture
+    def server(self, json_rpc_server):
+        def get_balance(request) -> str:
+            address: str = request["params"]["address"]
+            return hex(int(address[2:], 16))
+
+        json_rpc_server.results[Method.GET_BALANCE] = get_balance
+        json_rpc_server.results[Method.GET_TOTAL_SUPPLY] = lambda req: "0x10"
+        return json_rpc_server
+
+    def test_get_balance(self, server):
+        addresses = [Address.from_string(f"hx{i:040x}") for i in range(200)]
+
+        async def func():
+            provider = AsyncHTTPProvider(server.url, limit=10)
+            async with AsyncClient(provider) as client:
+                return await asyncio.gather(
+                    *(client.get_balance(address) for address in addresses)
+                )
+
+        balances = asyncio.run(func())
+        assert balances == list(range(200))
+        assert server.connections <= 10
+
+    def test_send_request(self, server):
+        async def func():
+            async with AsyncClient(AsyncHTTPProvider(server.url)) as client:
+                total_supply: int = await client.get_total_supply()
+                response = await client.send_request(Method.GET_TOTAL_SUPPLY, {})
+                with pytest.raises(JSONRPCException):
+                    await client.get_score_api(Address.from_string(f"cx{0:040x}"))
+
+                responses = await client.send_batch(
+                    [RpcRequest(Method.GET_TOTAL_SUPPLY) for _ in range(3)]
+                )
+                return total_supply, response, responses
+
+        total_supply, response, responses = asyncio.run(func())
+        assert total_supply == 0x10
+        assert response.result == "0x10"
+        assert [response.result for response in responses] == ["0x10"] * 3
+        assert len(server.paths) == 4
+
+
+class TestAsyncClientEx(object):
+    def test_validators_and_votes(self, json_rpc_server):
+        validators = Validators(
+            tuple(Address.from_bytes(b"\x00" + os.urandom(20)) for _ in range(4))
+        )
+        votes = Votes(rlp.rlp_encode([0, [1, os.urandom(32)], [[1, os.urandom(65)]]]))
+        blobs = {
+            bytes_to_hex(hashlib.sha3_256(bytes(data)).digest()): bytes(data)
+            for data in (validators, votes)
+        }
+
+        def get_block_header_by_height(request):
+            height = int(request["params"]["height"], 16)
+            header = rlp.rlp_encode(
+                [
+                    2,
+                    height,
+                    0,
+                    b"\x00" + os.urandom(20),
+                    b"",
+                    hashlib.sha3_256(bytes(votes)).digest(),
+                    hashlib.sha3_256(bytes(validators)).digest(),
+                    b"",
+                    b"",
+                    b"",
+                    b"",
+                ]
+            )
+            return base64.standard_b64encode(header).decode()
+
+        def get_data_by_hash(request):
+            return base64.standard_b64encode(blobs[request["params"]["hash"]]).decode()
+
+        json_rpc_server.results[
+            Method.GET_BLOCK_HEADER_BY_HEIGHT
+        ] = get_block_header_by_height
+        json_rpc_server.results[Method.GET_DATA_BY_HASH] = get_data_by_hash
+
+        async def func():
+            async with AsyncClient(AsyncHTTPProvider(json_rpc_server.url)) as client:
+                header = await client.ex.get_block_header_by_height(10)
+                return (
+                    header.height,
+                    await client.ex.get_validators_by_height(10, timeout=5),
+                    await client.ex.get_votes_by_height(10, timeout=5),
+                )
+
+        height, ret_validators, ret_votes = asyncio.run(func())
+        assert height == 10
+        assert ret_validators == validators
+        assert ret_votes == votes
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+import icon
+import pytest
+from icon.builder import Method
+from icon.data import Address, RpcRequest, RpcResponse
+from icon.exception import ArgumentException, DataTypeException, JSONRPCException
+from icon.provider import HTTPProvider
+
+
+class TestBatch(object):
+    @pytest.fixture
+    def client(self, json_rpc_server):
+        def get_balance(request) -> str:
+            address: str = request["params"]["address"]
+            return hex(int(address[2:], 16))
+
+        json_rpc_server.results[Method.GET_BALANCE] = get_balance
+        json_rpc_server.results[Method.ESTIMATE_STEP] = lambda req: "0x64"
+
+        with icon.Client(HTTPProvider(json_rpc_server.url)) as client:
+            yield client
+
+    def test_send_batch(self, json_rpc_server, client):
+        requests = [
+            RpcRequest(Method.GET_BALANCE, {"address": f"hx{i:040x}"})
+            for i in range(10)
+        ]
+        responses = client.send_batch(requests)
+
+        assert len(json_rpc_server.paths) == 1
+        assert [response.result for response in responses] == [
+            hex(i) for i in range(10)
+        ]
+
+    def test_batch(self, json_rpc_server, client):
+        addresses = [Address.from_string(f"hx{i:040x}") for i in range(500)]
+
+        with client.batch() as batch:
+            balances = [batch.get_balance(address) for address in addresses]
+            unknown = batch.get_total_supply()
+            step = batch.add(RpcRequest(Method.ESTIMATE_STEP, {}))
+
+            with pytest.raises(ArgumentException):
+                _ = balances[0].result
+
+        # one request for /api/v3 and one for /api/debug/v3
+        assert sorted(json_rpc_server.paths) == ["/api/debug/v3", "/api/v3"]
+        assert [item.result for item in balances] == list(range(500))
+        assert step.result == "0x64"
+
+        with pytest.raises(JSONRPCException) as exc_info:
+            _ = unknown.result
+        assert isinstance(exc_info.value.user_data, RpcResponse)
+
+    def test_batch_max_size(self, json_rpc_server, client):
+        addresses = [Address.from_string(f"hx{i:040x}") for i in range(10)]
+
+        batch = client.batch(max_size=3)
+        items = [batch.get_balance(address) for address in addresses]
+        batch.execute()
+
+        assert len(json_rpc_server.paths) == 4
+        assert [item.result for item in items] == list(range(10))
+
+    def test_invalid_result(self, json_rpc_server, client):
+        json_rpc_server.results[Method.GET_TOTAL_SUPPLY] = lambda req: "invalid"
+
+        with client.batch() as batch:
+            supply = batch.get_total_supply()
+            balance = batch.get_balance(Address.from_string(f"hx{1:040x}"))
+
+        # Only the item which fails to convert raises
+        with pytest.raises(DataTypeException) as exc_info:
+            _ = supply.result
+        assert exc_info.value.user_data.result == "invalid"
+        assert balance.result == 1
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+import random
+import threading
+import time
+
+import pytest
+from icon.builder import Method
+from icon.client import Client
+from icon.confirmation import BlockCadence
+from icon.data import RpcRequest, RpcResponse
+from icon.exception import JSONRPCException, TransportException
+from icon.provider import HTTPProvider, Provider
+
+
+class TestIterBlocks(object):
+    def test_iter_blocks(self, json_rpc_server):
+        lock = threading.Lock()
+        failures = {5, 7}
+        stats = {"in_flight": 0, "max_in_flight": 0}
+
+        def get_block_by_height(request):
+            height = int(request["params"]["height"], 16)
+            with lock:
+                stats["in_flight"] += 1
+                stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+                fail = height in failures
+                failures.discard(height)
+
+            time.sleep(random.random() * 0.02)
+            with lock:
+                stats["in_flight"] -= 1
+
+            if fail:
+                raise json_rpc_server.Error(-32000, "Server error")
+            return {"height": hex(height)}
+
+        json_rpc_server.results[Method.GET_BLOCK_BY_HEIGHT] = get_block_by_height
+        client = Client(HTTPProvider(json_rpc_server.url, pool_maxsize=4))
+
+        blocks = list(client.iter_blocks(0, 30, window=4))
+        assert [block["height"] for block in blocks] == [hex(i) for i in range(30)]
+        assert 1 < stats["max_in_flight"] <= 4
+
+    def test_retries(self, json_rpc_server):
+        def get_block_by_height(request):
+            if request["params"]["height"] == "0x3":
+                raise json_rpc_server.Error(-32000, "Server error")
+            return {"height": request["params"]["height"]}
+
+        json_rpc_server.results[Method.GET_BLOCK_BY_HEIGHT] = get_block_by_height
+        client = Client(HTTPProvider(json_rpc_server.url))
+
+        blocks = []
+        with pytest.raises(JSONRPCException):
+            for block in client.iter_blocks(0, 10, window=2, retries=1):
+                blocks.append(block)
+
+        assert len(blocks) == 3
+
+    def test_no_retry_on_permanent_error(self, json_rpc_server):
+        count = {"0x3": 0}
+
+        def get_block_by_height(request):
+            height = request["params"]["height"]
+            if height == "0x3":
+                count[height] += 1
+                raise json_rpc_server.Error(-32602, "Invalid params")
+            return {"height": height}
+
+        json_rpc_server.results[Method.GET_BLOCK_BY_HEIGHT] = get_block_by_height
+        client = Client(HTTPProvider(json_rpc_server.url))
+
+        with pytest.raises(JSONRPCException):
+            list(client.iter_blocks(0, 10, window=2, retries=3))
+        assert count["0x3"] == 1
+
+    def test_timeout_per_request(self, json_rpc_server):
+        def get_block_by_height(request):
+            time.sleep(0.02)
+            return {"height": request["params"]["height"]}
+
+        json_rpc_server.results[Method.GET_BLOCK_BY_HEIGHT] = get_block_by_height
+        client = Client(HTTPProvider(json_rpc_server.url))
+
+        # The whole range takes longer than the timeout of each request
+        blocks = list(client.iter_blocks(0, 40, window=2, timeout=0.3))
+        assert len(blocks) == 40
+
+    def test_transport_error(self):
+        class FlakyProvider(Provider):
+            def __init__(self):
+                self.failures = {3}
+
+            def send(self, request: RpcRequest, **kwargs) -> RpcResponse:
+                height = int(request.params["height"], 16)
+                if height in self.failures:
+                    self.failures.discard(height)
+                    raise TransportException("Connection reset", request)
+                return RpcResponse(
+                    {"jsonrpc": "2.0", "id": request.id, "result": {"height": height}}
+                )
+
+        client = Client(FlakyProvider())
+        blocks = list(client.iter_blocks(0, 5, window=2))
+        assert [block["height"] for block in blocks] == list(range(5))
+
+
+class TestFollowBlocks(object):
+    @staticmethod
+    def _create_chain(heights, fork: str = "a", parent: str = ""):
+        chain = {}
+        for height in heights:
+            block_hash = f"0x{fork}{height:063x}"
+            chain[height] = {
+                "height": hex(height),
+                "block_hash": block_hash,
+                "prev_block_hash": parent,
+                "time_stamp": hex(int(time.time() * 10 ** 6)),
+            }
+            parent = block_hash
+        return chain
+
+    def test_follow_blocks(self, json_rpc_server):
+        chain = self._create_chain(range(5))
+        start = time.monotonic()
+
+        def get_block_by_height(request):
+            height = int(request["params"]["height"], 16)
+            # A new block is produced every 0.1 second after block 2
+            if height > 2 and start + (height - 2) * 0.1 > time.monotonic():
+                raise json_rpc_server.Error(-31004, "NotFound")
+            return chain[height]
+
+        json_rpc_server.results[Method.GET_BLOCK_BY_HEIGHT] = get_block_by_height
+        client = Client(HTTPProvider(json_rpc_server.url), BlockCadence(0.1))
+
+        blocks = []
+        for block in client.follow_blocks(0):
+            blocks.append((block["height"], time.monotonic() - start))
+            if len(blocks) == 5:
+                break
+
+        assert [height for height, _ in blocks] == [hex(i) for i in range(5)]
+        # Each block is yielded soon after it is produced
+        assert blocks[4][1] < 0.35
+
+    def test_wait_at_head(self, json_rpc_server):
+        start = time.time()
+        not_found = []
+
+        def get_block_by_height(request):
+            height = int(request["params"]["height"], 16)
+            # A new block is produced every 0.1 second
+            timestamp = start + height * 0.1
+            if timestamp > time.time():
+                not_found.append(height)
+                raise json_rpc_server.Error(-31004, "NotFound")
+            return {
+                "height": hex(height),
+                "block_hash": f"0x{height:064x}",
+                "prev_block_hash": f"0x{height - 1:064x}" if height > 0 else "",
+                "time_stamp": hex(int(timestamp * 10 ** 6)),
+            }
+
+        json_rpc_server.results[Method.GET_BLOCK_BY_HEIGHT] = get_block_by_height
+        client = Client(HTTPProvider(json_rpc_server.url), BlockCadence(0.1))
+
+        blocks = client.follow_blocks(0)
+        assert [next(blocks)["height"] for _ in range(6)] == [hex(i) for i in range(6)]
+        # Blocks at the head are requested after they are expected
+        assert len(not_found) <= 2
+
+    def test_permanent_error(self, json_rpc_server):
+        def get_block_by_height(request):
+            raise json_rpc_server.Error(-32601, "Method not found")
+
+        json_rpc_server.results[Method.GET_BLOCK_BY_HEIGHT] = get_block_by_height
+        client = Client(HTTPProvider(json_rpc_server.url), BlockCadence(0.1))
+
+        with pytest.raises(JSONRPCException):
+            next(client.follow_blocks(0))
+
+    def test_reorg(self, json_rpc_server):
+        chain = self._create_chain(range(4))
+        requested = []
+
+        def get_block_by_height(request):
+            height = int(request["params"]["height"], 16)
+            requested.append(height)
+            if height not in chain:
+                raise json_rpc_server.Error(-31004, "NotFound")
+            return chain[height]
+
+        json_rpc_server.results[Method.GET_BLOCK_BY_HEIGHT] = get_block_by_height
+        client = Client(HTTPProvider(json_rpc_server.url), BlockCadence(0.1))
+
+        blocks = client.follow_blocks(0)
+        assert [next(blocks)["block_hash"] for _ in range(4)] == [
+            chain[i]["block_hash"] for i in range(4)
+        ]
+
+        # Blocks 2 and 3 are replaced by a fork and block 4 follows the fork
+        chain.update(self._create_chain(range(2, 5), "b", chain[1]["block_hash"]))
+        replaced = [next(blocks) for _ in range(3)]
+        assert [block["block_hash"] for block in replaced] == [
+            chain[i]["block_hash"] for i in (2, 3, 4)
+        ]
+        assert requested[-5:] == [4, 3, 2, 3, 4]
+
+    def test_out_of_sync_node(self, json_rpc_server):
+        chain = self._create_chain(range(3))
+        stale = dict(chain[2], prev_block_hash="0x" + "f" * 64)
+        responses = {2: [stale]}
+
+        def get_block_by_height(request):
+            height = int(request["params"]["height"], 16)
+            if responses.get(height):
+                return responses[height].pop()
+            return chain[height]
+
+        json_rpc_server.results[Method.GET_BLOCK_BY_HEIGHT] = get_block_by_height
+        client = Client(HTTPProvider(json_rpc_server.url), BlockCadence(0.1))
+
+        # Block 1 is not yielded twice
+        blocks = client.follow_blocks(0)
+        assert [next(blocks)["height"] for _ in range(3)] == ["0x0", "0x1", "0x2"]
@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+
+import base64
+import hashlib
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from icon.builder import Method
+from icon.cache import DataStore, DiskCache, ResultCache
+from icon.client import Client
+from icon.data import RawRpcResponse, RpcRequest, RpcResponse
+from icon.data.address import Address
+from icon.data.validators import Validators
+from icon.exception import DataTypeException
+from icon.provider import HTTPProvider
+from icon.utils import bytes_to_hex
+
+
+def _create_response(result) -> RpcResponse:
+    return RpcResponse({"jsonrpc": "2.0", "id": 0, "result": result})
+
+
+class TestResultCache(object):
+    def test_finality(self):
+        cache = ResultCache(finality_depth=1)
+        request = RpcRequest(Method.GET_BLOCK_BY_HEIGHT, {"height": 10})
+
+        # The head height is not known yet
+        cache.put(request, _create_response({"height": 10}))
+        assert cache.get(request) is None
+        assert cache.head_height == 10
+
+        cache.observe_height(11)
+        response = _create_response({"height": 10})
+        cache.put(request, response)
+        hit_request = RpcRequest(Method.GET_BLOCK_BY_HEIGHT, {"height": "0xa"})
+        hit = cache.get(hit_request)
+        assert hit.result is response.result
+        # A hit has the id of the request, not of the one which filled the cache
+        assert hit.id == hit_request.id
+        assert cache.hits == 1
+
+        # A pending transaction is not cached
+        tx_request = RpcRequest(Method.GET_TRANSACTION_BY_HASH, {"txHash": "0x01"})
+        cache.put(tx_request, _create_response({"txHash": "0x01"}))
+        assert cache.get(tx_request) is None
+        cache.put(
+            tx_request, _create_response({"txHash": "0x01", "blockHeight": "0xb"})
+        )
+        assert cache.get(tx_request) is None
+        cache.put(
+            tx_request, _create_response({"txHash": "0x01", "blockHeight": "0xa"})
+        )
+        assert cache.get(tx_request) is not None
+
+        # Errors and mutable data are not cached
+        last_block_request = RpcRequest(Method.GET_LAST_BLOCK)
+        cache.put(last_block_request, _create_response({"height": "0xb"}))
+        assert cache.get(last_block_request) is None
+        assert len(cache) == 2
+
+    def test_queries(self):
+        cache = ResultCache(query_ttl=0.1)
+        cache.observe_height(11)
+
+        def create_request(height: int = -1) -> RpcRequest:
+            params = {"address": "hx0"}
+            if height > -1:
+                params["height"] = height
+            return RpcRequest(Method.GET_BALANCE, params)
+
+        # Pinned to a final height
+        cache.put(create_request(10), _create_response("0x1"))
+        assert cache.get(create_request(10)).result == "0x1"
+        cache.put(create_request(11), _create_response("0x2"))
+        assert cache.get(create_request(11)) is None
+
+        # Not pinned
+        cache.put(create_request(), _create_response("0x3"))
+        assert cache.get(create_request()).result == "0x3"
+        time.sleep(0.15)
+        assert cache.get(create_request()) is None
+
+        cache.put(create_request(), _create_response("0x3"))
+        cache.observe_height(12)
+        assert cache.get(create_request()) is None
+        assert cache.get(create_request(11)) is None
+        assert cache.get(create_request(10)) is not None
+        assert len(cache) == 1
+
+    def test_eviction(self):
+        cache = ResultCache(max_bytes=100)
+        requests = [
+            RpcRequest(Method.GET_DATA_BY_HASH, {"hash": f"0x{i:02x}"})
+            for i in range(3)
+        ]
+
+        for request in requests:
+            cache.put(request, _create_response("0" * 40))
+        assert len(cache) == 2
+        # Results are measured in JSON
+        assert cache.size == 84
+        assert cache.get(requests[0]) is None
+
+        # requests[1] is used recently, so requests[2] is evicted
+        assert cache.get(requests[1]) is not None
+        cache.put(requests[0], _create_response("0" * 40))
+        assert cache.get(requests[2]) is None
+        assert cache.get(requests[1]) is not None
+
+        # Too large to cache
+        cache.put(requests[2], _create_response("0" * 101))
+        assert cache.get(requests[2]) is None
+        assert cache.stats() == {
+            "entries": 2,
+            "size": 84,
+            "hits": 2,
+            "misses": 3,
+            "headHeight": None,
+        }
+
+    def test_size(self):
+        cache = ResultCache()
+        cache.observe_height(11)
+
+        # Measured in the body which carried it
+        response = _create_response({"height": "0xa"})
+        response.user_data = SimpleNamespace(content=b" " * 100)
+        cache.put(RpcRequest(Method.GET_BLOCK_BY_HEIGHT, {"height": 10}), response)
+        assert cache.size == 100
+
+        # A result which is not final is never serialized
+        tx_request = RpcRequest(Method.GET_TRANSACTION_RESULT, {"txHash": "0x01"})
+        cache.put(tx_request, _create_response({"blockHeight": "0xb", "x": object()}))
+        assert cache.get(tx_request) is None
+        assert len(cache) == 1
+
+
+class TestDiskCache(object):
+    def test_restart(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        request = RpcRequest(Method.GET_BLOCK_BY_HEIGHT, {"height": 10})
+
+        cache = ResultCache(disk=DiskCache(path))
+        cache.observe_height(11)
+        cache.put(request, _create_response({"height": "0xa"}))
+        # Not final yet
+        cache.put(
+            RpcRequest(Method.GET_BLOCK_BY_HEIGHT, {"height": 11}),
+            _create_response({"height": "0xb"}),
+        )
+        cache.disk.close()
+
+        # The head height is not known after a restart
+        cache = ResultCache(disk=DiskCache(path))
+        response = cache.get(request)
+        assert response.result == {"height": "0xa"}
+        assert cache.get(RpcRequest(Method.GET_BLOCK_BY_HEIGHT, {"height": 11})) is None
+        assert len(cache) == 1
+        assert len(cache.disk) == 1
+
+    def test_mutable_pinned(self, tmp_path):
+        cache = ResultCache(disk=DiskCache(str(tmp_path / "cache.db")))
+
+        # Pinned to a height, but not a request for immutable data
+        request = RpcRequest(Method.GET_LAST_BLOCK, {"height": 10})
+        assert cache.get(request) is None
+        assert cache.misses == 0
+        cache.disk.close()
+
+    def test_restart_transaction_result(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        request = RpcRequest(Method.GET_TRANSACTION_RESULT, {"txHash": "0x01"})
+        block_request = RpcRequest(Method.GET_BLOCK_BY_HASH, {"hash": "0x02"})
+
+        cache = ResultCache(disk=DiskCache(path))
+        cache.observe_height(11)
+        cache.put(request, _create_response({"txHash": "0x01", "blockHeight": "0xa"}))
+        cache.put(block_request, _create_response({"height": "0xa"}))
+        cache.disk.close()
+
+        cache = ResultCache(disk=DiskCache(path))
+        assert cache.get(request).result["blockHeight"] == "0xa"
+        assert cache.get(block_request).result == {"height": "0xa"}
+        assert cache.misses == 0
+
+    def test_compact(self, tmp_path):
+        disk = DiskCache(str(tmp_path / "cache.db"))
+        for i in range(10):
+            disk.put(f"{i}", "0" * 10)
+        assert disk.size == 100
+
+        disk.compact(max_bytes=35)
+        assert len(disk) == 3
+        assert [disk.get(f"{i}") for i in (6, 7, 8, 9)] == [None] + ["0" * 10] * 3
+
+    def test_threads(self, tmp_path):
+        disk = DiskCache(str(tmp_path / "cache.db"))
+
+        def put(start: int):
+            for i in range(start, start + 50):
+                disk.put(f"{i}", f"{i}")
+
+        threads = [threading.Thread(target=put, args=(i * 50,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(disk) == 200
+        disk.close()
+
+
+class TestDataStore(object):
+    def test_put(self):
+        store = DataStore(max_bytes=100)
+        data = os.urandom(40)
+        data_hash = hashlib.sha3_256(data).digest()
+
+        with pytest.raises(DataTypeException):
+            store.put(data_hash, data[1:])
+        assert store.get(data_hash) is None
+
+        store.put(data_hash, data)
+        assert store.get(data_hash) == data
+
+        # Evicted in LRU order
+        for _ in range(2):
+            other = os.urandom(40)
+            store.put(hashlib.sha3_256(other).digest(), other)
+        assert data_hash not in store
+        assert store.size == 80
+
+    def test_get_object(self):
+        store = DataStore()
+        validators = Validators(
+            tuple(Address.from_bytes(b"\x00" + os.urandom(20)) for _ in range(4))
+        )
+        data = bytes(validators)
+        data_hash = hashlib.sha3_256(data).digest()
+
+        assert store.get_object(data_hash, Validators.from_bytes) is None
+        store.put(data_hash, data)
+        decoded = store.get_object(data_hash, Validators.from_bytes)
+        assert decoded == validators
+        # Decoded only once
+        assert store.get_object(data_hash, Validators.from_bytes) is decoded
+
+    def test_client(self, json_rpc_server):
+        data = os.urandom(64)
+        data_hash = hashlib.sha3_256(data).digest()
+        blobs = {bytes_to_hex(data_hash): data}
+        requests = []
+
+        def get_data_by_hash(request):
+            requests.append(request["params"]["hash"])
+            return base64.standard_b64encode(blobs[request["params"]["hash"]]).decode()
+
+        json_rpc_server.results[Method.GET_DATA_BY_HASH] = get_data_by_hash
+        # No store unless given
+        client = Client(HTTPProvider(json_rpc_server.url))
+        assert client.data_store is None
+        assert client.get_data_by_hash(data_hash) == data
+        assert client.get_data_by_hash(data_hash) == data
+        assert len(requests) == 2
+        requests.clear()
+
+        client = Client(HTTPProvider(json_rpc_server.url), data_store=DataStore())
+        assert client.get_data_by_hash(data_hash) == data
+        assert client.get_data_by_hash(data_hash) == data
+        assert len(requests) == 1
+
+        # A blob which does not match its hash is rejected
+        wrong_hash = hashlib.sha3_256(b"wrong").digest()
+        blobs[bytes_to_hex(wrong_hash)] = data
+        with pytest.raises(DataTypeException):
+            client.get_data_by_hash(wrong_hash)
+        assert wrong_hash not in client.data_store
+
+    def test_client_too_large(self, json_rpc_server):
+        data = os.urandom(64)
+        data_hash = hashlib.sha3_256(data).digest()
+        requests = []
+
+        def get_data_by_hash(request):
+            requests.append(request["params"]["hash"])
+            return base64.standard_b64encode(data).decode()
+
+        json_rpc_server.results[Method.GET_DATA_BY_HASH] = get_data_by_hash
+        client = Client(
+            HTTPProvider(json_rpc_server.url), data_store=DataStore(max_bytes=32)
+        )
+
+        # Decoded from the blob fetched without fetching it again
+        assert client.ex._get_object_by_hash(data_hash, bytes.hex) == data.hex()
+        assert len(requests) == 1
+
+
+class TestClientCache(object):
+    def test_get_transaction(self, json_rpc_server):
+        tx_hash: bytes = os.urandom(32)
+        calls = []
+
+        def get_transaction(request):
+            calls.append(request)
+            return {"txHash": request["params"]["txHash"], "blockHeight": "0x1"}
+
+        json_rpc_server.results[Method.GET_TRANSACTION_BY_HASH] = get_transaction
+        cache = ResultCache(finality_depth=0)
+        client = Client(HTTPProvider(json_rpc_server.url), cache=cache)
+
+        results = [client.get_transaction(tx_hash) for _ in range(3)]
+        assert len(calls) == 1
+        assert results[0]["txHash"] == bytes_to_hex(tx_hash)
+        # The converted result is shared as well
+        assert results[1] is results[0]
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_raw(self, json_rpc_server):
+        calls = []
+
+        def get_data_by_hash(request):
+            calls.append(request)
+            return "0x1234"
+
+        json_rpc_server.results[Method.GET_DATA_BY_HASH] = get_data_by_hash
+        client = Client(HTTPProvider(json_rpc_server.url), cache=ResultCache())
+        params = {"hash": "0x00"}
+
+        for _ in range(2):
+            response = client.send_request(Method.GET_DATA_BY_HASH, params, raw=True)
+            assert isinstance(response, RawRpcResponse)
+        assert client.send_request(Method.GET_DATA_BY_HASH, params).result == "0x1234"
+
+        # Raw responses bypass the cache
+        assert len(calls) == 3
+        assert len(client.cache) == 1
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+import os
+import threading
+import time
+
+import pytest
+from icon.builder import Method
+from icon.client import Client
+from icon.data import RpcRequest
+from icon.exception import ArgumentException
+from icon.provider import HTTPProvider
+from icon.utils import bytes_to_hex
+from icon.utils.executor import BoundedExecutor
+
+
+class TestClientExecutor(object):
+    def test_submit(self, json_rpc_server):
+        lock = threading.Lock()
+        stats = {"in_flight": 0, "max_in_flight": 0}
+
+        def get_transaction_result(request):
+            with lock:
+                stats["in_flight"] += 1
+                stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+            time.sleep(0.005)
+            with lock:
+                stats["in_flight"] -= 1
+            return {"txHash": request["params"]["txHash"]}
+
+        json_rpc_server.results[Method.GET_TRANSACTION_RESULT] = get_transaction_result
+        client = Client(HTTPProvider(json_rpc_server.url), max_workers=4)
+
+        tx_hashes = [os.urandom(32) for _ in range(50)]
+        futures = [client.submit("get_transaction_result", h) for h in tx_hashes]
+        results = [future.result() for future in futures]
+        assert [result["txHash"] for result in results] == [
+            bytes_to_hex(h) for h in tx_hashes
+        ]
+        assert 1 < stats["max_in_flight"] <= 4
+
+        results = client.map("get_transaction_result", tx_hashes, timeout=5)
+        assert [result["txHash"] for result in results] == [
+            bytes_to_hex(h) for h in tx_hashes
+        ]
+
+        with pytest.raises(ArgumentException):
+            client.submit("_get_executor")
+        client.close()
+
+    def test_priority(self, json_rpc_server):
+        event = threading.Event()
+        order = []
+
+        def get_transaction_result(request):
+            event.wait()
+            order.append("read")
+            return {"status": "0x1"}
+
+        def send_transaction(request):
+            order.append("write")
+            return "0x" + "0" * 64
+
+        json_rpc_server.results.update(
+            {
+                Method.GET_TRANSACTION_RESULT: get_transaction_result,
+                Method.SEND_TRANSACTION: send_transaction,
+            }
+        )
+        client = Client(HTTPProvider(json_rpc_server.url), max_workers=2)
+
+        # Bulk reads use one worker at most and the other is kept for writes
+        results = client.map(
+            "get_transaction_result", [os.urandom(32) for _ in range(4)]
+        )
+        reads = threading.Thread(target=list, args=(results,))
+        reads.start()
+        time.sleep(0.1)
+
+        tx = {"nonce": "0x1", "signature": "sig"}
+        future = client.submit("send_transaction", tx)
+        assert future.result(timeout=1) == b"\x00" * 32
+        event.set()
+        reads.join()
+
+        assert order[0] == "write"
+        stats = client.executor_stats
+        assert stats["high"]["calls"] == 1
+        assert stats["low"]["calls"] == 4
+        client.close()
+
+    def test_backfill(self, json_rpc_server):
+        order = []
+        lock = threading.Lock()
+        stats = {"in_flight": 0, "max_in_flight": 0}
+
+        def get_block_by_height(request):
+            with lock:
+                stats["in_flight"] += 1
+                stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+            time.sleep(0.02)
+            with lock:
+                stats["in_flight"] -= 1
+            order.append("read")
+            return {"height": request["params"]["height"]}
+
+        def send_transaction(request):
+            order.append("write")
+            return "0x" + "0" * 64
+
+        json_rpc_server.results.update(
+            {
+                Method.GET_BLOCK_BY_HEIGHT: get_block_by_height,
+                Method.SEND_TRANSACTION: send_transaction,
+            }
+        )
+        client = Client(HTTPProvider(json_rpc_server.url), max_workers=2)
+
+        # The backfill saturates the workers which low priority calls can use
+        blocks = client.iter_blocks(0, 20, window=8)
+        next(blocks)
+
+        tx = {"nonce": "0x1", "signature": "sig"}
+        client.submit("send_transaction", tx).result(timeout=1)
+        assert len(list(blocks)) == 19
+
+        # The write does not wait for the blocks queued before it
+        assert order.index("write") < 4
+        # One worker is reserved from the backfill
+        assert stats["max_in_flight"] == 1
+        assert client.executor_stats["low"]["calls"] == 20
+        client.close()
+
+    def test_unique_ids(self):
+        with BoundedExecutor(max_workers=8, max_pending=16) as executor:
+            ids = list(
+                executor.map(
+                    lambda _: RpcRequest(Method.GET_LAST_BLOCK).id, range(1000)
+                )
+            )
+        assert len(set(ids)) == 1000
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+import os
+import time
+
+import pytest
+from icon.builder import Method
+from icon.client import Client
+from icon.confirmation import BlockCadence, is_pending
+from icon.data import RpcResponse
+from icon.exception import JSONRPCException, TimeoutException
+from icon.provider import HTTPProvider
+
+
+def _create_exception(code: int, message: str) -> JSONRPCException:
+    response = RpcResponse(
+        {"jsonrpc": "2.0", "id": 1, "error": {"code": code, "message": message}}
+    )
+    return JSONRPCException(f"{response.error}", response)
+
+
+def test_is_pending():
+    assert is_pending(_create_exception(-31002, "Pending"))
+    assert is_pending(_create_exception(-31004, "NotFound: no transaction"))
+    assert is_pending(_create_exception(-32602, "Pending transaction"))
+    assert not is_pending(_create_exception(-32602, "Invalid params hash"))
+    assert not is_pending(_create_exception(-32000, "Server error"))
+    assert not is_pending(TimeoutException("Deadline exceeded"))
+
+
+class TestBlockCadence(object):
+    def test_interval(self):
+        cadence = BlockCadence(2.0, decay=0.5)
+        assert cadence.is_stale()
+
+        cadence.observe(10, 100 * 10 ** 6, received=100.5)
+        cadence.observe(12, 102 * 10 ** 6, received=102.3)
+        assert cadence.height == 12
+        assert not cadence.is_stale()
+
+        # (2.0 + 1.0) / 2
+        assert cadence.interval == pytest.approx(1.5)
+
+        # An old block does not move the head
+        cadence.observe(11, 101 * 10 ** 6, received=104.0)
+        assert cadence.height == 12
+
+    def test_get_delay(self):
+        cadence = BlockCadence(2.0, margin=0.05)
+        assert cadence.get_delay() == pytest.approx(2.05)
+
+        # Block 10 was available 0.3 second after its timestamp
+        cadence.observe(10, 100 * 10 ** 6, received=100.3)
+        assert cadence.get_delay(now=101.0) == pytest.approx(1.35)
+        assert cadence.get_delay(now=102.5) == pytest.approx(1.85)
+
+    def test_offset_recovers(self):
+        cadence = BlockCadence(2.0, margin=0.05, decay=0.1)
+
+        # Block 10 was received 1 second before its timestamp, like with a skewed clock
+        cadence.observe(10, 100 * 10 ** 6, received=99.0)
+        for height in range(11, 41):
+            timestamp = 100 + (height - 10) * 2
+            cadence.observe(height, timestamp * 10 ** 6, received=timestamp + 0.3)
+
+        # Back close to 0.3 second after the timestamp
+        assert cadence.get_wait(41, now=160.0) == pytest.approx(2.35, abs=0.1)
+
+
+class TestGetTransactionResultWithTimeout(object):
+    @staticmethod
+    def _create_client(server) -> Client:
+        server.results[Method.GET_LAST_BLOCK] = lambda req: {
+            "height": "0x1",
+            "time_stamp": hex(int(time.time() * 10 ** 6)),
+        }
+        return Client(HTTPProvider(server.url), BlockCadence(0.2, margin=0.0))
+
+    def test_pending(self, json_rpc_server):
+        polls = []
+
+        def get_transaction_result(request):
+            polls.append(time.monotonic())
+            if len(polls) < 3:
+                raise json_rpc_server.Error(-31002, "Pending")
+            return {"status": "0x1"}
+
+        json_rpc_server.results[Method.GET_TRANSACTION_RESULT] = get_transaction_result
+        client = self._create_client(json_rpc_server)
+
+        start = time.monotonic()
+        result = client.get_transaction_result_with_timeout(os.urandom(32))
+        assert result == {"status": "0x1"}
+
+        # The first poll is sent at once and the others one block later each
+        assert polls[0] - start < 0.1
+        assert 0.1 < polls[2] - polls[1] < 0.3
+        assert client.cadence.height == 1
+
+    def test_hard_failure(self, json_rpc_server):
+        client = self._create_client(json_rpc_server)
+
+        start = time.monotonic()
+        with pytest.raises(JSONRPCException) as exc_info:
+            client.get_transaction_result_with_timeout(os.urandom(32), timeout_ms=5000)
+        assert exc_info.value.user_data.error["code"] == -32601
+        assert time.monotonic() - start < 0.5
+
+
+class TestSendTransactionsAndWait(object):
+    def test_scan_blocks(self, json_rpc_server):
+        start = time.time()
+        requests = {}
+
+        def send_transaction(request):
+            nonce = int(request["params"]["nonce"], 16)
+            if nonce == 3:
+                raise json_rpc_server.Error(-32600, "Invalid request")
+            return f"0x{nonce:064x}"
+
+        def get_block_by_height(request):
+            height = int(request["params"]["height"], 16)
+            # Blocks are produced every 0.1 second from the start
+            if start + (height - 10) * 0.1 > time.time():
+                raise json_rpc_server.Error(-31004, "NotFound")
+
+            # Transactions except the last one are included in block 11 and 12
+            txs = {11: [0, 1], 12: [2, 4, 5, 6, 7, 8]}.get(height, [])
+            return {
+                "height": hex(height),
+                "time_stamp": hex(int((start + (height - 10) * 0.1) * 10 ** 6)),
+                "confirmed_transaction_list": [{"txHash": f"0x{i:064x}"} for i in txs],
+            }
+
+        def get_transaction_result(request):
+            requests.setdefault("results", []).append(request["params"]["txHash"])
+            return {"txHash": request["params"]["txHash"], "status": "0x1"}
+
+        json_rpc_server.results.update(
+            {
+                Method.GET_LAST_BLOCK: lambda req: get_block_by_height(
+                    {"params": {"height": "0xa"}}
+                ),
+                Method.SEND_TRANSACTION: send_transaction,
+                Method.GET_BLOCK_BY_HEIGHT: get_block_by_height,
+                Method.GET_TRANSACTION_RESULT: get_transaction_result,
+            }
+        )
+
+        client = Client(HTTPProvider(json_rpc_server.url), BlockCadence(0.1))
+        txs = [{"nonce": hex(i), "signature": "sig"} for i in range(10)]
+        items = client.send_transactions_and_wait(txs, batch_size=4, timeout_ms=500)
+
+        assert len(items) == 10
+        for i in (0, 1, 2, 4, 5, 6, 7, 8):
+            assert items[i].result["txHash"] == f"0x{i:064x}"
+        with pytest.raises(JSONRPCException):
+            items[3].result
+        with pytest.raises(TimeoutException):
+            items[9].result
+
+        # Only the results of transactions found in blocks are requested
+        assert len(requests["results"]) == 8
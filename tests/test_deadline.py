@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+import icon
+import pytest
+from icon.builder import Method
+from icon.exception import TimeoutException
+from icon.provider import HTTPProvider
+from icon.utils.deadline import get_deadline, get_timeout, with_deadline
+
+
+class TestDeadline(object):
+    def test_get_deadline(self):
+        assert get_deadline({}) is None
+
+        now = time.monotonic()
+        assert get_deadline({"deadline": now}) == now
+        assert get_deadline({"deadline": now + 100, "timeout": 1}) < now + 2
+        assert get_deadline({"deadline": now, "timeout": 1}) == now
+
+    def test_with_deadline(self):
+        kwargs = {"timeout": 1, "height": 10}
+        ret = with_deadline(kwargs)
+        assert "timeout" not in ret
+        assert ret["height"] == 10
+        assert ret["deadline"] > time.monotonic()
+        assert kwargs == {"timeout": 1, "height": 10}
+
+        kwargs = {"height": 10}
+        assert with_deadline(kwargs) is kwargs
+
+    def test_get_timeout(self):
+        assert get_timeout(None) is None
+        assert 0 < get_timeout(time.monotonic() + 1) <= 1
+
+        with pytest.raises(TimeoutException):
+            get_timeout(time.monotonic())
+
+    def test_batch_deadline(self, json_rpc_server):
+        def get_total_supply(request):
+            time.sleep(0.2)
+            return "0x1"
+
+        json_rpc_server.results[Method.GET_TOTAL_SUPPLY] = get_total_supply
+        client = icon.Client(HTTPProvider(json_rpc_server.url))
+
+        # All chunks of a batch share one deadline
+        start = time.monotonic()
+        batch = client.batch(max_size=1, timeout=0.3)
+        items = [batch.get_total_supply() for _ in range(3)]
+        batch.execute()
+        assert time.monotonic() - start < 0.5
+
+        assert items[0].result == 1
+        for item in items[1:]:
+            assert isinstance(item.exception, TimeoutException)
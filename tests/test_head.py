@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import time
+
+import pytest
+from icon.builder import Method
+from icon.client import Client
+from icon.confirmation import BlockCadence
+from icon.exception import TimeoutException
+from icon.provider import HTTPProvider
+
+
+class TestHeadTracker(object):
+    @staticmethod
+    def _create_client(server) -> Client:
+        start = time.time()
+        polls = []
+
+        def get_last_block(request):
+            # A new block is produced every 0.1 second
+            height = int((time.time() - start) / 0.1)
+            polls.append(height)
+            return {
+                "height": hex(height),
+                "block_hash": f"0x{height:064x}",
+                "time_stamp": hex(int((start + height * 0.1) * 10 ** 6)),
+            }
+
+        server.results[Method.GET_LAST_BLOCK] = get_last_block
+        client = Client(HTTPProvider(server.url), BlockCadence(0.1, margin=0.01))
+        client.polls = polls
+        return client
+
+    def test_wait_for_height(self, json_rpc_server):
+        client = self._create_client(json_rpc_server)
+        head = client.head
+        heads = []
+        head.subscribe(heads.append, blocking=True)
+
+        waiters = []
+
+        def wait():
+            waiters.append(head.wait_for_height(3, timeout=1))
+
+        threads = [threading.Thread(target=wait) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(waiters) == 4
+        assert all(height >= 3 for height in waiters)
+        assert head.block_hash == f"{head.height:064x}"
+        # One poll per block serves all waiters
+        assert len(client.polls) <= head.height + 2
+        assert [int(block["height"], 16) for block in heads][-1] == head.height
+
+        with pytest.raises(TimeoutException):
+            head.wait_for_height(1000, timeout=0.1)
+        client.close()
+        assert not head.running
+
+    def test_async_wait_for_height(self, json_rpc_server):
+        client = self._create_client(json_rpc_server)
+
+        async def main():
+            return await asyncio.gather(
+                client.head.async_wait_for_height(2, timeout=1),
+                client.head.async_wait_for_height(3, timeout=1),
+            )
+
+        heights = asyncio.run(main())
+        assert heights[0] >= 2 and heights[1] >= 3
+
+        # The head saves a request for the last block
+        polls = len(client.polls)
+        assert client._get_head_height() == client.head.height
+        assert len(client.polls) == polls
+        client.close()
+
+    def test_last_block_from_head(self, json_rpc_server):
+        client = self._create_client(json_rpc_server)
+        statuses = []
+        json_rpc_server.results[Method.GET_STATUS] = lambda req: statuses.append(req)
+        client.head.wait_for_height(2, timeout=1)
+
+        # Served by the running head tracker without a request
+        block = client.get_last_block()
+        status = client.get_status()
+        assert len(json_rpc_server.paths) <= client.head.polls
+        assert not statuses
+
+        assert int(block["height"], 16) >= 2
+        assert int(status["lastBlock"]["blockHeight"], 16) >= 2
+        assert status["lastBlock"]["blockHash"].startswith("0x")
+
+        # A raw response is always requested
+        client.get_status(raw=True)
+        assert len(statuses) == 1
+        client.close()
+
+    def test_observe_block(self, json_rpc_server):
+        client = Client(HTTPProvider(json_rpc_server.url))
+        head = client.head
+
+        head.observe_block({"height": "0x5", "block_hash": "0x" + "a" * 64})
+        head.observe_block({"height": "0x4", "block_hash": "0x" + "b" * 64})
+        assert head.height == 5
+        assert head.block_hash == "a" * 64
+        assert not head.running
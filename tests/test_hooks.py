@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+
+import pytest
+from icon.builder import Method
+from icon.client import Client
+from icon.exception import HookException
+from icon.hooks import Hooks
+from icon.provider import HTTPProvider
+
+
+class TestHooks(object):
+    def test_dispatch(self):
+        hooks = Hooks()
+        assert not hooks
+        assert hooks.dispatch("request", 1)
+
+        calls = []
+        hooks.add("request", lambda data: calls.append(("a", data)))
+        hooks.add("request", lambda data: data != 2)
+        hooks.add("request", lambda data: calls.append(("c", data)))
+        assert hooks
+
+        assert hooks.dispatch("request", 1)
+        assert not hooks.dispatch("request", 2)
+        assert hooks.dispatch("response", 3)
+        assert calls == [("a", 1), ("c", 1), ("a", 2)]
+
+        hooks.clear()
+        assert not hooks
+
+    def test_non_blocking(self):
+        hooks = Hooks()
+        event = threading.Event()
+        threads = []
+
+        def hook(data):
+            event.wait(1)
+            threads.append(threading.current_thread())
+
+        def failing_hook(data):
+            raise ValueError(data)
+
+        hooks.add("response", hook, blocking=False)
+        hooks.add("response", failing_hook, blocking=False)
+
+        # Not blocked by the hook waiting for the event
+        assert hooks.dispatch("response", 1)
+        assert not threads
+        event.set()
+        hooks.close()
+
+        assert threads[0] is not threading.current_thread()
+        assert hooks.failures == 1
+
+    def test_max_pending(self):
+        hooks = Hooks(max_pending=2)
+        event = threading.Event()
+        calls = []
+
+        def hook(data):
+            event.wait(1)
+            calls.append(data)
+
+        hooks.add("response", hook, blocking=False)
+        for i in range(5):
+            assert hooks.dispatch("response", i)
+        event.set()
+        hooks.close()
+
+        assert calls == [0, 1]
+        assert hooks.dropped == 3
+
+        # Dispatched again once the background thread catches up
+        hooks.dispatch("response", 5)
+        hooks.close()
+        assert calls == [0, 1, 5]
+
+    def test_async(self):
+        hooks = Hooks()
+        calls = []
+
+        async def hook(data):
+            await asyncio.sleep(0)
+            calls.append(data)
+
+        hooks.add("request", hook, blocking=True)
+
+        async def main():
+            hooks.dispatch("request", 1)
+            assert calls == []
+            await asyncio.sleep(0.01)
+
+        asyncio.run(main())
+
+        # Without a running event loop
+        hooks.dispatch("request", 2)
+        hooks.close()
+        assert calls == [1, 2]
+
+
+class TestClientHooks(object):
+    def test_registered_hooks(self, json_rpc_server):
+        json_rpc_server.results[Method.GET_TOTAL_SUPPLY] = lambda req: "0x1"
+        client = Client(HTTPProvider(json_rpc_server.url))
+        calls = []
+
+        client.hooks.add("request", lambda request: calls.append(request.method))
+        client.hooks.add("response", lambda response: calls.append(response.result))
+        assert client.get_total_supply() == 1
+        assert calls == [Method.GET_TOTAL_SUPPLY, "0x1"]
+
+        # Registered hooks run before the ones in kwargs
+        hooks = {"request": lambda request: calls.append("kwargs")}
+        client.get_total_supply(hooks=hooks)
+        assert calls[2:4] == [Method.GET_TOTAL_SUPPLY, "kwargs"]
+
+        client.hooks.add("request", lambda request: False)
+        with pytest.raises(HookException):
+            client.get_total_supply()
+        client.close()
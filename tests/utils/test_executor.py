@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from concurrent.futures import wait
+
+import pytest
+from icon.exception import ArgumentException
+from icon.utils.executor import BoundedExecutor, Priority
+
+
+class TestBoundedExecutor(object):
+    def test_backpressure(self):
+        event = threading.Event()
+        submitted = []
+
+        with BoundedExecutor(max_workers=2, max_pending=4) as executor:
+
+            def submit():
+                for i in range(6):
+                    executor.submit(event.wait)
+                    submitted.append(i)
+
+            thread = threading.Thread(target=submit)
+            thread.start()
+            time.sleep(0.1)
+
+            # Blocked until pending calls are done
+            assert len(submitted) == 4
+            event.set()
+            thread.join()
+            assert len(submitted) == 6
+
+    def test_map(self):
+        in_flight = []
+        lock = threading.Lock()
+
+        def func(i: int) -> int:
+            with lock:
+                in_flight.append(i)
+            time.sleep(0.001)
+            return i * 2
+
+        with BoundedExecutor(max_workers=4, max_pending=8) as executor:
+            results = executor.map(func, range(100))
+            assert next(results) == 0
+            # Calls are not submitted far ahead of the caller
+            assert len(in_flight) <= 9
+            assert list(results) == [i * 2 for i in range(1, 100)]
+
+    def test_wake_idle_workers(self):
+        with BoundedExecutor(max_workers=4, max_pending=8) as executor:
+            # One idle worker
+            executor.submit(lambda: None).result()
+            time.sleep(0.05)
+
+            # Each call gets a worker, even before the idle one wakes up
+            barrier = threading.Barrier(4)
+            futures = [executor.submit(barrier.wait, 1.0) for _ in range(4)]
+            for future in futures:
+                future.result()
+
+    def test_drop_cancelled(self):
+        event = threading.Event()
+        calls = []
+
+        with BoundedExecutor(max_workers=1, max_pending=4) as executor:
+            executor.submit(event.wait)
+            futures = [executor.submit(calls.append, i) for i in range(3)]
+            assert futures[1].cancel()
+
+            event.set()
+            done, not_done = wait(futures, timeout=1.0)
+            assert not not_done
+            assert futures[1].cancelled()
+
+        assert calls == [0, 2]
+        # The cancelled call is dropped without taking a worker
+        assert executor.stats.to_dict()["normal"]["acquired"] == 3
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ArgumentException):
+            BoundedExecutor(max_workers=4, max_pending=2)
+
+
+class TestPriority(object):
+    def test_high_first(self):
+        event = threading.Event()
+        order = []
+
+        with BoundedExecutor(max_workers=1, max_pending=8) as executor:
+            executor.submit(event.wait)
+            time.sleep(0.05)
+
+            for i in range(3):
+                executor.submit_with_priority(Priority.LOW, order.append, f"low{i}")
+            executor.submit(order.append, "normal")
+            executor.submit_with_priority(Priority.HIGH, order.append, "high")
+            event.set()
+
+        assert order == ["high", "normal", "low0", "low1", "low2"]
+
+    def test_reserved(self):
+        event = threading.Event()
+
+        with BoundedExecutor(max_workers=2, max_pending=4, reserved=1) as executor:
+            futures = [
+                executor.submit_with_priority(Priority.LOW, event.wait)
+                for _ in range(2)
+            ]
+            time.sleep(0.05)
+            # One worker is kept from low priority calls
+            assert [future.running() for future in futures] == [True, False]
+
+            # A low queue at max_pending does not block other priorities
+            futures += [
+                executor.submit_with_priority(Priority.LOW, event.wait)
+                for _ in range(2)
+            ]
+            assert executor.submit_with_priority(Priority.HIGH, lambda: 1).result() == 1
+            event.set()
+
+        stats = executor.stats.to_dict()
+        assert stats["low"]["calls"] == 4
+        assert stats["high"]["calls"] == 1
+        assert stats["high"]["maxWaitTime"] < 0.05
+
+        with pytest.raises(ArgumentException):
+            BoundedExecutor(max_workers=2, max_pending=4, reserved=2)